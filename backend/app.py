@@ -16,11 +16,11 @@ backend_dir = Path(__file__).parent
 if str(backend_dir) not in sys.path:
     sys.path.insert(0, str(backend_dir))
 
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, g, jsonify, redirect, request, send_from_directory
 from flask_cors import CORS
-import schedule
-import time
 import threading
+import time
+from urllib.parse import urlencode, urlsplit
 
 # import 시도 (절대 import 먼저, 실패 시 상대 import)
 try:
@@ -28,15 +28,59 @@ try:
     from backend.config import Config
     from backend.utils import generate_content_hash
     from backend.blacklist_store import get_blacklist, add_to_blacklist, remove_from_blacklist
+    from backend.result_store import save_result, load_result, load_results, stored_keywords
+    from backend.http_cache import conditional_json, combine_versions, snapshot_response
+    from backend.content_cache import ContentCache
+    from backend.collection_queue import CollectionQueue
+    from backend.refresh_scheduler import RefreshScheduler
+    from backend.content_index import CONTENT_TYPES, query_contents, project
+    from backend.utils import parse_published_at
+    from backend.update_broker import UpdateBroker
+    from backend.stream_server import StreamServer, parse_seq, parse_timeout
+    from backend.single_flight import SingleFlight
+    from backend.quota import quota_manager
+    from backend.metrics import registry, record_stage, HTTP_REQUEST_SECONDS
+    from backend.profiler import profiler
+    from backend.log import get_logger, get_level, set_level
 except ImportError:
     from data_collector import DataCollector
     from config import Config
     from utils import generate_content_hash
     from blacklist_store import get_blacklist, add_to_blacklist, remove_from_blacklist
+    from result_store import save_result, load_result, load_results, stored_keywords
+    from http_cache import conditional_json, combine_versions, snapshot_response
+    from content_cache import ContentCache
+    from collection_queue import CollectionQueue
+    from refresh_scheduler import RefreshScheduler
+    from content_index import CONTENT_TYPES, query_contents, project
+    from utils import parse_published_at
+    from update_broker import UpdateBroker
+    from stream_server import StreamServer, parse_seq, parse_timeout
+    from single_flight import SingleFlight
+    from quota import quota_manager
+    from metrics import registry, record_stage, HTTP_REQUEST_SECONDS
+    from profiler import profiler
+    from log import get_logger, get_level, set_level
+
+log = get_logger('api')
 
 app = Flask(__name__, static_folder='../frontend', static_url_path='')
 CORS(app)
 
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def record_request_latency(response):
+    """라우트별 응답 시간 기록 (스트리밍 응답은 첫 응답을 만들 때까지)"""
+    started = g.pop('request_started', None)
+    if started is not None and Config.METRICS_ENABLED:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started,
+                                     route=route, method=request.method, status=response.status_code)
+    return response
+
 # 정적 파일 서빙
 @app.route('/styles.css')
 def styles():
@@ -52,67 +96,380 @@ Config.print_api_status()
 # 데이터 수집기 인스턴스
 collector = DataCollector()
 
-# 캐시된 데이터
-cached_data = {}
+# 캐시된 데이터 (저장소에 남아 있는 유효 기간 내 결과로 시작하여 재시작 직후에도 즉시 제공)
+RESULT_MAX_AGE_SECONDS = Config.DATA_VALID_HOURS * 3600
 
-# 추적 중인 키워드 (기본값은 Config에서 가져옴, 정규화)
-try:
-    from backend.keyword_mapper import normalize_keyword
-except ImportError:
-    from keyword_mapper import normalize_keyword
+# /api/content 페이지네이션/필터 파라미터
+CONTENT_QUERY_PARAMS = ('limit', 'cursor', 'fields', 'type', 'since')
 
-# 기본 키워드를 정규화
-tracked_keywords = [normalize_keyword(kw) for kw in Config.DEFAULT_KEYWORDS]
+# 키워드별 수집 결과와 미리 직렬화된 응답 스냅샷 (변경할 때마다 새 상태로 통째로 교체)
+content_cache = ContentCache()
 
-def collect_and_cache(keywords):
-    """데이터 수집 및 캐시 업데이트"""
-    global cached_data
-    print(f"데이터 수집 시작: {keywords}")
-    
+# 키워드별 수집 결과 변경분을 SSE/롱폴링 클라이언트에 전달하는 브로커
+update_broker = UpdateBroker(max_events=Config.UPDATE_EVENT_BUFFER)
+
+# SSE/롱폴링 연결을 연결마다 스레드를 두지 않고 이벤트 루프 스레드 하나에서 처리하는 스트림 서버
+stream_server = StreamServer(
+    update_broker,
+    max_clients=Config.MAX_STREAM_CLIENTS,
+    heartbeat_seconds=Config.STREAM_HEARTBEAT_SECONDS,
+    long_poll_max_seconds=Config.LONG_POLL_MAX_SECONDS
+)
+if Config.STREAM_PORT:
+    stream_server.start(Config.STREAM_HOST, Config.STREAM_PORT)
+
+# 캐시에 없는 키워드의 실시간 수집을 정규화된 키워드별로 하나만 실행
+on_demand_flight = SingleFlight()
+
+# 저장소에 남아 있는 키워드와 수집 시각만 먼저 읽고, 결과는 키워드를 처음 읽을 때 로드
+stored_collected_at = {}
+if Config.RESULT_STORE_ENABLED:
     try:
-        results = collector.collect_multiple_keywords(keywords)
-        cached_data = results
-        print(f"데이터 수집 완료: 총 {sum(r['total_count'] for r in results.values())}개 콘텐츠")
+        stored_collected_at = stored_keywords(max_age_seconds=RESULT_MAX_AGE_SECONDS)
+        log.info("저장된 수집 결과 확인", keywords=len(stored_collected_at))
     except Exception as e:
-        print(f"데이터 수집 중 오류: {e}")
+        log.warning("저장된 수집 결과 확인 실패", error=e)
 
-def scheduled_update():
-    """스케줄된 업데이트 실행"""
-    global tracked_keywords
-    collect_and_cache(tracked_keywords)
+# 아직 캐시에 올리지 않은 저장된 키워드
+unloaded_stored_keys = set(stored_collected_at)
+stored_load_lock = threading.Lock()
 
-# 스케줄러 설정
-schedule.every(Config.UPDATE_INTERVAL).minutes.do(scheduled_update)
+def load_stored_results(keys=None):
+    """
+    저장된 수집 결과 중 아직 캐시에 올리지 않은 키워드를 로드하여 캐시에 반영
+    (이미 수집되어 캐시에 있는 키워드는 저장된 결과로 덮어쓰지 않음)
+    
+    Args:
+        keys: 로드할 캐시 키 목록 (없으면 남은 키워드 전체)
+    
+    Returns:
+        dict: 이번에 로드한 키워드별 수집 결과
+    """
+    if not unloaded_stored_keys:
+        return {}
+    with stored_load_lock:
+        wanted = [key for key in (list(unloaded_stored_keys) if keys is None else keys) if key in unloaded_stored_keys]
+        if not wanted:
+            return {}
+        unloaded_stored_keys.difference_update(wanted)
+        try:
+            loaded = load_results(max_age_seconds=RESULT_MAX_AGE_SECONDS, keywords=wanted)
+        except Exception as e:
+            log.warning("저장된 수집 결과 로드 실패", keywords=wanted, error=e)
+            return {}
+        data = content_cache.state.data
+        loaded = {key: result for key, result in loaded.items() if key not in data}
+        if loaded:
+            collector.remember_results(loaded)
+            content_cache.merge(loaded)
+            log.info("저장된 수집 결과 로드", keywords=list(loaded))
+        return loaded
 
-def run_scheduler():
-    """스케줄러 실행 (별도 스레드)"""
-    while True:
-        schedule.run_pending()
-        time.sleep(60)  # 1분마다 체크
+# 추적 중인 키워드 (기본값은 Config에서 가져옴, 정규화)
+try:
+    from backend.keyword_mapper import canonical_keyword, normalize_keyword
+except ImportError:
+    from keyword_mapper import canonical_keyword, normalize_keyword
 
-# 스케줄러 스레드 시작
-scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
-scheduler_thread.start()
+# 기본 키워드를 정규화
+tracked_keywords = [normalize_keyword(kw) for kw in Config.DEFAULT_KEYWORDS]
 
-# 초기 데이터 수집 (별도 스레드에서 실행하여 서버 시작을 블로킹하지 않음)
-def initial_data_collection():
-    """초기 데이터 수집 (별도 스레드)"""
-    global tracked_keywords
-    print("초기 데이터 수집 중...")
+def persist_result(keyword, result):
+    """수집 결과를 영구 저장소에 기록"""
+    if not Config.RESULT_STORE_ENABLED:
+        return
     try:
-        collect_and_cache(tracked_keywords)
+        save_result(keyword, result)
     except Exception as e:
-        print(f"초기 데이터 수집 실패 (서버는 계속 실행됩니다): {e}")
-        print("API 키가 설정되지 않았을 수 있습니다. .env 파일을 확인하세요.")
-
-initial_collection_thread = threading.Thread(target=initial_data_collection, daemon=True)
-initial_collection_thread.start()
+        log.warning("수집 결과 저장 실패", keyword=keyword, error=e)
+
+def is_stale(keyword_obj):
+    """캐시된 결과가 없거나 UPDATE_INTERVAL보다 오래되었는지 확인"""
+    key = collector.keyword_key(keyword_obj)
+    load_stored_results([key])
+    result = content_cache.state.data.get(key)
+    if not result:
+        return True
+    return time.time() - result.get('collected_at', 0) >= Config.UPDATE_INTERVAL * 60
+
+def publish_keyword_update(key, previous, result):
+    """
+    키워드 수집 결과의 변경분(추가/변경/제거된 콘텐츠)을 클라이언트에 발행
+    (같은 수집에서 영상 통계나 태그가 나중에 반영되면 변경된 항목만 updated로 다시 보냄)
+    
+    Args:
+        key: 캐시 키 (키워드 표시명)
+        previous: 같은 키워드의 캐시된 이전 결과 (StoredResult, 없으면 None)
+        result: 새 수집 결과
+    """
+    contents = result.get('contents', [])
+    previous_records = {record.content_id: record for record in previous.records} if previous else {}
+    current_ids = {c.get('content_id') for c in contents}
+    
+    update = {field: value for field, value in result.items() if field != 'contents'}
+    update['key'] = key
+    update['added'] = []
+    update['updated'] = []
+    for content in contents:
+        record = previous_records.get(content.get('content_id'))
+        if record is None:
+            update['added'].append(content)
+        elif not record.matches(content):
+            update['updated'].append(content)
+    update['removed'] = sorted(set(previous_records) - current_ids)
+    update_broker.publish('keyword', update)
+
+def collect_and_cache(keywords, only_stale=False, job_id=None, prune=True):
+    """
+    데이터 수집 및 캐시 업데이트
+    키워드 하나의 수집이 끝날 때마다 캐시에 반영하고 변경분을 발행하며,
+    전체 수집이 끝나면 collection_done 이벤트를 발행합니다.
+    
+    Args:
+        keywords: 수집할 키워드 리스트
+        only_stale: True이면 캐시된 결과가 오래된 키워드만 수집하고 나머지는 유지
+        job_id: collection_done 이벤트에 담을 요청 식별자 (선택사항)
+        prune: True이면 keywords에서 빠진 키워드를 캐시에서 제거
+    """
+    done = {'job_id': job_id, 'keywords': [], 'removed_keywords': [], 'error': None}
+    if only_stale:
+        fresh_keys = [collector.keyword_key(kw) for kw in keywords if not is_stale(kw)]
+        keywords = [kw for kw in keywords if is_stale(kw)]
+        if fresh_keys:
+            log.info("저장된 결과 사용 (수집 생략)", keywords=fresh_keys)
+        if not keywords:
+            update_broker.publish('collection_done', done)
+            return
+    
+    log.info("데이터 수집 시작", keywords=[collector.keyword_key(kw) for kw in keywords], job_id=job_id)
+    started = time.perf_counter()
+    # 증분 수집에 쓸 이전 결과 로드 (정리할 때는 빠진 키워드를 찾기 위해 전체 로드)
+    load_stored_results(None if prune and not only_stale else [collector.keyword_key(kw) for kw in keywords])
+    start_state = content_cache.state
+    
+    def on_keyword_collected(key, result):
+        persist_result(key, result)
+        previous_state = content_cache.merge({key: result})
+        publish_keyword_update(key, previous_state.data.get(key), result)
+        refresh_scheduler.record_collection(key, result.get('new_count', 0), result.get('collected_at'))
+    
+    try:
+        # 이전 결과를 넘겨 새로 게시된 항목만 수집하여 병합 (증분 수집)
+        results = collector.collect_multiple_keywords(
+            keywords, previous=start_state.data, on_result=on_keyword_collected
+        )
+        done['keywords'] = list(results)
+        if prune and not only_stale:
+            # 수집 시작 시점에 있었지만 이번 수집 대상에서 빠진 키워드만 제거 (수집 중 추가된 키워드는 유지)
+            done['removed_keywords'] = [key for key in start_state.data if key not in results]
+            if done['removed_keywords']:
+                content_cache.merge({}, remove=done['removed_keywords'])
+        log.info("데이터 수집 완료", job_id=job_id, keywords=len(results),
+                 contents=sum(r['total_count'] for r in results.values()),
+                 duration_ms=round((time.perf_counter() - started) * 1000))
+    except Exception as e:
+        done['error'] = str(e)
+        log.error("데이터 수집 중 오류", job_id=job_id, error=e)
+    update_broker.publish('collection_done', done)
+
+def run_collection_job(job):
+    """수집 작업 큐의 작업 실행"""
+    started = time.perf_counter()
+    collect_and_cache(job.keywords, only_stale=job.only_stale, job_id=job.job_id, prune=job.prune)
+    record_stage('collection_job', started, items_in=len(job.keywords))
+
+# 수집 작업 큐 (작업 스레드 하나에서 순서대로 실행, 몰린 갱신 요청은 하나로 합침)
+collection_queue = CollectionQueue(run_collection_job, key=collector.keyword_key)
+
+def scheduled_update(keywords):
+    """갱신 시각이 도래한 키워드만 수집 (다른 키워드의 캐시는 유지)"""
+    collection_queue.submit(keywords, prune=False)
+
+# 키워드별 적응형 갱신 스케줄러 (저장된 결과의 수집 시각부터 일정 시작)
+refresh_scheduler = RefreshScheduler(scheduled_update, key=collector.keyword_key)
+refresh_scheduler.set_keywords(
+    tracked_keywords,
+    collected_at=stored_collected_at
+)
+refresh_scheduler.start()
+
+# 초기 데이터 수집 (작업 큐에서 실행하여 서버 시작을 블로킹하지 않음)
+# 저장된 결과가 UPDATE_INTERVAL 이내인 키워드는 다시 수집하지 않음
+log.info("초기 데이터 수집 작업 등록")
+collection_queue.submit(tracked_keywords, only_stale=True, prune=False)
 
 @app.route('/')
 def index():
     """메인 페이지"""
     return send_from_directory('../frontend', 'index.html')
 
+def parse_content_query(args):
+    """
+    /api/content의 페이지네이션/필터 파라미터 파싱
+    
+    Args:
+        args: 요청 쿼리 파라미터
+    
+    Returns:
+        dict: offset, limit, fields, content_type, since
+    
+    Raises:
+        ValueError: 파라미터 형식이 잘못된 경우
+    """
+    query = {'offset': 0, 'limit': None, 'fields': None, 'content_type': None, 'since': None}
+    
+    if args.get('limit'):
+        try:
+            query['limit'] = int(args['limit'])
+        except ValueError:
+            raise ValueError('limit은 정수여야 합니다')
+        if not 1 <= query['limit'] <= Config.CONTENT_PAGE_MAX_LIMIT:
+            raise ValueError(f'limit은 1~{Config.CONTENT_PAGE_MAX_LIMIT} 사이여야 합니다')
+    
+    if args.get('cursor'):
+        try:
+            query['offset'] = int(args['cursor'])
+        except ValueError:
+            raise ValueError('cursor 값이 올바르지 않습니다')
+        if query['offset'] < 0:
+            raise ValueError('cursor 값이 올바르지 않습니다')
+    
+    if args.get('fields'):
+        query['fields'] = [field.strip() for field in args['fields'].split(',') if field.strip()]
+    
+    if args.get('type'):
+        if args['type'] not in CONTENT_TYPES:
+            raise ValueError(f"type은 {', '.join(CONTENT_TYPES)} 중 하나여야 합니다")
+        query['content_type'] = args['type']
+    
+    if args.get('since'):
+        try:
+            query['since'] = float(args['since'])
+        except ValueError:
+            since = parse_published_at(args['since'])
+            if since is None:
+                raise ValueError('since는 epoch 초 또는 ISO 형식이어야 합니다')
+            query['since'] = since.timestamp()
+    
+    return query
+
+def content_query_response(state, keys, query):
+    """
+    키워드 인덱스에서 페이지/필터/필드 선택을 적용한 응답 생성
+    
+    Args:
+        state: 조회할 캐시 상태 (CacheState)
+        keys: 조회할 키워드 리스트
+        query: parse_content_query 결과
+    """
+    current = state.snapshots
+    page, total, next_cursor = query_contents(
+        [current.indexes[key] for key in keys],
+        content_type=query['content_type'],
+        since=query['since'],
+        offset=query['offset'],
+        limit=query['limit']
+    )
+    
+    payload = {
+        'total_count': total,
+        'count': len(page),
+        'next_cursor': next_cursor,
+        'contents': project(page, query['fields'])
+    }
+    if len(keys) == 1:
+        result = state.data.get(keys[0], {})
+        payload.update({
+            'keyword': result.get('keyword', keys[0]),
+            'keyword_en': result.get('keyword_en', ''),
+            'keyword_ko': result.get('keyword_ko', '')
+        })
+    
+    versions = [(key, current.keywords[key].etag) for key in keys]
+    versions.append(('query', request.query_string.decode('utf-8')))
+    last_modified = max((current.keywords[key].last_modified or 0 for key in keys), default=0) or None
+    return conditional_json(payload, combine_versions(versions), last_modified)
+
+def matching_keyword(keyword, keys):
+    """
+    keys 중 keyword와 같은 키워드의 키 (대소문자나 한글/영문 표기만 다른 키 포함)
+    
+    Args:
+        keyword: 요청한 키워드
+        keys: 찾을 캐시 키 모음
+    
+    Returns:
+        str: 일치하는 키 (없으면 None)
+    """
+    if keyword in keys:
+        return keyword
+    canonical = canonical_keyword(keyword)
+    return next((key for key in tuple(keys) if canonical_keyword(key) == canonical), None)
+
+def cache_collected(keyword, result):
+    """실시간 수집 결과를 요청한 키워드로 캐시에 등록 (같은 결과가 이미 등록되어 있으면 생략)"""
+    cached = content_cache.state.data.get(keyword)
+    if (cached is None or cached.get('version') != result.get('version')
+            or cached.get('collected_at') != result.get('collected_at')):
+        content_cache.merge({keyword: result})
+
+def run_on_demand_collection(keyword):
+    """키워드 하나를 실시간 수집하여 캐시/저장소에 반영하고 변경분을 발행"""
+    log.info("실시간 수집 시작", keyword=keyword)
+    started = time.perf_counter()
+    result = collector.collect_all(keyword)
+    cache_collected(keyword, result)
+    persist_result(keyword, result)
+    publish_keyword_update(keyword, None, result)
+    log.info("실시간 수집 완료", keyword=keyword, contents=result.get('total_count', 0),
+             duration_ms=round((time.perf_counter() - started) * 1000))
+    return result
+
+def parse_wait(value):
+    """wait 파라미터 해석 (없으면 Config.ON_DEMAND_WAIT)"""
+    if value in (None, ''):
+        return Config.ON_DEMAND_WAIT
+    return value.lower() not in ('0', 'false', 'no')
+
+def collect_on_demand(keyword, wait):
+    """
+    캐시에 없는 키워드 실시간 수집
+    같은 정규화 키워드에 대한 동시 요청은 하나의 수집을 공유합니다.
+    
+    Args:
+        keyword: 요청한 키워드
+        wait: True이면 수집이 끝날 때까지 대기
+    
+    Returns:
+        Response: 기다리지 않고 수집 중인 경우 202 응답, 결과가 캐시에 반영되었으면 None
+    """
+    # 'bts'와 'BTS'처럼 표기만 다른 동시 요청도 하나의 수집을 공유
+    flight_key = canonical_keyword(keyword)
+    if wait:
+        result = on_demand_flight.do(flight_key, run_on_demand_collection, keyword)
+        # 같은 수집을 다른 표기(예: 한글명)로 기다린 요청은 자신의 키워드로도 등록
+        cache_collected(keyword, result)
+        return None
+    
+    def on_done(future):
+        if future.exception() is None:
+            cache_collected(keyword, future.result())
+    
+    future = on_demand_flight.start(flight_key, run_on_demand_collection, keyword)
+    future.add_done_callback(on_done)
+    if future.done() and future.exception() is None:
+        return None
+    
+    # 수집이 끝나면 /api/stream의 keyword 이벤트로 결과가 전달됨
+    stale = load_result(keyword) if Config.RESULT_STORE_ENABLED else None
+    payload = stale or {'keyword': keyword, 'total_count': 0, 'contents': []}
+    payload = {**payload, 'status': 'collecting', 'stale': stale is not None}
+    log.info("실시간 수집 진행 중 (202 반환)", keyword=keyword, stale=stale is not None)
+    response = jsonify(payload)
+    response.status_code = 202
+    response.headers['Retry-After'] = '2'
+    return response
+
 @app.route('/api/content', methods=['GET'])
 def get_content():
     """
@@ -120,47 +477,185 @@ def get_content():
     
     Query Parameters:
         keyword: 검색 키워드 (선택사항, 없으면 모든 키워드 반환)
+        limit: 페이지 크기 (선택사항)
+        cursor: 이전 응답의 next_cursor (선택사항)
+        fields: 반환할 콘텐츠 필드, 쉼표로 구분 (선택사항)
+        type: video 또는 news (선택사항)
+        since: 이 시각 이후 게시된 콘텐츠만, epoch 초 또는 ISO 형식 (선택사항)
+        wait: 캐시에 없는 키워드를 수집할 때 완료까지 기다릴지 여부 (선택사항, 기본값 ON_DEMAND_WAIT)
+    
+    페이지/필터 파라미터가 있으면 최신순 contents 일부와 next_cursor를 반환하며,
+    키워드가 없으면 모든 키워드의 콘텐츠를 최신순으로 합쳐 반환합니다.
     """
     keyword = request.args.get('keyword', '').strip()
+    if not keyword:
+        load_stored_results()
+    state = content_cache.state
     
-    print(f"[API] 콘텐츠 조회 요청: keyword='{keyword}'")
-    print(f"[API] 캐시된 키워드: {list(cached_data.keys())}")
+    query = None
+    if any(param in request.args for param in CONTENT_QUERY_PARAMS):
+        try:
+            query = parse_content_query(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
     
     if keyword:
-        # 특정 키워드만 조회
-        if keyword in cached_data:
-            data = cached_data[keyword]
-            print(f"[API] 캐시에서 반환: {keyword}, 콘텐츠 수: {data.get('total_count', 0)}")
-            return jsonify(data)
+        # 특정 키워드만 조회 (표기만 다른 키워드가 캐시에 있으면 그 결과 사용)
+        key = matching_keyword(keyword, state.snapshots.keywords)
+        if key is not None:
+            log.info("콘텐츠 조회", keyword=keyword, served_from='cache', sample=Config.LOG_REQUEST_SAMPLE_RATE)
         else:
-            # 실시간 수집
-            print(f"[API] 실시간 수집 시작: {keyword}")
-            result = collector.collect_all(keyword)
-            cached_data[keyword] = result
-            print(f"[API] 실시간 수집 완료: {keyword}, 콘텐츠 수: {result.get('total_count', 0)}")
-            return jsonify(result)
+            # 영구 저장소에 유효한 결과가 있으면 사용 (시작 시 확인한 키워드는 처음 조회할 때 로드)
+            key = matching_keyword(keyword, unloaded_stored_keys) or keyword
+            stored = load_stored_results([key]).get(key)
+            if stored is None and Config.RESULT_STORE_ENABLED:
+                stored = load_result(key, max_age_seconds=RESULT_MAX_AGE_SECONDS)
+                if stored:
+                    content_cache.merge({key: stored})
+            if stored:
+                log.info("콘텐츠 조회", keyword=keyword, served_from='store', contents=stored.get('total_count', 0))
+            else:
+                key = keyword
+                wait = parse_wait(request.args.get('wait'))
+                pending = collect_on_demand(keyword, wait)
+                if pending is not None:
+                    return pending
+            state = content_cache.state
+        # 조회 빈도를 갱신 주기에 반영
+        refresh_scheduler.record_request(key)
+        
+        if query:
+            return content_query_response(state, [key], query)
+        return snapshot_response(state.snapshots.keywords[key])
     else:
         # 모든 키워드 반환
-        print(f"[API] 모든 키워드 반환: {len(cached_data)}개 키워드")
-        return jsonify(cached_data)
+        log.info("콘텐츠 조회", keywords=len(state.data), served_from='cache', sample=Config.LOG_REQUEST_SAMPLE_RATE)
+        if query:
+            return content_query_response(state, list(state.snapshots.indexes), query)
+        return snapshot_response(state.snapshots.all)
+
+def last_update_time(data):
+    """가장 최근 수집 시각 (epoch 초, 수집 결과가 없으면 None)"""
+    return max((r.get('collected_at', 0) for r in data.values()), default=None) or None
 
 @app.route('/api/status', methods=['GET'])
 def get_status():
     """서비스 상태 확인 API"""
-    total_contents = sum(r['total_count'] for r in cached_data.values())
+    state = content_cache.state
+    data = state.data
+    total_contents = sum(r['total_count'] for r in data.values())
+    last_update = last_update_time(data)
     
-    return jsonify({
+    status = {
         'status': 'running',
         'update_interval_minutes': Config.UPDATE_INTERVAL,
-        'cached_keywords': list(cached_data.keys()),
+        'cached_keywords': list(data.keys()),
         'total_cached_contents': total_contents,
-        'last_update': time.time(),
+        'unique_cached_contents': len(content_cache.items),
+        'unloaded_stored_keywords': sorted(unloaded_stored_keys),
+        'last_update': last_update,
+        'cache_generation': state.generation,
+        'collection': collection_queue.status(),
+        'refresh_schedule': refresh_scheduler.status(),
+        'quota': quota_manager.status(),
+        'update_stream': stream_server.status(),
         'api_keys': {
             'youtube': 'configured' if Config.YOUTUBE_API_KEY else 'missing',
             'naver_id': 'configured' if Config.NAVER_CLIENT_ID else 'missing',
             'naver_secret': 'configured' if Config.NAVER_CLIENT_SECRET else 'missing'
         }
-    })
+    }
+    # ETag은 상태가 바뀔 때만 달라지는 값으로 계산 (시간이 지나며 감쇠하는 refresh_schedule의
+    # requests_per_hour 대신 일정 버전을 사용하여 폴링할 때마다 ETag이 바뀌지 않도록 함)
+    versioned = {key: value for key, value in status.items() if key != 'refresh_schedule'}
+    versioned['refresh_schedule_version'] = refresh_scheduler.version
+    etag = combine_versions(sorted((key, str(value)) for key, value in versioned.items()))
+    # 쿼터/큐 상태는 last_update와 무관하게 바뀌므로 Last-Modified는 보내지 않음 (If-Modified-Since로 304가 나가지 않도록)
+    return conditional_json(status, etag)
+
+def parse_update_seq(value):
+    """
+    클라이언트가 마지막으로 받은 이벤트 순번 파싱 (없으면 현재 최신 순번)
+    
+    Raises:
+        ValueError: 순번 형식이 잘못된 경우
+    """
+    return parse_seq(value, update_broker.latest_seq)
+
+def stream_redirect(path, params):
+    """
+    스트림 서버로 보내는 307 리다이렉트 응답
+    
+    Args:
+        path: 스트림 서버의 경로 ('/api/stream' 또는 '/api/updates')
+        params: 넘길 쿼리 파라미터
+    """
+    base = Config.STREAM_PUBLIC_URL
+    if not base:
+        host = urlsplit(request.host_url).hostname
+        if ':' in host:
+            host = f"[{host}]"
+        base = f"{request.scheme}://{host}:{stream_server.port}"
+    query = urlencode(params)
+    response = redirect(f"{base}{path}?{query}" if query else f"{base}{path}", code=307)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.route('/api/stream', methods=['GET'])
+def stream_updates():
+    """
+    수집 업데이트 SSE 스트림
+    
+    Query Parameters:
+        since: 마지막으로 받은 이벤트 순번 (선택사항, 재연결 시 Last-Event-ID 헤더 우선)
+    
+    이벤트:
+        keyword: 키워드 하나의 수집 결과 변경분 (key, added, removed 및 카운트 필드)
+        collection_done: 수집 작업 완료 (job_id, keywords, removed_keywords, error)
+        resync: 놓친 이벤트가 있어 전체 데이터를 다시 받아야 함
+    
+    연결은 이벤트 루프 스레드 하나에서 모든 클라이언트를 처리하는 스트림 서버(STREAM_PORT)가 맡으므로
+    여기서는 마지막 순번을 붙여 307로 넘기기만 합니다. 스트림 서버가 없으면 503과 함께
+    같은 이벤트를 주는 롱폴링 엔드포인트(/api/updates)를 안내합니다.
+    """
+    try:
+        since = parse_update_seq(request.headers.get('Last-Event-ID') or request.args.get('since'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    if not stream_server.running:
+        response = jsonify({
+            'error': '업데이트 스트림을 사용할 수 없습니다',
+            'fallback': '/api/updates',
+            'latest_seq': update_broker.latest_seq,
+        })
+        response.status_code = 503
+        response.headers['Retry-After'] = str(Config.LONG_POLL_MAX_SECONDS)
+        return response
+    return stream_redirect('/api/stream', {'since': since})
+
+@app.route('/api/updates', methods=['GET'])
+def poll_updates():
+    """
+    수집 업데이트 롱폴링 API (SSE를 쓸 수 없는 클라이언트용)
+    
+    Query Parameters:
+        since: 마지막으로 받은 이벤트 순번 (선택사항, 없으면 이후 이벤트부터)
+        timeout: 최대 대기 시간(초) (선택사항, LONG_POLL_MAX_SECONDS 이하)
+    
+    스트림 서버가 있으면 대기를 그쪽 이벤트 루프로 넘기고(307),
+    없을 때만 요청 스레드에서 기다립니다.
+    """
+    try:
+        since = parse_update_seq(request.args.get('since'))
+        timeout = parse_timeout(request.args.get('timeout'), Config.LONG_POLL_MAX_SECONDS)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    if stream_server.running:
+        return stream_redirect('/api/updates', {'since': since, 'timeout': timeout})
+    events = update_broker.wait(since, timeout=timeout)
+    return jsonify({'events': events, 'latest_seq': update_broker.latest_seq})
 
 @app.route('/api/admin/blacklist', methods=['GET'])
 def get_blacklist_api():
@@ -174,13 +669,13 @@ def block_content():
     content_id = data.get('content_id')
     url = data.get('url')
     title = data.get('title', '')
-
+    
     if not content_id and (title or url):
         content_id = generate_content_hash(title, url or '')
-
+    
     if not content_id and not url:
         return jsonify({'error': 'content_id 또는 url이 필요합니다'}), 400
-
+    
     updated = add_to_blacklist(content_id=content_id, url=url)
     return jsonify({
         'message': '블랙리스트에 추가되었습니다',
@@ -195,10 +690,10 @@ def unblock_content():
     data = request.json or {}
     content_id = data.get('content_id')
     url = data.get('url')
-
+    
     if not content_id and not url:
         return jsonify({'error': 'content_id 또는 url이 필요합니다'}), 400
-
+    
     updated = remove_from_blacklist(content_id=content_id, url=url)
     return jsonify({
         'message': '블랙리스트에서 제거되었습니다',
@@ -207,6 +702,58 @@ def unblock_content():
         'blacklist': updated
     })
 
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Prometheus 형식 지표 (수집 단계별 소요 시간, 소스별 요청/재시도/오류, 라우트별 응답 시간)"""
+    if not Config.METRICS_ENABLED:
+        return jsonify({'error': '지표 수집이 비활성화되어 있습니다 (METRICS_ENABLED)'}), 404
+    return Response(registry.render(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/api/admin/profiler', methods=['GET', 'POST'])
+def manage_profiler():
+    """
+    관리자용 샘플링 프로파일러 API
+    GET: 상위 스택/함수 조회 (format=collapsed면 flamegraph용 텍스트)
+    POST: {"enabled": true/false, "interval_ms": 10, "reset": true}로 켜기/끄기
+    """
+    if request.method == 'POST':
+        data = request.json or {}
+        if data.get('reset'):
+            profiler.reset()
+        try:
+            interval_ms = int(data['interval_ms']) if data.get('interval_ms') is not None else None
+        except (TypeError, ValueError):
+            return jsonify({'error': 'interval_ms는 정수여야 합니다'}), 400
+        if 'enabled' in data:
+            if data['enabled']:
+                profiler.start(interval_ms=interval_ms)
+            else:
+                profiler.stop()
+        return jsonify(profiler.report())
+    
+    if request.args.get('format') == 'collapsed':
+        return Response(profiler.collapsed(), mimetype='text/plain')
+    try:
+        limit = max(1, min(int(request.args.get('limit', 20)), 200))
+    except ValueError:
+        return jsonify({'error': 'limit은 정수여야 합니다'}), 400
+    return jsonify(profiler.report(limit=limit))
+
+@app.route('/api/admin/log-level', methods=['GET', 'POST'])
+def manage_log_level():
+    """
+    관리자용 로그 레벨 API
+    GET: 현재 레벨 조회
+    POST: {"level": "DEBUG"}로 실행 중 레벨 변경
+    """
+    if request.method == 'POST':
+        data = request.json or {}
+        try:
+            set_level(data.get('level', ''))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+    return jsonify({'level': get_level(), 'request_sample_rate': Config.LOG_REQUEST_SAMPLE_RATE})
+
 @app.route('/api/refresh', methods=['POST'])
 def refresh_data():
     """수동 데이터 갱신 API"""
@@ -215,7 +762,7 @@ def refresh_data():
     request_data = request.json or {}
     keywords = request_data.get('keywords', [])
     
-    print(f"[API] 데이터 갱신 요청: keywords={keywords}")
+    log.info("데이터 갱신 요청", keywords=keywords)
     
     if keywords:
         # 키워드 정규화
@@ -233,25 +780,26 @@ def refresh_data():
                 normalized_keywords.append(normalized)
         
         tracked_keywords = normalized_keywords
-        print(f"[API] 추적 키워드 업데이트: {tracked_keywords}")
+        refresh_scheduler.set_keywords(tracked_keywords)
+        log.info("추적 키워드 업데이트", keywords=tracked_keywords)
         keywords = normalized_keywords
     else:
         keywords = tracked_keywords
-        print(f"[API] 기존 추적 키워드 사용: {keywords}")
-    
-    # 데이터 수집 (별도 스레드에서 실행하여 응답 지연 방지)
-    def collect_in_background():
-        print(f"[API] 백그라운드 데이터 수집 시작: {keywords}")
-        collect_and_cache(keywords)
-        print(f"[API] 백그라운드 데이터 수집 완료")
+        log.info("기존 추적 키워드 사용", keywords=keywords)
     
-    collection_thread = threading.Thread(target=collect_in_background, daemon=True)
-    collection_thread.start()
+    # 데이터 수집 (작업 큐에서 실행하여 응답 지연 방지, 대기 중인 수집이 있으면 그 작업에 합침)
+    # 클라이언트는 job_id가 담긴 collection_done 이벤트로 완료를 확인
+    update_seq = update_broker.latest_seq
+    job_id, coalesced = collection_queue.submit(keywords)
+    log.info("데이터 수집 작업 등록", job_id=job_id, coalesced=coalesced)
     
     return jsonify({
         'message': '데이터 갱신 시작됨', 
         'keywords': keywords,
-        'status': 'collecting'
+        'status': 'collecting',
+        'job_id': job_id,
+        'coalesced': coalesced,
+        'update_seq': update_seq
     })
 
 @app.route('/api/keywords', methods=['GET', 'POST'])
@@ -260,12 +808,12 @@ def manage_keywords():
     global tracked_keywords
     
     if request.method == 'GET':
-        print(f"[API] 키워드 조회 요청: {tracked_keywords}")
+        log.info("키워드 조회", keywords=len(tracked_keywords), sample=Config.LOG_REQUEST_SAMPLE_RATE)
         return jsonify({'keywords': tracked_keywords})
     
     elif request.method == 'POST':
         data = request.json
-        print(f"[API] 키워드 업데이트 요청: {data}")
+        log.info("키워드 업데이트 요청", data=data)
         
         if 'keywords' in data:
             old_keywords = tracked_keywords.copy()
@@ -284,21 +832,21 @@ def manage_keywords():
                     normalized_keywords.append(normalized)
             
             tracked_keywords = normalized_keywords
-            print(f"[API] 키워드 업데이트: {old_keywords} -> {tracked_keywords}")
-            
-            # 키워드 변경 시 데이터 수집 (별도 스레드에서 실행하여 응답 지연 방지)
-            def collect_in_background():
-                print(f"[API] 백그라운드 데이터 수집 시작: {tracked_keywords}")
-                collect_and_cache(tracked_keywords)
-                print(f"[API] 백그라운드 데이터 수집 완료")
+            refresh_scheduler.set_keywords(tracked_keywords)
+            log.info("키워드 업데이트", old=old_keywords, new=tracked_keywords)
             
-            collection_thread = threading.Thread(target=collect_in_background, daemon=True)
-            collection_thread.start()
+            # 키워드 변경 시 데이터 수집 (작업 큐에서 실행하여 응답 지연 방지)
+            update_seq = update_broker.latest_seq
+            job_id, coalesced = collection_queue.submit(tracked_keywords)
+            log.info("데이터 수집 작업 등록", job_id=job_id, coalesced=coalesced)
             
             return jsonify({
                 'message': '키워드 업데이트 완료', 
                 'keywords': tracked_keywords,
-                'status': 'collecting'
+                'status': 'collecting',
+                'job_id': job_id,
+                'coalesced': coalesced,
+                'update_seq': update_seq
             })
         else:
             return jsonify({'error': 'keywords 필드가 필요합니다'}), 400
@@ -306,7 +854,8 @@ def manage_keywords():
 if __name__ == '__main__':
     try:
         print(f"\n서버 시작: http://localhost:{Config.PORT}")
-        print(f"자동 갱신 주기: {Config.UPDATE_INTERVAL}분")
+        print(f"기본 갱신 주기: {Config.UPDATE_INTERVAL}분 (키워드별 새 항목 수/조회 빈도에 따라 조정)" if Config.ADAPTIVE_REFRESH
+              else f"자동 갱신 주기: {Config.UPDATE_INTERVAL}분")
         print("서버가 시작되었습니다. 브라우저에서 http://localhost:5000 에 접속하세요.\n")
         app.run(host='127.0.0.1', port=Config.PORT, debug=Config.DEBUG, use_reloader=False)
     except Exception as e:
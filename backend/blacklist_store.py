@@ -1,11 +1,47 @@
 """
 Blacklist storage for content moderation.
+
+The blacklist is kept in a process-wide index of hash sets. It is loaded once
+and reloaded only when blacklist.json's mtime changes; writes are atomic
+(temp file + rename) and serialized with a lock.
 """
 import json
+import os
+import tempfile
+import threading
+import time
 from pathlib import Path
 
 BLACKLIST_PATH = Path(__file__).parent / "blacklist.json"
 
+# Minimum seconds between mtime checks on the hot path
+MTIME_CHECK_INTERVAL = 1.0
+
+_lock = threading.Lock()
+_index = None
+
+class _BlacklistIndex:
+    __slots__ = ("path", "mtime", "checked_at", "blocked_ids", "blocked_urls")
+
+    def __init__(self, path, mtime, blocked_ids, blocked_urls):
+        self.path = path
+        self.mtime = mtime
+        self.checked_at = time.monotonic()
+        self.blocked_ids = frozenset(blocked_ids)
+        self.blocked_urls = frozenset(blocked_urls)
+
+    def as_dict(self):
+        return {
+            "blocked_ids": sorted(self.blocked_ids),
+            "blocked_urls": sorted(self.blocked_urls),
+        }
+
+def _file_mtime():
+    try:
+        return BLACKLIST_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+
 def _load_blacklist():
     if not BLACKLIST_PATH.exists():
         return {"blocked_ids": [], "blocked_urls": []}
@@ -21,42 +57,93 @@ def _load_blacklist():
 
 def _save_blacklist(data):
     BLACKLIST_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with BLACKLIST_PATH.open("w", encoding="utf-8") as f:
-        json.dump(
-            {
-                "blocked_ids": sorted(set(data.get("blocked_ids", []))),
-                "blocked_urls": sorted(set(data.get("blocked_urls", []))),
-            },
-            f,
-            ensure_ascii=True,
-            indent=2,
-        )
+    fd, tmp_path = tempfile.mkstemp(
+        dir=str(BLACKLIST_PATH.parent), prefix=".blacklist.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "blocked_ids": sorted(set(data.get("blocked_ids", []))),
+                    "blocked_urls": sorted(set(data.get("blocked_urls", []))),
+                },
+                f,
+                ensure_ascii=True,
+                indent=2,
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, BLACKLIST_PATH)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _reload_index():
+    global _index
+    mtime = _file_mtime()
+    data = _load_blacklist()
+    _index = _BlacklistIndex(BLACKLIST_PATH, mtime, data["blocked_ids"], data["blocked_urls"])
+    return _index
+
+def _get_index():
+    index = _index
+    if index is not None and index.path == BLACKLIST_PATH:
+        if time.monotonic() - index.checked_at < MTIME_CHECK_INTERVAL:
+            return index
+        if _file_mtime() == index.mtime:
+            index.checked_at = time.monotonic()
+            return index
+    with _lock:
+        index = _index
+        if index is None or index.path != BLACKLIST_PATH or _file_mtime() != index.mtime:
+            index = _reload_index()
+        return index
 
 def get_blacklist():
-    return _load_blacklist()
+    return _get_index().as_dict()
 
 def is_blocked(content_id=None, url=None):
-    data = _load_blacklist()
-    if content_id and content_id in data.get("blocked_ids", []):
+    index = _get_index()
+    if content_id and content_id in index.blocked_ids:
         return True
-    if url and url in data.get("blocked_urls", []):
+    if url and url in index.blocked_urls:
         return True
     return False
 
+def blacklist_version():
+    """Return a token that changes whenever the blacklist file changes."""
+    return _get_index().mtime
+
+def filter_blocked(items):
+    """Return items whose content_id and url are not blacklisted."""
+    index = _get_index()
+    blocked_ids = index.blocked_ids
+    blocked_urls = index.blocked_urls
+    return [
+        item for item in items
+        if item.get("content_id") not in blocked_ids and item.get("url") not in blocked_urls
+    ]
+
+def _update_blacklist(add_ids=(), add_urls=(), remove_ids=(), remove_urls=()):
+    with _lock:
+        index = _index
+        if index is None or index.path != BLACKLIST_PATH or _file_mtime() != index.mtime:
+            index = _reload_index()
+        blocked_ids = (index.blocked_ids | set(add_ids)) - set(remove_ids)
+        blocked_urls = (index.blocked_urls | set(add_urls)) - set(remove_urls)
+        data = {"blocked_ids": blocked_ids, "blocked_urls": blocked_urls}
+        _save_blacklist(data)
+        return _reload_index().as_dict()
+
 def add_to_blacklist(content_id=None, url=None):
-    data = _load_blacklist()
-    if content_id:
-        data.setdefault("blocked_ids", []).append(content_id)
-    if url:
-        data.setdefault("blocked_urls", []).append(url)
-    _save_blacklist(data)
-    return data
+    return _update_blacklist(
+        add_ids=[content_id] if content_id else (),
+        add_urls=[url] if url else (),
+    )
 
 def remove_from_blacklist(content_id=None, url=None):
-    data = _load_blacklist()
-    if content_id:
-        data["blocked_ids"] = [x for x in data.get("blocked_ids", []) if x != content_id]
-    if url:
-        data["blocked_urls"] = [x for x in data.get("blocked_urls", []) if x != url]
-    _save_blacklist(data)
-    return data
+    return _update_blacklist(
+        remove_ids=[content_id] if content_id else (),
+        remove_urls=[url] if url else (),
+    )
@@ -0,0 +1,129 @@
+"""
+수집 작업 큐 모듈
+갱신 요청마다 스레드를 만들지 않고 하나의 작업 스레드에서 수집을 순서대로 실행합니다.
+큐에는 실행 중인 작업 하나와 대기 작업 하나만 있으며,
+대기 작업이 있는 동안 들어온 요청은 그 작업에 합쳐집니다.
+"""
+import threading
+import uuid
+try:
+    from .log import get_logger
+except ImportError:
+    from log import get_logger
+
+log = get_logger('queue')
+
+class CollectionJob:
+    """
+    수집 작업
+    prune 작업은 추적 키워드 전체를 수집하고 목록에서 빠진 키워드를 캐시에서 제거하며,
+    그 외 작업은 지정한 키워드만 갱신합니다.
+    """
+    
+    __slots__ = ('job_id', 'keywords', 'only_stale', 'prune')
+    
+    def __init__(self, keywords, only_stale=False, prune=True):
+        self.job_id = uuid.uuid4().hex
+        self.keywords = list(keywords)
+        self.only_stale = only_stale
+        self.prune = prune
+
+class CollectionQueue:
+    """
+    크기가 제한된 수집 작업 큐 (실행 중 1개 + 대기 1개)
+    
+    대기 작업이 아직 시작되지 않았다면 새 요청은 같은 job_id로 합쳐지므로
+    갱신 요청이 몰려도 수집은 최대 한 번 더 실행됩니다.
+    """
+    
+    def __init__(self, run_job, key):
+        """
+        Args:
+            run_job: 작업을 실행할 함수 (CollectionJob을 인자로 받음)
+            key: 키워드 객체를 캐시 키로 바꾸는 함수 (작업을 합칠 때 중복 제거용)
+        """
+        self._run_job = run_job
+        self._key = key
+        self._condition = threading.Condition()
+        self._pending = None
+        self._running = None
+        self._worker = None
+    
+    def submit(self, keywords, only_stale=False, prune=True):
+        """
+        수집 작업 등록 (대기 작업이 있으면 그 작업에 합침)
+        
+        합칠 때 prune 요청은 대기 작업의 키워드를 새 목록으로 바꾸고,
+        일부 키워드만 갱신하는 요청은 대기 작업의 키워드에 더합니다.
+        
+        Args:
+            keywords: 수집할 키워드 리스트
+            only_stale: True이면 오래된 키워드만 수집 (합쳐지는 요청 중 하나라도 False면 False)
+            prune: True이면 keywords가 추적 키워드 전체이며 빠진 키워드를 캐시에서 제거
+        
+        Returns:
+            tuple: (job_id, 기존 대기 작업에 합쳐졌으면 True)
+        """
+        with self._condition:
+            pending = self._pending
+            coalesced = pending is not None
+            if not coalesced:
+                self._pending = CollectionJob(keywords, only_stale, prune)
+            elif prune:
+                pending.keywords = list(keywords)
+                pending.prune = True
+            else:
+                known = {self._key(keyword) for keyword in pending.keywords}
+                pending.keywords.extend(keyword for keyword in keywords if self._key(keyword) not in known)
+            if coalesced:
+                pending.only_stale = pending.only_stale and only_stale
+            job_id = self._pending.job_id
+            
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._work, name='collection-worker', daemon=True)
+                self._worker.start()
+            self._condition.notify_all()
+            return job_id, coalesced
+    
+    def _work(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None)
+                job, self._pending = self._pending, None
+                self._running = job
+            try:
+                self._run_job(job)
+            except Exception as e:
+                log.error("수집 작업 실패", job_id=job.job_id, error=e, exc_info=True)
+            finally:
+                with self._condition:
+                    self._running = None
+                    self._condition.notify_all()
+    
+    def status(self):
+        """
+        큐 상태
+        
+        Returns:
+            dict: 실행 중/대기 중 작업 ID (없으면 None)
+        """
+        with self._condition:
+            return {
+                'running_job': self._running.job_id if self._running else None,
+                'pending_job': self._pending.job_id if self._pending else None,
+            }
+    
+    def wait_idle(self, timeout=None):
+        """
+        실행 중/대기 중인 작업이 모두 끝날 때까지 대기
+        
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+        
+        Returns:
+            bool: 모두 끝났으면 True
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._pending is None and self._running is None, timeout=timeout
+            )
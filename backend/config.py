@@ -44,15 +44,101 @@ class Config:
     
     # 서비스 설정
     UPDATE_INTERVAL = int(os.getenv('UPDATE_INTERVAL', 15))  # 분 단위
+    
+    # 키워드별 적응형 갱신 주기 (새 항목이 많거나 자주 조회되는 키워드는 자주, 나머지는 드물게)
+    ADAPTIVE_REFRESH = os.getenv('ADAPTIVE_REFRESH', 'True').lower() == 'true'
+    REFRESH_MIN_INTERVAL = int(os.getenv('REFRESH_MIN_INTERVAL', 5))  # 분 단위
+    REFRESH_MAX_INTERVAL = int(os.getenv('REFRESH_MAX_INTERVAL', 120))  # 분 단위
+    REFRESH_BUDGET_PER_HOUR = int(os.getenv('REFRESH_BUDGET_PER_HOUR', 60))  # 시간당 키워드 수집 횟수 상한
+    REFRESH_HOT_NEW_PER_HOUR = float(os.getenv('REFRESH_HOT_NEW_PER_HOUR', 10))  # 시간당 새 항목 수 기준
+    REFRESH_HOT_REQUESTS_PER_HOUR = float(os.getenv('REFRESH_HOT_REQUESTS_PER_HOUR', 20))  # 시간당 조회 수 기준
     PORT = int(os.getenv('PORT', 5000))
     DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
     
+    # 이 크기(바이트) 이상인 API 응답은 gzip/brotli로 압축
+    COMPRESS_MIN_BYTES = int(os.getenv('COMPRESS_MIN_BYTES', 1024))
+    
+    # /api/content 페이지 크기 상한
+    CONTENT_PAGE_MAX_LIMIT = int(os.getenv('CONTENT_PAGE_MAX_LIMIT', 500))
+    
+    # 캐시에 없는 키워드를 조회하면 수집이 끝날 때까지 기다릴지 여부
+    # (False이면 수집을 백그라운드에서 시작하고 202와 함께 이전/빈 결과를 바로 반환, 요청의 wait 파라미터로 변경 가능)
+    ON_DEMAND_WAIT = os.getenv('ON_DEMAND_WAIT', 'True').lower() == 'true'
+    
+    # 업데이트 푸시 (/api/stream SSE, /api/updates 롱폴링)
+    UPDATE_EVENT_BUFFER = int(os.getenv('UPDATE_EVENT_BUFFER', 256))  # 보관할 최근 이벤트 수
+    STREAM_HEARTBEAT_SECONDS = int(os.getenv('STREAM_HEARTBEAT_SECONDS', 15))
+    LONG_POLL_MAX_SECONDS = int(os.getenv('LONG_POLL_MAX_SECONDS', 30))
+    # 스트림 서버 (SSE/롱폴링 연결을 이벤트 루프 스레드 하나에서 처리, /api/stream과 /api/updates는 이 포트로 리다이렉트)
+    STREAM_HOST = os.getenv('STREAM_HOST', '127.0.0.1')
+    STREAM_PORT = int(os.getenv('STREAM_PORT', PORT + 1))  # 0이면 사용 안 함 (롱폴링만 Flask 스레드에서 처리)
+    STREAM_PUBLIC_URL = os.getenv('STREAM_PUBLIC_URL', '').rstrip('/')  # 프록시 뒤에서 클라이언트가 접속할 주소 (없으면 요청 호스트 + STREAM_PORT)
+    # 동시 SSE 연결 수 상한 (연결당 소켓 하나만 쓰지만 파일 디스크립터 한도를 넘지 않도록, 넘으면 503으로 롱폴링 안내)
+    MAX_STREAM_CLIENTS = int(os.getenv('MAX_STREAM_CLIENTS', 500))
+    
     # 수집 설정
     MAX_RESULTS_YOUTUBE = int(os.getenv('MAX_RESULTS_YOUTUBE', 50))
-    MAX_RESULTS_NEWS = int(os.getenv('MAX_RESULTS_NEWS', 50))
+    MAX_RESULTS_NEWS = int(os.getenv('MAX_RESULTS_NEWS', 100))  # 네이버 페이지당 결과 수 (최대 100)
+    
+    # 네이버 뉴스 페이지 수집 (24시간 경계에 도달할 때까지 다음 페이지 요청, start 최대 1000)
+    NAVER_MAX_PAGES = int(os.getenv('NAVER_MAX_PAGES', 10))
+    NAVER_PAGE_CONCURRENCY = int(os.getenv('NAVER_PAGE_CONCURRENCY', 3))
+    
+    # 유튜브 영상 통계 보강 (videos.list로 조회수/좋아요/댓글 수/길이 추가)
+    YOUTUBE_ENRICH = os.getenv('YOUTUBE_ENRICH', 'True').lower() == 'true'
+    VIDEO_STATS_TTL_SECONDS = int(os.getenv('VIDEO_STATS_TTL_SECONDS', 600))
+    VIDEO_STATS_CACHE_SIZE = int(os.getenv('VIDEO_STATS_CACHE_SIZE', 5000))
+    
+    # 동시 수집 설정 (소스별 동시 요청 수 제한)
+    CONCURRENT_COLLECTION = os.getenv('CONCURRENT_COLLECTION', 'True').lower() == 'true'
+    YOUTUBE_CONCURRENCY = int(os.getenv('YOUTUBE_CONCURRENCY', 4))
+    NAVER_CONCURRENCY = int(os.getenv('NAVER_CONCURRENCY', 4))
+    
+    # 네이버 API HTTP 설정 (keep-alive 커넥션 풀 + 재시도)
+    NAVER_POOL_SIZE = int(os.getenv('NAVER_POOL_SIZE', 10))
+    NAVER_MAX_RETRIES = int(os.getenv('NAVER_MAX_RETRIES', 3))
+    NAVER_BACKOFF_BASE = float(os.getenv('NAVER_BACKOFF_BASE', 0.5))  # 초 단위
+    NAVER_BACKOFF_MAX = float(os.getenv('NAVER_BACKOFF_MAX', 30))  # 초 단위
+    
+    # API 쿼터 (일일 한도는 재시작해도 유지되도록 QUOTA_STATE_PATH에 기록)
+    YOUTUBE_DAILY_QUOTA = int(os.getenv('YOUTUBE_DAILY_QUOTA', 10000))  # 유닛 (search.list 1회 = 100)
+    NAVER_DAILY_LIMIT = int(os.getenv('NAVER_DAILY_LIMIT', 25000))  # 호출 횟수
+    YOUTUBE_CALLS_PER_SECOND = float(os.getenv('YOUTUBE_CALLS_PER_SECOND', 5))
+    NAVER_CALLS_PER_SECOND = float(os.getenv('NAVER_CALLS_PER_SECOND', 10))
+    QUOTA_RESERVE_RATIO = float(os.getenv('QUOTA_RESERVE_RATIO', 0.2))  # 남은 양이 이 비율 미만이면 부가 검색 생략
+    QUOTA_STATE_PATH = Path(os.getenv('QUOTA_STATE_PATH', str(project_root / 'backend' / 'quota_usage.json')))
     
     # 데이터 유효 기간 (시간 단위)
     DATA_VALID_HOURS = 24
     
+    # 증분 수집 (이전 결과의 최신 게시 시각 이후만 수집하여 병합)
+    INCREMENTAL_COLLECTION = os.getenv('INCREMENTAL_COLLECTION', 'True').lower() == 'true'
+    INCREMENTAL_OVERLAP_MINUTES = int(os.getenv('INCREMENTAL_OVERLAP_MINUTES', 10))
+    
+    # 유사 중복 뉴스 묶기 (SimHash 해밍 거리 기준)
+    NEAR_DUP_ENABLED = os.getenv('NEAR_DUP_ENABLED', 'True').lower() == 'true'
+    NEAR_DUP_MAX_DISTANCE = int(os.getenv('NEAR_DUP_MAX_DISTANCE', 5))
+    
+    # 전역 중복 검사 인덱스 최대 항목 수 (메모리 상한)
+    SEEN_INDEX_MAX_ITEMS = int(os.getenv('SEEN_INDEX_MAX_ITEMS', 200000))
+    
+    # 수집 결과 영구 저장 (재시작 시 저장된 결과를 즉시 제공)
+    RESULT_STORE_ENABLED = os.getenv('RESULT_STORE_ENABLED', 'True').lower() == 'true'
+    RESULT_STORE_PATH = Path(os.getenv('RESULT_STORE_PATH', str(project_root / 'backend' / 'result_cache.db')))
+    
+    # 관측 지표 (/metrics) 및 샘플링 프로파일러 (실행 중 /api/admin/profiler로 켜고 끌 수 있음)
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'True').lower() == 'true'
+    PROFILER_ENABLED = os.getenv('PROFILER_ENABLED', 'False').lower() == 'true'
+    PROFILER_INTERVAL_MS = int(os.getenv('PROFILER_INTERVAL_MS', 10))
+    
+    # 로그 (큐에 넣고 별도 스레드에서 출력하여 요청 처리 스레드가 콘솔 출력을 기다리지 않음)
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+    LOG_FORMAT = os.getenv('LOG_FORMAT', 'text').lower()  # text 또는 json
+    LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', 10000))  # 가득 차면 새 로그는 버림
+    LOG_REQUEST_SAMPLE_RATE = float(os.getenv('LOG_REQUEST_SAMPLE_RATE', 0.1))  # 요청별 로그를 남길 비율
+    
+    # 아티스트 영문/한글명 별칭 데이터 (파일이 바뀌면 자동으로 다시 색인)
+    KEYWORD_ALIASES_PATH = Path(os.getenv('KEYWORD_ALIASES_PATH', str(project_root / 'backend' / 'keyword_aliases.json')))
+    
     # 기본 검색 키워드 (예시)
     DEFAULT_KEYWORDS = ['BTS', 'BLACKPINK', 'NewJeans', 'IVE', 'LE SSERAFIM']
@@ -0,0 +1,83 @@
+"""
+콘텐츠 캐시 모듈
+키워드별 수집 결과와 응답 스냅샷을 하나의 불변 상태로 묶어 보관하고,
+변경 시 새 상태를 만들어 통째로 교체(copy-on-write)합니다.
+읽는 쪽은 잠금 없이 state 하나를 가져가 일관된 데이터와 스냅샷을 사용합니다.
+콘텐츠는 공유 저장소(ItemStore)에 한 벌만 두고 키워드별 결과는 레코드 참조만 가집니다.
+"""
+import threading
+try:
+    from .snapshot import build_snapshots
+    from .item_store import ItemStore
+except ImportError:
+    from snapshot import build_snapshots
+    from item_store import ItemStore
+
+class CacheState:
+    """캐시의 한 시점 상태 (세대 번호, 키워드별 결과(StoredResult), 응답 스냅샷) - 생성 후 변경하지 않음"""
+    
+    __slots__ = ('generation', 'data', 'snapshots')
+    
+    def __init__(self, generation, data, snapshots):
+        self.generation = generation
+        self.data = data
+        self.snapshots = snapshots
+
+class ContentCache:
+    """
+    스레드 안전한 버전 관리 콘텐츠 캐시
+    
+    쓰기는 잠금 아래에서 현재 상태에 변경분을 병합한 새 상태를 만들어 교체하므로
+    동시에 끝난 수집 결과가 서로를 덮어쓰지 않습니다.
+    """
+    
+    def __init__(self, data=None):
+        self._lock = threading.Lock()
+        self.items = ItemStore()
+        data = self._store(data or {})
+        self._state = CacheState(0, data, build_snapshots(data))
+    
+    @property
+    def state(self):
+        """현재 상태 (한 번 가져간 상태는 이후 변경의 영향을 받지 않음)"""
+        return self._state
+    
+    def _store(self, data):
+        """키워드별 수집 결과를 공유 저장소 형식(StoredResult)으로 변환"""
+        return {key: self.items.store_result(result) for key, result in data.items()}
+    
+    def merge(self, updates, remove=()):
+        """
+        키워드별 결과를 병합하고 지정한 키워드를 제거한 새 상태로 교체
+        
+        Args:
+            updates: 키워드별 새 수집 결과 딕셔너리
+            remove: 제거할 키워드 목록 (선택사항)
+        
+        Returns:
+            CacheState: 교체 전 상태
+        """
+        with self._lock:
+            previous = self._state
+            data = {key: result for key, result in previous.data.items() if key not in remove}
+            data.update(self._store(updates))
+            snapshots = build_snapshots(data, previous=previous.snapshots)
+            self._state = CacheState(previous.generation + 1, data, snapshots)
+            return previous
+    
+    def replace(self, data):
+        """
+        캐시 전체를 주어진 데이터로 교체
+        
+        Args:
+            data: 키워드별 수집 결과 딕셔너리
+        
+        Returns:
+            CacheState: 교체 전 상태
+        """
+        with self._lock:
+            previous = self._state
+            data = self._store(data)
+            snapshots = build_snapshots(data, previous=previous.snapshots)
+            self._state = CacheState(previous.generation + 1, data, snapshots)
+            return previous
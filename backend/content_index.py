@@ -0,0 +1,130 @@
+"""
+콘텐츠 조회 인덱스 모듈
+키워드별 콘텐츠를 게시 시각 순으로 정리해 두고 페이지네이션, 타입/기간 필터,
+필드 선택을 전체 목록을 훑거나 복사하지 않고 처리합니다.
+"""
+import heapq
+from array import array
+from bisect import bisect_left
+from itertools import islice, repeat
+try:
+    from .utils import content_timestamp
+except ImportError:
+    from utils import content_timestamp
+
+CONTENT_TYPES = ('video', 'news')
+
+class KeywordIndex:
+    """
+    키워드 하나의 콘텐츠 인덱스
+    
+    전체/타입별로 (음수 게시 시각 배열, 공유 레코드 튜플)을 최신순으로 보관하여
+    since 필터는 이진 탐색으로, 페이지는 슬라이스로 처리하고 응답 딕셔너리는 페이지 항목만 만듭니다.
+    만든 딕셔너리는 인덱스에 보관하여, 결과가 바뀌어 인덱스가 새로 만들어질 때까지 다시 조회된 페이지는 재사용합니다.
+    """
+    
+    __slots__ = ('views', 'keyword_fields', '_contents')
+    
+    def __init__(self, result):
+        """
+        Args:
+            result: 키워드 수집 결과 (StoredResult)
+        """
+        entries = sorted(
+            ((content_timestamp(record), record) for record in result.records),
+            key=lambda entry: entry[0],
+            reverse=True
+        )
+        self.keyword_fields = result.keyword_fields()
+        self._contents = {}  # 레코드 -> 응답 딕셔너리 (조회된 항목만)
+        self.views = {None: self._view(entries)}
+        for content_type in CONTENT_TYPES:
+            self.views[content_type] = self._view(
+                [entry for entry in entries if entry[1].get('type') == content_type]
+            )
+    
+    @staticmethod
+    def _view(entries):
+        return array('d', (-timestamp for timestamp, _ in entries)), tuple(record for _, record in entries)
+    
+    def select(self, content_type=None, since=None):
+        """
+        조건에 맞는 구간 반환 (복사 없음)
+        
+        Args:
+            content_type: 'video', 'news' 또는 None (전체)
+            since: 이 시각(epoch 초) 이후 게시된 항목만 (None이면 전체)
+        
+        Returns:
+            tuple: (음수 게시 시각 배열, 레코드 튜플, 조건에 맞는 항목 수)
+        """
+        neg_timestamps, records = self.views.get(content_type, _EMPTY_VIEW)
+        count = len(records) if since is None else bisect_left(neg_timestamps, -since)
+        return neg_timestamps, records, count
+    
+    def content(self, record):
+        """
+        레코드의 응답 딕셔너리 (인덱스마다 한 번만 생성, 호출한 쪽은 읽기만 함)
+        
+        Args:
+            record: 이 인덱스의 레코드
+        
+        Returns:
+            dict: 키워드 필드가 포함된 콘텐츠 딕셔너리
+        """
+        content = self._contents.get(record)
+        if content is None:
+            content = self._contents.setdefault(record, record.to_dict(self.keyword_fields))
+        return content
+
+_EMPTY_VIEW = (array('d'), ())
+
+def query_contents(indexes, content_type=None, since=None, offset=0, limit=None):
+    """
+    하나 이상의 키워드 인덱스에서 최신순 페이지 조회
+    여러 키워드는 정렬된 목록을 지연 병합하므로 offset + limit개까지만 읽고,
+    응답 딕셔너리도 페이지에 들어가는 항목만 만듭니다. (반환된 딕셔너리는 인덱스와 공유되므로 수정하지 않음)
+    
+    Args:
+        indexes: KeywordIndex 리스트
+        content_type: 'video', 'news' 또는 None
+        since: 이 시각(epoch 초) 이후 게시된 항목만
+        offset: 건너뛸 항목 수 (커서)
+        limit: 최대 반환 항목 수 (None이면 끝까지)
+    
+    Returns:
+        tuple: (페이지 콘텐츠 리스트, 조건에 맞는 전체 항목 수, 다음 커서 또는 None)
+    """
+    selections = [index.select(content_type, since) for index in indexes]
+    total = sum(count for _, _, count in selections)
+    stop = total if limit is None else min(total, offset + limit)
+    
+    if len(selections) == 1:
+        _, records, _ = selections[0]
+        content = indexes[0].content
+        page = [content(record) for record in records[offset:stop]]
+    else:
+        streams = [
+            islice(zip(neg_timestamps, records, repeat(index.content)), count)
+            for index, (neg_timestamps, records, count) in zip(indexes, selections)
+        ]
+        merged = heapq.merge(*streams, key=lambda entry: entry[0])
+        page = [content(record) for _, record, content in islice(merged, offset, stop)]
+    
+    next_cursor = str(stop) if stop < total else None
+    return page, total, next_cursor
+
+def project(contents, fields):
+    """
+    콘텐츠에서 요청한 필드만 선택
+    
+    Args:
+        contents: 콘텐츠 리스트
+        fields: 필드 이름 리스트 (None이면 전체)
+    
+    Returns:
+        list: 선택된 필드만 담은 콘텐츠 리스트
+    """
+    if not fields:
+        return contents
+    return [{field: content[field] for field in fields if field in content} for content in contents]
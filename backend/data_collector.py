@@ -2,20 +2,48 @@
 데이터 수집 통합 모듈
 유튜브와 뉴스 수집을 통합하여 관리합니다.
 """
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
 try:
     from .youtube_collector import YouTubeCollector
     from .news_collector import NewsCollector
-    from .deduplicator import Deduplicator
+    from .deduplicator import Deduplicator, SeenContentIndex
+    from .near_deduplicator import NearDuplicateDetector, content_fingerprint
     from .config import Config
-    from .utils import generate_content_hash
-    from .blacklist_store import is_blocked
+    from .utils import generate_content_hash, content_timestamp, cutoff_timestamp, compute_version
+    from .blacklist_store import filter_blocked, blacklist_version
+    from .quota import quota_manager, QuotaExceeded, SEARCH_COST
+    from .metrics import record_stage, UPSTREAM_ERRORS
+    from .log import get_logger
+    from .tagger import ContentTagger
+    from .keyword_mapper import get_alias_index
 except ImportError:
     from youtube_collector import YouTubeCollector
     from news_collector import NewsCollector
-    from deduplicator import Deduplicator
+    from deduplicator import Deduplicator, SeenContentIndex
+    from near_deduplicator import NearDuplicateDetector, content_fingerprint
     from config import Config
-    from utils import generate_content_hash
-    from blacklist_store import is_blocked
+    from utils import generate_content_hash, content_timestamp, cutoff_timestamp, compute_version
+    from blacklist_store import filter_blocked, blacklist_version
+    from quota import quota_manager, QuotaExceeded, SEARCH_COST
+    from metrics import record_stage, UPSTREAM_ERRORS
+    from log import get_logger
+    from tagger import ContentTagger
+    from keyword_mapper import get_alias_index
+
+log = get_logger('collector')
+
+# 콘텐츠 타입 → 수집 소스
+SOURCE_BY_TYPE = {'video': 'youtube', 'news': 'naver'}
+
+def newest_first_key(content):
+    """
+    최신순 정렬 키 (reverse=True와 함께 사용)
+    게시 시각 문자열은 소스마다 시간대 표기(Z, +09:00)가 달라 문자열로 정렬하면 순서가 틀리므로 epoch 초로 비교합니다.
+    """
+    return content_timestamp(content)
 
 class DataCollector:
     """데이터 수집 통합 클래스"""
@@ -23,18 +51,35 @@ class DataCollector:
     def __init__(self):
         self.youtube_collector = YouTubeCollector()
         self.news_collector = NewsCollector()
-        self.deduplicator = Deduplicator()
+        self.near_deduplicator = NearDuplicateDetector(max_distance=Config.NEAR_DUP_MAX_DISTANCE)
+        # 키워드와 수집 주기에 걸쳐 유지되는 전역 중복 검사 인덱스
+        self.seen_index = SeenContentIndex(
+            ttl_hours=Config.DATA_VALID_HOURS,
+            max_items=Config.SEEN_INDEX_MAX_ITEMS
+        )
+        # 소스별 동시 요청 수 제한
+        self.source_concurrency = {
+            'youtube': Config.YOUTUBE_CONCURRENCY,
+            'naver': Config.NAVER_CONCURRENCY,
+        }
+        # 증분 수집용 (키워드, 소스)별 최신 게시 시각
+        self.high_water_marks = {}
+        # 키워드별 마지막 병합 때의 블랙리스트 버전 (바뀌지 않았으면 이전 항목은 다시 검사하지 않음)
+        self._blacklist_versions = {}
+        # 태깅 단계의 태거 캐시 (키워드 목록, 별칭 색인, 태거)와 키워드 → 콘텐츠 ID 역색인
+        self._tagger = None
+        self.tag_index = {}
+        self._tag_lock = threading.Lock()
     
-    def collect_all(self, keyword_obj):
+    def _resolve_keyword(self, keyword_obj):
         """
-        키워드에 대한 모든 콘텐츠 수집 (유튜브 + 뉴스)
-        영문과 한글 키워드를 모두 검색합니다.
+        키워드 객체를 (영문, 한글, 표시명) 튜플로 변환
         
         Args:
             keyword_obj: 키워드 객체 (문자열 또는 {en, ko} 딕셔너리)
         
         Returns:
-            dict: 수집된 콘텐츠 딕셔너리
+            tuple: (keyword_en, keyword_ko, keyword_display)
         """
         # 키워드 정규화
         try:
@@ -53,65 +98,275 @@ class DataCollector:
             keyword_ko = normalized['ko']
             keyword_display = keyword_en
         
-        print(f"[COLLECT] 키워드 검색: 영문='{keyword_en}', 한글='{keyword_ko}'")
+        return keyword_en, keyword_ko, keyword_display
+    
+    def remember_results(self, results):
+        """
+        저장된 수집 결과의 콘텐츠를 전역 중복 검사 인덱스에 등록
+        (재시작 후 이미 본 콘텐츠를 새 콘텐츠로 취급하지 않기 위함)
         
-        # 중복 제거기 초기화
-        self.deduplicator.clear()
+        Args:
+            results: 키워드별 수집 결과 딕셔너리
+        """
+        for result in results.values():
+            for content in result.get('contents', []):
+                if content.get('content_id'):
+                    self.seen_index.add(content['content_id'])
+    
+    def keyword_key(self, keyword_obj):
+        """
+        수집 결과 딕셔너리에서 사용하는 키워드 키(표시명) 반환
         
-        # 유튜브 콘텐츠 수집 (영문과 한글 모두 검색)
-        youtube_results = []
-        if keyword_en:
-            youtube_results.extend(self.youtube_collector.search(
-                keyword_en, 
-                max_results=Config.MAX_RESULTS_YOUTUBE
-            ))
-        if keyword_ko and keyword_ko != keyword_en:
-            youtube_results.extend(self.youtube_collector.search(
-                keyword_ko,
-                max_results=Config.MAX_RESULTS_YOUTUBE
-            ))
+        Args:
+            keyword_obj: 키워드 객체 (문자열 또는 {en, ko} 딕셔너리)
         
-        # 뉴스 콘텐츠 수집 (영문과 한글 모두 검색)
-        news_results = []
+        Returns:
+            str: 키워드 표시명
+        """
+        return self._resolve_keyword(keyword_obj)[2]
+    
+    def _plan_searches(self, keyword_en, keyword_ko):
+        """
+        키워드에 대해 실행할 검색 목록 생성 (유튜브 → 뉴스, 영문 → 한글 순)
+        
+        Args:
+            keyword_en: 영문 키워드
+            keyword_ko: 한글 키워드
+        
+        Returns:
+            list: (소스, 검색어, 부가 검색 여부) 튜플 리스트
+                  (영문 키워드가 있을 때 한글 검색은 결과가 겹치는 부가 검색)
+        """
+        queries = []
         if keyword_en:
-            news_results.extend(self.news_collector.search(
-                keyword_en,
-                max_results=Config.MAX_RESULTS_NEWS
-            ))
+            queries.append((keyword_en, False))
         if keyword_ko and keyword_ko != keyword_en:
-            news_results.extend(self.news_collector.search(
-                keyword_ko,
-                max_results=Config.MAX_RESULTS_NEWS
-            ))
-        
-        # 중복 제거
-        all_results = youtube_results + news_results
-        unique_results = self.deduplicator.remove_duplicates(all_results)
-
-        # 콘텐츠 ID 생성 + 블랙리스트 필터링
-        filtered_results = []
-        for result in unique_results:
-            title = result.get("title", "")
-            url = result.get("url", "")
-            content_id = generate_content_hash(title, url)
-            result["content_id"] = content_id
-
-            if is_blocked(content_id=content_id, url=url):
+            queries.append((keyword_ko, bool(keyword_en)))
+        
+        return [(source, query, optional) for source in ('youtube', 'naver') for query, optional in queries]
+    
+    def _run_search(self, source, query, since=None, optional=False):
+        """
+        단일 소스 검색 실행
+        쿼터가 부족하면 부가 검색은 생략하고, 일일 한도를 넘는 검색은 None을 반환합니다.
+        
+        Args:
+            source: 'youtube' 또는 'naver'
+            query: 검색어
+            since: 증분 수집 기준 시각 (없으면 전체 기간 검색)
+            optional: 부가 검색 여부 (쿼터 예비분을 남겨야 할 때 생략)
+        
+        Returns:
+            list: 검색 결과 리스트 (쿼터 부족으로 거부되면 None)
+        """
+        if optional and not quota_manager.can_spend(source, SEARCH_COST[source], keep_reserve=True):
+            log.info("쿼터 부족, 부가 검색 생략", source=source, query=query)
+            return []
+        started = time.perf_counter()
+        try:
+            items = self._search_source(source, query, since)
+        except QuotaExceeded as e:
+            log.warning("쿼터 부족으로 검색 거부", source=source, query=query, error=e)
+            UPSTREAM_ERRORS.inc(source=source, kind='quota')
+            return None
+        record_stage(f"search_{source}", started, items_out=len(items))
+        return items
+    
+    def _search_source(self, source, query, since=None):
+        """소스별 수집기 검색 호출"""
+        if source == 'youtube':
+            if since:
+                return self.youtube_collector.search(query, max_results=Config.MAX_RESULTS_YOUTUBE, published_after=since)
+            return self.youtube_collector.search(query, max_results=Config.MAX_RESULTS_YOUTUBE)
+        if since:
+            return self.news_collector.search(query, max_results=Config.MAX_RESULTS_NEWS, since=since)
+        return self.news_collector.search(query, max_results=Config.MAX_RESULTS_NEWS)
+    
+    def _incremental_since(self, keyword_display, previous):
+        """
+        증분 수집 기준 시각 계산
+        이전 결과가 있을 때만 사용하며, 기록된 최신 게시 시각이 없으면 이전 결과에 저장된 기준(high_water_marks)을,
+        그것도 없으면 그 소스는 전체 수집합니다.
+        
+        Args:
+            keyword_display: 키워드 표시명
+            previous: 같은 키워드의 이전 수집 결과 (없으면 None)
+        
+        Returns:
+            dict: 소스별 기준 시각 (증분 수집하지 않으면 빈 딕셔너리)
+        """
+        if not Config.INCREMENTAL_COLLECTION or not previous:
+            return {}
+        
+        marks = {}
+        stored_marks = previous.get('high_water_marks') or {}
+        for source in ('youtube', 'naver'):
+            mark = self.high_water_marks.get((keyword_display, source))
+            if mark is None and stored_marks.get(source):
+                # 재시작 후에는 이전 결과에 기록된 기준 사용 (결과의 콘텐츠에는 태깅으로 추가된
+                # 다른 키워드의 항목이 섞여 있으므로 콘텐츠에서 다시 계산하지 않음)
+                mark = datetime.fromisoformat(stored_marks[source])
+                self.high_water_marks[(keyword_display, source)] = mark
+            if mark is None:
                 continue
-
-            filtered_results.append(result)
+            since = mark - timedelta(minutes=Config.INCREMENTAL_OVERLAP_MINUTES)
+            # 유효 기간보다 오래된 기준은 전체 수집과 동일
+            if datetime.now(timezone.utc) - since < timedelta(hours=Config.DATA_VALID_HOURS):
+                marks[source] = since
+        return marks
+    
+    def _newest_published(self, contents, source):
+        """
+        콘텐츠 목록에서 해당 소스의 최신 게시 시각 반환
         
-        # 각 콘텐츠에 키워드 정보 추가
+        Args:
+            contents: 콘텐츠 리스트
+            source: 'youtube' 또는 'naver'
+        
+        Returns:
+            datetime: 최신 게시 시각 (없으면 None)
+        """
+        newest = max(
+            (content_timestamp(content) for content in contents
+             if SOURCE_BY_TYPE.get(content.get('type')) == source),
+            default=0.0
+        )
+        return datetime.fromtimestamp(newest, timezone.utc) if newest else None
+    
+    @staticmethod
+    def _video_id(content):
+        """영상 콘텐츠의 YouTube 영상 ID (이전 버전에서 저장된 결과는 URL에서 추출)"""
+        if content.get('type') != 'video':
+            return None
+        video_id = content.get('video_id')
+        if not video_id:
+            _, _, video_id = content.get('url', '').partition('watch?v=')
+        return video_id or None
+    
+    def _fetch_video_stats(self, content_lists, cached_only=False):
+        """
+        여러 키워드의 영상 통계를 한 번에 조회 (영상 ID 중복 제거 후 50개씩 묶어 요청)
+        
+        Args:
+            content_lists: 콘텐츠 리스트들 (새 검색 결과와 병합될 이전 결과)
+            cached_only: True이면 API를 호출하지 않고 캐시에 있는 통계만 사용
+        
+        Returns:
+            dict: {video_id: 통계 딕셔너리}
+        """
+        if not Config.YOUTUBE_ENRICH:
+            return {}
+        video_ids = [
+            video_id for contents in content_lists for content in contents or ()
+            for video_id in (self._video_id(content),) if video_id
+        ]
+        if not video_ids:
+            return {}
+        if cached_only:
+            return self.youtube_collector.cached_video_statistics(video_ids)
+        started = time.perf_counter()
+        stats = self.youtube_collector.get_video_statistics(video_ids)
+        record_stage('video_stats', started, items_in=len(video_ids), items_out=len(stats))
+        return stats
+    
+    def _with_video_stats(self, content, video_stats):
+        """통계가 바뀐 영상만 통계를 반영한 사본으로 교체 (이전 결과의 항목은 변경하지 않음)"""
+        stats = video_stats.get(self._video_id(content))
+        if not stats or all(content.get(name) == value for name, value in stats.items()):
+            return content
+        return {**content, **stats}
+    
+    def _merge_results(self, keyword_en, keyword_ko, keyword_display,
+                       youtube_results, news_results, deduplicator, previous_contents=None,
+                       video_stats=None):
+        """
+        검색 결과 병합 (중복 제거, 블랙리스트 필터링, 키워드 정보 추가, 정렬)
+        
+        Args:
+            keyword_en: 영문 키워드
+            keyword_ko: 한글 키워드
+            keyword_display: 표시용 키워드
+            youtube_results: 유튜브 검색 결과 리스트
+            news_results: 뉴스 검색 결과 리스트
+            deduplicator: 사용할 중복 제거기
+            previous_contents: 증분 수집 시 병합할 이전 콘텐츠 리스트
+            video_stats: 영상별 통계 (선택사항, _fetch_video_stats 결과)
+        
+        Returns:
+            dict: 수집된 콘텐츠 딕셔너리
+        """
+        # 콘텐츠 ID 생성 (중복 검사, 전역 인덱스, 블랙리스트에서 공통 사용)
+        started = time.perf_counter()
+        fetched_results = youtube_results + news_results
+        for result in fetched_results:
+            result["content_id"] = generate_content_hash(result.get("title", ""), result.get("url", ""))
+        
+        # 처음 보는 콘텐츠 수 (키워드/수집 주기 전체 기준)
+        new_count = sum(1 for result in fetched_results if self.seen_index.add(result["content_id"]))
+        
+        # 이전 결과에 이미 있는 콘텐츠는 다시 처리하지 않고 이전에 처리된 항목을 그대로 사용
+        reused = []
+        if previous_contents:
+            # 유효 기간이 지난 이전 항목은 제외
+            cutoff = cutoff_timestamp(Config.DATA_VALID_HOURS)
+            reused = [content for content in previous_contents if content_timestamp(content) >= cutoff]
+            known_ids = {content['content_id'] for content in reused}
+            fetched_results = [result for result in fetched_results if result['content_id'] not in known_ids]
+        record_stage('content_id', started, items_in=len(fetched_results) + len(reused), items_out=new_count)
+        
+        # 중복 제거 (새로 받은 항목만)
+        started = time.perf_counter()
+        unique_results = deduplicator.remove_duplicates(fetched_results)
+        record_stage('dedup', started, items_in=len(fetched_results), items_out=len(unique_results))
+        
+        # 블랙리스트 필터링 (인덱스를 한 번만 조회, 이전 항목은 블랙리스트가 바뀌었을 때만 다시 검사)
+        started = time.perf_counter()
+        version = blacklist_version()
+        if reused and self._blacklist_versions.get(keyword_display) != version:
+            reused = filter_blocked(reused)
+        self._blacklist_versions[keyword_display] = version
+        filtered_results = filter_blocked(unique_results)
+        record_stage('blacklist', started, items_in=len(unique_results), items_out=len(filtered_results))
+        
+        # 각 새 콘텐츠에 키워드 정보 추가 (이전 항목은 이미 같은 키워드 정보를 가짐)
         for result in filtered_results:
             result['keyword_en'] = keyword_en
             result['keyword_ko'] = keyword_ko
             result['keyword_display'] = keyword_display
+        filtered_results = reused + filtered_results
+        
+        # 유사 중복 뉴스 묶기 (여러 언론사에 전재된 같은 기사, 이전 대표가 먼저 오므로 대표로 유지)
+        if Config.NEAR_DUP_ENABLED:
+            started = time.perf_counter()
+            items_in = len(filtered_results)
+            filtered_results = self._cluster_near_duplicates(filtered_results)
+            record_stage('near_dedup', started, items_in=items_in, items_out=len(filtered_results))
+        
+        # 영상 조회수/좋아요/댓글 수/길이 반영
+        if video_stats:
+            filtered_results = [self._with_video_stats(content, video_stats) for content in filtered_results]
         
         # 날짜순 정렬 (최신순)
-        filtered_results.sort(
-            key=lambda x: x.get('published_at', ''),
-            reverse=True
-        )
+        started = time.perf_counter()
+        filtered_results.sort(key=newest_first_key, reverse=True)
+        
+        # 다음 증분 수집을 위한 소스별 최신 게시 시각 기록
+        # (이 키워드의 검색이 돌려준 항목만 사용, 태깅으로 다른 키워드에서 가져온 항목이 기준을 앞당기면
+        #  다음 증분 수집에서 이 키워드의 항목을 건너뛰게 됨)
+        searched = youtube_results + news_results
+        high_water_marks = {}
+        for source in ('youtube', 'naver'):
+            newest = self._newest_published(searched, source)
+            mark = self.high_water_marks.get((keyword_display, source))
+            if mark is not None and (newest is None or mark > newest):
+                newest = mark
+            if newest:
+                self.high_water_marks[(keyword_display, source)] = newest
+                high_water_marks[source] = newest.isoformat()
+        
+        record_stage('finalize', started, items_out=len(filtered_results))
+        
+        # version은 태깅 단계(tag_results)에서 태그까지 반영하여 기록
         
         return {
             'keyword': keyword_display,
@@ -120,25 +375,335 @@ class DataCollector:
             'total_count': len(filtered_results),
             'youtube_count': len(youtube_results),
             'news_count': len(news_results),
+            'new_count': new_count,
+            'collected_at': time.time(),
+            'high_water_marks': high_water_marks,
             'contents': filtered_results
         }
     
-    def collect_multiple_keywords(self, keywords):
+    def _cluster_near_duplicates(self, contents):
+        """
+        뉴스 항목 중 유사 중복을 묶어 대표 기사만 남김 (영상은 그대로 유지)
+        
+        Args:
+            contents: 콘텐츠 리스트
+        
+        Returns:
+            list: 유사 중복이 제거된 콘텐츠 리스트 (순서 유지)
+        """
+        news = [content for content in contents if content.get('type') == 'news']
+        kept = {id(content) for content in self.near_deduplicator.cluster(news, fingerprint=self._fingerprint)}
+        return [
+            content for content in contents
+            if content.get('type') != 'news' or id(content) in kept
+        ]
+    
+    def _fingerprint(self, content):
+        """유사 중복 지문 (이미 본 콘텐츠는 전역 인덱스에 기록된 지문을 재사용)"""
+        entry = self.seen_index.get(content.get('content_id'))
+        if entry is None:
+            return content_fingerprint(content)
+        fingerprint = entry.get('fingerprint')
+        if fingerprint is None:
+            fingerprint = entry['fingerprint'] = content_fingerprint(content)
+        return fingerprint
+    
+    def collect_all(self, keyword_obj, previous=None):
+        """
+        키워드에 대한 모든 콘텐츠 수집 (유튜브 + 뉴스)
+        영문과 한글 키워드를 모두 검색합니다.
+        이전 결과가 주어지면 그 이후 게시된 항목만 수집하여 병합합니다 (증분 수집).
+        
+        Args:
+            keyword_obj: 키워드 객체 (문자열 또는 {en, ko} 딕셔너리)
+            previous: 같은 키워드의 이전 수집 결과 (선택사항)
+        
+        Returns:
+            dict: 수집된 콘텐츠 딕셔너리
+        """
+        searched = self._search_keyword(self._plan_keyword(keyword_obj, previous))
+        result = self._merge_searched(searched, self._fetch_searched_stats([searched]))
+        self.tag_results({result['keyword']: result})
+        return result
+    
+    def _get_tagger(self, results):
+        """
+        결과의 키워드를 모두 포함하는 태거
+        캐시된 태거가 이미 모든 키워드를 포함하면 그대로 재사용하고, 아니면 캐시된 키워드와 합쳐 새로 만듭니다.
+        (키워드 하나의 실시간 수집이 전체 수집용 태거를 그 키워드 하나짜리로 바꾸지 않도록)
+        """
+        alias_index = get_alias_index()
+        keywords = {key: (key, result.get('keyword_en', ''), result.get('keyword_ko', ''))
+                    for key, result in results.items()}
+        cached = self._tagger
+        if cached is not None and cached[1] is alias_index:
+            if all(cached[0].get(key) == keyword for key, keyword in keywords.items()):
+                return cached[2]
+            keywords = {**cached[0], **keywords}
+        cached = (keywords, alias_index, ContentTagger(tuple(keywords.values()), alias_index))
+        self._tagger = cached
+        return cached[2]
+    
+    def tag_results(self, results, sources=None):
+        """
+        태깅 단계: 모든 콘텐츠의 제목/설명을 모든 키워드의 별칭과 한 번에 대조하여
+        keywords 필드를 붙이고, 다른 키워드로 수집되었지만 이 키워드를 언급한 콘텐츠를
+        이 키워드의 결과에도 추가합니다.
+        
+        Args:
+            results: 태깅할 키워드별 수집 결과 (제자리에서 갱신)
+            sources: 언급한 콘텐츠를 가져올 다른 키워드의 이미 태깅된 결과 (선택사항)
+        
+        Returns:
+            dict: 이번 태깅의 키워드 → 콘텐츠 ID 리스트 (self.tag_index에는 병합하여 반영)
+        """
+        started = time.perf_counter()
+        tagger = self._get_tagger(results)
+        reverse = {}
+        by_id = {}
+        for key, result in results.items():
+            contents = result.get('contents', [])
+            for tag, content_ids in tagger.tag(contents, own_key=key, seen=self.seen_index.get).items():
+                reverse.setdefault(tag, {}).update(dict.fromkeys(content_ids))
+            for content in contents:
+                by_id.setdefault(content['content_id'], content)
+        # 다른 키워드의 결과는 태그를 다시 계산하지 않고 기록된 keywords 필드를 사용
+        for source_key, source in (sources or {}).items():
+            if source_key in results:
+                continue
+            for content in source.get('contents', []):
+                tags = [tag for tag in content.get('keywords', ()) if tag in results]
+                if tags:
+                    by_id.setdefault(content['content_id'], content)
+                    for tag in tags:
+                        reverse.setdefault(tag, {})[content['content_id']] = None
+        
+        added = 0
+        for key, result in results.items():
+            contents = result.get('contents', [])
+            own_ids = {content['content_id'] for content in contents}
+            extra = [
+                dict(by_id[content_id], keyword_en=result.get('keyword_en'),
+                     keyword_ko=result.get('keyword_ko'), keyword_display=key)
+                for content_id in reverse.get(key, ()) if content_id not in own_ids
+            ]
+            if extra:
+                contents = contents + extra
+                contents.sort(key=newest_first_key, reverse=True)
+                result['contents'] = contents
+                result['total_count'] = len(contents)
+                added += len(extra)
+            result['tagged_count'] = result.get('tagged_count', 0) + len(extra)
+            result['version'] = compute_version(contents)
+        record_stage('tagging', started, items_in=len(by_id), items_out=added)
+        
+        reverse = {tag: list(content_ids) for tag, content_ids in reverse.items()}
+        self._merge_tag_index(reverse)
+        return reverse
+    
+    def _merge_tag_index(self, reverse):
+        """
+        태깅 결과를 키워드 → 콘텐츠 ID 역색인에 병합
+        기존 ID는 전역 인덱스의 유효 기간 안에 있는 것만 유지합니다.
+        
+        Args:
+            reverse: 키워드 → 콘텐츠 ID 리스트
+        """
+        with self._tag_lock:
+            tag_index = dict(self.tag_index)
+            for tag, content_ids in reverse.items():
+                merged = dict.fromkeys(
+                    content_id for content_id in tag_index.get(tag, ()) if content_id in self.seen_index
+                )
+                merged.update(dict.fromkeys(content_ids))
+                tag_index[tag] = list(merged)
+            self.tag_index = tag_index
+    
+    def _plan_keyword(self, keyword_obj, previous=None):
+        """
+        키워드 하나의 검색 계획
+        
+        Args:
+            keyword_obj: 키워드 객체 (문자열 또는 {en, ko} 딕셔너리)
+            previous: 같은 키워드의 이전 수집 결과 (없으면 None)
+        
+        Returns:
+            tuple: (keyword_en, keyword_ko, keyword_display, 검색 목록, 소스별 증분 기준 시각, 이전 결과)
+        """
+        keyword_en, keyword_ko, keyword_display = self._resolve_keyword(keyword_obj)
+        log.debug("키워드 검색", keyword=keyword_display, en=keyword_en, ko=keyword_ko)
+        since = self._incremental_since(keyword_display, previous)
+        return (keyword_en, keyword_ko, keyword_display,
+                self._plan_searches(keyword_en, keyword_ko), since, previous)
+    
+    def _gather_searches(self, plan, outcomes):
+        """
+        검색 결과를 소스별로 모아 병합 입력으로 변환
+        
+        Args:
+            plan: _plan_keyword 결과
+            outcomes: 검색 목록 순서대로의 검색 결과 (쿼터 부족으로 거부된 검색은 None)
+        
+        Returns:
+            tuple: (검색 계획, 유튜브 결과, 뉴스 결과, 병합할 이전 콘텐츠)
+        """
+        searches, since, previous = plan[3:]
+        youtube_results = []
+        news_results = []
+        denied = False
+        for (source, _, _), items in zip(searches, outcomes):
+            if items is None:
+                denied = True
+            elif source == 'youtube':
+                youtube_results.extend(items)
+            else:
+                news_results.extend(items)
+        # 쿼터 부족으로 검색하지 못한 경우에도 이전 결과를 유지
+        previous_contents = previous.get('contents') if previous and (since or denied) else None
+        return plan, youtube_results, news_results, previous_contents
+    
+    def _search_keyword(self, plan):
+        """키워드 하나의 검색을 차례로 실행 (유튜브 → 뉴스, 영문 → 한글 순)"""
+        since = plan[4]
+        return self._gather_searches(plan, [
+            self._run_search(source, query, since.get(source), optional)
+            for source, query, optional in plan[3]
+        ])
+    
+    def _fetch_searched_stats(self, searched, cached_only=False):
+        """검색이 끝난 키워드들의 영상 통계를 한 번에 조회 (키워드 간 겹치는 영상은 한 번만)"""
+        return self._fetch_video_stats(
+            [contents for _, youtube_results, _, previous_contents in searched
+             for contents in (youtube_results, previous_contents)],
+            cached_only=cached_only
+        )
+    
+    def _merge_searched(self, searched, video_stats):
+        """검색 결과 병합 (요청 스레드와 큐 작업 스레드가 동시에 호출할 수 있으므로 호출마다 새 중복 제거기 사용)"""
+        plan, youtube_results, news_results, previous_contents = searched
+        keyword_en, keyword_ko, keyword_display = plan[:3]
+        return self._merge_results(
+            keyword_en, keyword_ko, keyword_display,
+            youtube_results, news_results, Deduplicator(),
+            previous_contents=previous_contents,
+            video_stats=video_stats
+        )
+    
+    def collect_multiple_keywords(self, keywords, concurrent=None, previous=None, on_result=None):
         """
         여러 키워드에 대한 콘텐츠 수집
         
+        키워드마다 검색이 끝나는 즉시 캐시된 영상 통계로 병합하고, 먼저 끝난 키워드와 교차 태깅하여 알립니다.
+        모든 검색이 끝나면 전체 키워드의 영상 통계를 한 번에 조회하고 전체를 다시 태깅한 뒤,
+        나중에 끝난 키워드의 언급이나 새 통계로 내용이 바뀐 키워드만 한 번 더 알립니다.
+        
         Args:
             keywords: 키워드 리스트 (문자열 또는 {en, ko} 딕셔너리)
+            concurrent: 동시 수집 여부 (None이면 Config.CONCURRENT_COLLECTION 사용)
+            previous: 키워드별 이전 수집 결과 (증분 수집용, 선택사항)
+            on_result: 키워드 결과가 준비되거나 바뀔 때마다 (키, 결과)로 호출할 함수 (선택사항)
         
         Returns:
-            dict: 키워드별 수집 결과
+            dict: 키워드별 수집 결과 (키는 키워드 표시명)
         """
-        results = {}
+        if concurrent is None:
+            concurrent = Config.CONCURRENT_COLLECTION
+        
+        previous = previous or {}
+        plans = [self._plan_keyword(keyword, previous.get(self.keyword_key(keyword))) for keyword in keywords]
+        # 전체 키워드를 포함하는 태거를 먼저 만들어 키워드별 태깅에서 재사용
+        self._get_tagger({plan[2]: {'keyword_en': plan[0], 'keyword_ko': plan[1]} for plan in plans})
         
-        for keyword in keywords:
-            result = self.collect_all(keyword)
-            # 키워드 표시명을 키로 사용
-            key = result.get('keyword_display', result.get('keyword', str(keyword)))
+        searched = []
+        results = {}
+        published = {}
+        for entry in self._iter_searches(plans, concurrent):
+            searched.append(entry)
+            result = self._merge_searched(entry, self._fetch_searched_stats([entry], cached_only=True))
+            key = result['keyword']
+            self.tag_results({key: result}, sources=results)
             results[key] = result
+            if on_result:
+                published[key] = result['version']
+                on_result(key, result)
+        
+        # 결과는 검색이 끝난 순서가 아니라 키워드 순서로 반환
+        results = {plan[2]: results[plan[2]] for plan in plans}
+        
+        # 모든 키워드의 영상 통계를 한 번에 조회 (키워드 간 겹치는 영상은 한 번만)
+        video_stats = self._fetch_searched_stats(searched)
+        if video_stats:
+            for result in results.values():
+                result['contents'] = [
+                    self._with_video_stats(content, video_stats) for content in result['contents']
+                ]
+        
+        # 나중에 끝난 키워드가 언급한 콘텐츠까지 반영하고, 바뀐 키워드만 다시 알림
+        self.tag_results(results)
+        if on_result:
+            for key, result in results.items():
+                if result['version'] != published.get(key):
+                    on_result(key, result)
         
         return results
+    
+    def _iter_searches(self, plans, concurrent):
+        """
+        키워드별 검색 결과를 검색이 끝나는 순서대로 생성
+        
+        동시 수집이면 모든 (키워드 × 소스 × 언어) 검색을 소스별 스레드 풀에 먼저 제출하고
+        (소스별 풀 크기가 곧 해당 소스의 동시 요청 수 제한), 키워드의 검색이 모두 끝나는 대로 내보냅니다.
+        
+        Args:
+            plans: _plan_keyword 결과 리스트
+            concurrent: 동시 수집 여부
+        
+        Yields:
+            tuple: _gather_searches 결과
+        """
+        if not concurrent:
+            for plan in plans:
+                yield self._search_keyword(plan)
+            return
+        
+        executors = {
+            source: ThreadPoolExecutor(max_workers=max(1, limit), thread_name_prefix=f"collect-{source}")
+            for source, limit in self.source_concurrency.items()
+        }
+        
+        try:
+            submitted = {}
+            outcomes = []
+            for index, plan in enumerate(plans):
+                searches = plan[3]
+                outcomes.append([None] * len(searches))
+                for position, (source, query, optional) in enumerate(searches):
+                    future = executors[source].submit(self._run_search, source, query, plan[4].get(source), optional)
+                    submitted[future] = (index, position)
+            remaining = [len(plan[3]) for plan in plans]
+            
+            # 검색이 없는 키워드 (키워드가 비어 있는 경우)
+            for index, plan in enumerate(plans):
+                if not remaining[index]:
+                    yield self._gather_searches(plan, [])
+            
+            for future in as_completed(submitted):
+                index, position = submitted[future]
+                source, query, _ = plans[index][3][position]
+                outcomes[index][position] = self._search_outcome(source, query, future)
+                remaining[index] -= 1
+                if not remaining[index]:
+                    yield self._gather_searches(plans[index], outcomes[index])
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=True)
+    
+    @staticmethod
+    def _search_outcome(source, query, future):
+        """동시 검색 결과 (예외는 기록하고 빈 결과로 처리)"""
+        try:
+            return future.result()
+        except Exception as e:
+            log.error("동시 수집 중 오류", source=source, query=query, error=e)
+            UPSTREAM_ERRORS.inc(source=source, kind='exception')
+            return []
@@ -2,6 +2,9 @@
 중복 제거 모듈
 수집된 콘텐츠에서 중복을 제거합니다.
 """
+import threading
+import time
+from collections import OrderedDict
 try:
     from .utils import generate_content_hash
 except ImportError:
@@ -45,7 +48,14 @@ class Deduplicator:
         unique_contents = []
         
         for content in contents:
-            if not self.is_duplicate(content.get('title', ''), content.get('url', '')):
+            # content_id가 이미 있으면 해시를 다시 계산하지 않음
+            content_hash = content.get('content_id')
+            if content_hash:
+                if content_hash in self.seen_hashes:
+                    continue
+                self.seen_hashes.add(content_hash)
+                unique_contents.append(content)
+            elif not self.is_duplicate(content.get('title', ''), content.get('url', '')):
                 unique_contents.append(content)
         
         return unique_contents
@@ -53,3 +63,83 @@ class Deduplicator:
     def clear(self):
         """저장된 해시값 초기화"""
         self.seen_hashes.clear()
+
+class SeenContentIndex:
+    """
+    키워드와 수집 주기에 걸쳐 유지되는 전역 중복 검사 인덱스
+    
+    해시를 시간 버킷별 딕셔너리에 저장하고, TTL이 지난 버킷은 통째로 제거합니다.
+    전체 항목 수가 max_items를 넘으면 가장 오래된 버킷부터 제거하여 메모리를 제한합니다.
+    해시마다 처리 결과 딕셔너리를 두어, 이미 본 콘텐츠는 유사 중복 지문이나 태그 같은
+    단계별 결과를 다시 계산하지 않고 재사용합니다.
+    """
+    
+    def __init__(self, ttl_hours=24, bucket_minutes=60, max_items=200000):
+        self.bucket_seconds = bucket_minutes * 60
+        self.bucket_count = max(1, int(ttl_hours * 60 // bucket_minutes))
+        self.max_items = max_items
+        self.buckets = OrderedDict()  # 버킷 번호 -> {해시: 처리 결과} (오래된 순)
+        self.size = 0
+        self.lock = threading.Lock()
+    
+    def _evict(self, current_bucket):
+        """TTL이 지났거나 용량을 초과한 버킷 제거"""
+        oldest_allowed = current_bucket - self.bucket_count
+        while self.buckets:
+            bucket_id, hashes = next(iter(self.buckets.items()))
+            if bucket_id > oldest_allowed and self.size <= self.max_items:
+                break
+            self.buckets.popitem(last=False)
+            self.size -= len(hashes)
+    
+    def _find(self, content_hash):
+        for entries in self.buckets.values():
+            entry = entries.get(content_hash)
+            if entry is not None:
+                return entry
+        return None
+    
+    def __contains__(self, content_hash):
+        return self.get(content_hash) is not None
+    
+    def get(self, content_hash):
+        """
+        이미 본 콘텐츠의 처리 결과
+        
+        Args:
+            content_hash: 콘텐츠 해시값
+        
+        Returns:
+            dict: 단계별로 재사용할 값을 기록하는 딕셔너리 (처음 보는 해시면 None)
+        """
+        with self.lock:
+            return self._find(content_hash)
+    
+    def __len__(self):
+        return self.size
+    
+    def add(self, content_hash, now=None):
+        """
+        해시를 인덱스에 추가
+        
+        Args:
+            content_hash: 콘텐츠 해시값
+            now: 기준 시각 (epoch 초, 없으면 현재 시각)
+        
+        Returns:
+            bool: 처음 본 해시면 True, 이미 있으면 False
+        """
+        current_bucket = int((now if now is not None else time.time()) // self.bucket_seconds)
+        with self.lock:
+            if self._find(content_hash) is not None:
+                return False
+            self.buckets.setdefault(current_bucket, {})[content_hash] = {}
+            self.size += 1
+            self._evict(current_bucket)
+            return True
+    
+    def clear(self):
+        """저장된 해시값 초기화"""
+        with self.lock:
+            self.buckets.clear()
+            self.size = 0
@@ -0,0 +1,143 @@
+"""
+HTTP 캐시 응답 모듈
+ETag/Last-Modified 조건부 요청(304)과 gzip/brotli 압축 응답을 처리합니다.
+"""
+import gzip
+import hashlib
+from flask import current_app, request
+try:
+    from .config import Config
+except ImportError:
+    from config import Config
+
+# brotli는 선택 의존성 (설치되어 있으면 사용)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+def combine_versions(versions):
+    """
+    여러 버전 값을 하나의 ETag 값으로 결합
+    
+    Args:
+        versions: (키, 버전) 튜플 리스트
+    
+    Returns:
+        str: 결합된 해시값
+    """
+    digest = hashlib.md5()
+    for key, version in versions:
+        digest.update(f"{key}={version};".encode('utf-8'))
+    return digest.hexdigest()
+
+def is_not_modified(etag, last_modified=None):
+    """
+    요청의 If-None-Match / If-Modified-Since 기준으로 변경이 없는지 확인
+    
+    Args:
+        etag: 현재 ETag 값
+        last_modified: 마지막 변경 시각 (epoch 초, 선택사항)
+    
+    Returns:
+        bool: 클라이언트 캐시가 최신이면 True
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains(etag)
+    if last_modified and request.if_modified_since:
+        return int(last_modified) <= request.if_modified_since.timestamp()
+    return False
+
+def choose_encoding():
+    """
+    요청의 Accept-Encoding에서 사용할 압축 방식 선택
+    
+    Returns:
+        str: 'br', 'gzip' 또는 None
+    """
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        return 'br'
+    if accepted['gzip']:
+        return 'gzip'
+    return None
+
+def compress(body, encoding):
+    """
+    응답 본문 압축
+    
+    Args:
+        body: 응답 본문 (bytes)
+        encoding: 'br' 또는 'gzip'
+    
+    Returns:
+        bytes: 압축된 본문
+    """
+    if encoding == 'br':
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+def _not_modified_or_base(etag, last_modified):
+    """
+    캐시 헤더가 설정된 기본 응답 생성 (변경이 없으면 304 응답)
+    
+    Returns:
+        tuple: (응답 객체, 304 여부)
+    """
+    response = current_app.response_class(mimetype='application/json')
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = int(last_modified)
+    response.vary.add('Accept-Encoding')
+    response.cache_control.no_cache = True
+    
+    if is_not_modified(etag, last_modified):
+        response.status_code = 304
+        return response, True
+    return response, False
+
+def conditional_json(payload, etag, last_modified=None):
+    """
+    ETag/Last-Modified를 포함한 JSON 응답 생성
+    클라이언트 캐시가 최신이면 본문 직렬화 없이 304를 반환하고,
+    큰 본문은 클라이언트가 지원하는 방식으로 압축합니다.
+    
+    Args:
+        payload: 응답 데이터
+        etag: ETag 값
+        last_modified: 마지막 변경 시각 (epoch 초, 선택사항)
+    
+    Returns:
+        Response: Flask 응답 객체
+    """
+    response, not_modified = _not_modified_or_base(etag, last_modified)
+    if not_modified:
+        return response
+    
+    body = current_app.json.dumps(payload).encode('utf-8')
+    encoding = choose_encoding() if len(body) >= Config.COMPRESS_MIN_BYTES else None
+    if encoding:
+        body = compress(body, encoding)
+        response.headers['Content-Encoding'] = encoding
+    response.set_data(body)
+    return response
+
+def snapshot_response(snapshot):
+    """
+    미리 직렬화된 스냅샷을 그대로 응답으로 반환 (인코딩/압축 없음)
+    
+    Args:
+        snapshot: ResponseSnapshot 객체
+    
+    Returns:
+        Response: Flask 응답 객체
+    """
+    response, not_modified = _not_modified_or_base(snapshot.etag, snapshot.last_modified)
+    if not_modified:
+        return response
+    
+    body, encoding = snapshot.encoded_body(choose_encoding())
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.set_data(body)
+    return response
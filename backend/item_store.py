@@ -0,0 +1,236 @@
+"""
+공유 콘텐츠 저장소 모듈
+콘텐츠를 content_id별로 한 번만 __slots__ 레코드로 보관하고,
+키워드별 결과는 메타데이터와 최신순 레코드 참조 배열만 가집니다.
+같은 영상/기사가 여러 키워드에 나와도 내용이 같으면 한 벌만 저장되며,
+API 응답용 딕셔너리는 직렬화하거나 페이지를 만들 때만 만듭니다.
+"""
+import sys
+import weakref
+from collections.abc import Mapping
+try:
+    from .utils import compute_version
+except ImportError:
+    from utils import compute_version
+
+# 값 종류가 적어 여러 레코드가 같은 문자열 객체를 공유하도록 intern하는 필드
+INTERNED_FIELDS = frozenset(('type', 'source_type', 'source', 'channel'))
+
+# 키워드마다 다른 필드 (레코드에 저장하지 않고 응답을 만들 때 키워드 결과에서 채움)
+KEYWORD_FIELDS = frozenset(('keyword_en', 'keyword_ko', 'keyword_display'))
+
+class FieldLayout:
+    """필드 이름 순서와 이름 → 위치 (같은 필드 구성의 레코드가 한 벌을 공유)"""
+    
+    __slots__ = ('names', 'positions', 'interned')
+    
+    def __init__(self, names):
+        self.names = names
+        self.positions = {name: position for position, name in enumerate(names)}
+        self.interned = tuple(position for position, name in enumerate(names) if name in INTERNED_FIELDS)
+    
+    def intern_values(self, values):
+        """INTERNED_FIELDS 위치의 문자열 값을 intern한 값 튜플 (새 레코드를 만들 때만 호출)"""
+        if not self.interned:
+            return values
+        values = list(values)
+        for position in self.interned:
+            if type(values[position]) is str:
+                values[position] = sys.intern(values[position])
+        return tuple(values)
+
+_layouts = {}
+
+def _layout(names):
+    """필드 이름 튜플에 대한 공유 레이아웃 (영상/뉴스 등 구성 종류만큼만 생성)"""
+    layout = _layouts.get(names)
+    if layout is None:
+        layout = _layouts.setdefault(names, FieldLayout(names))
+    return layout
+
+def split_content(content):
+    """
+    콘텐츠 딕셔너리를 (필드 이름 튜플, 값 튜플)로 분리 (키워드 필드 제외, 원래 순서 유지)
+    
+    Args:
+        content: 콘텐츠 딕셔너리
+    
+    Returns:
+        tuple: (필드 이름 튜플, 값 튜플)
+    """
+    names = [name for name in content if name not in KEYWORD_FIELDS]
+    return tuple(names), tuple([content[name] for name in names])
+
+class ItemRecord:
+    """
+    콘텐츠 하나 (공유 필드 레이아웃 + 값 튜플, 생성 후 변경하지 않음)
+    
+    응답 딕셔너리는 dict(zip(이름, 값))으로 한 번에 만들고,
+    같은 내용인지 비교할 때도 튜플을 통째로 비교합니다.
+    """
+    
+    __slots__ = ('layout', 'values', '__weakref__')
+    
+    def __init__(self, layout, values):
+        self.layout = layout
+        self.values = values
+    
+    @classmethod
+    def from_content(cls, content):
+        names, values = split_content(content)
+        layout = _layout(names)
+        return cls(layout, layout.intern_values(values))
+    
+    @property
+    def content_id(self):
+        return self.get('content_id')
+    
+    def get(self, name, default=None):
+        position = self.layout.positions.get(name)
+        return default if position is None else self.values[position]
+    
+    def matches(self, content):
+        """콘텐츠 딕셔너리와 내용이 같은지 확인 (키워드 필드 제외)"""
+        names, values = split_content(content)
+        return names == self.layout.names and values == self.values
+    
+    def to_dict(self, keyword_fields=None):
+        """
+        응답용 딕셔너리 생성
+        
+        Args:
+            keyword_fields: 함께 넣을 키워드 필드 (keyword_en, keyword_ko, keyword_display)
+        
+        Returns:
+            dict: 콘텐츠 딕셔너리
+        """
+        content = dict(zip(self.layout.names, self.values))
+        if keyword_fields:
+            content.update(keyword_fields)
+        return content
+
+class ItemStore:
+    """
+    content_id → 레코드 중복 제거 테이블
+    
+    레코드는 키워드 결과가 참조하는 동안만 유지되고(약한 참조), 더 이상 참조하는 결과가 없으면
+    테이블에서 빠집니다. 쓰기는 ContentCache의 잠금 아래에서만 호출됩니다.
+    
+    WeakValueDictionary는 항목마다 파이썬 수준 KeyedRef를 만들어 생성 시간의 상당 부분을 차지하므로
+    C 수준 weakref.ref만 보관하고, 해제 콜백(GC 중 임의 스레드)은 개수만 세어
+    죽은 참조가 절반을 넘으면 쓰기 경로에서 한 번에 정리합니다.
+    """
+    
+    def __init__(self):
+        self._records = {}  # content_id -> weakref.ref(ItemRecord)
+        self._released = 0
+        # 참조마다 바운드 메서드를 새로 만들지 않도록 콜백은 하나만 공유
+        self._release = self._on_release
+    
+    def __len__(self):
+        return sum(1 for ref in list(self._records.values()) if ref() is not None)
+    
+    def _on_release(self, ref):
+        self._released += 1
+    
+    def _purge(self):
+        """해제된 레코드의 참조가 테이블의 절반을 넘으면 정리"""
+        if self._released * 2 <= len(self._records):
+            return
+        self._released = 0
+        self._records = {content_id: ref for content_id, ref in self._records.items() if ref() is not None}
+    
+    def get(self, content_id):
+        ref = self._records.get(content_id)
+        return ref() if ref is not None else None
+    
+    def intern(self, content):
+        """
+        콘텐츠의 공유 레코드 반환
+        같은 content_id의 레코드가 있고 내용이 같으면 그 레코드를, 다르면 새 레코드를 만들어 등록합니다.
+        (이전 레코드는 그것을 참조하는 결과가 교체될 때까지 유지되므로 읽는 쪽은 항상 일관된 내용을 봄)
+        
+        Args:
+            content: 콘텐츠 딕셔너리
+        
+        Returns:
+            ItemRecord: 공유 레코드
+        """
+        content_id = content['content_id']
+        names, values = split_content(content)
+        ref = self._records.get(content_id)
+        record = ref() if ref is not None else None
+        if record is None or record.values != values or record.layout.names != names:
+            layout = _layout(names)
+            record = ItemRecord(layout, layout.intern_values(values))
+            self._records[content_id] = weakref.ref(record, self._release)
+        return record
+    
+    def store_result(self, result):
+        """
+        키워드 수집 결과를 저장소 형식으로 변환
+        
+        Args:
+            result: 수집 결과 딕셔너리 (contents 포함) 또는 StoredResult
+        
+        Returns:
+            StoredResult: 메타데이터 + 레코드 배열
+        """
+        if isinstance(result, StoredResult):
+            return result
+        contents = result.get('contents', [])
+        meta = {name: value for name, value in result.items() if name != 'contents'}
+        if 'version' not in meta:
+            meta['version'] = compute_version(contents)
+        self._purge()
+        return StoredResult(meta, tuple(self.intern(content) for content in contents))
+
+class StoredResult(Mapping):
+    """
+    키워드 하나의 저장된 결과 (읽기 전용)
+    
+    수집 결과 딕셔너리처럼 읽을 수 있으며, 'contents'는 읽을 때마다 레코드에서 새로 만듭니다.
+    """
+    
+    __slots__ = ('meta', 'records')
+    
+    def __init__(self, meta, records):
+        self.meta = meta
+        self.records = records
+    
+    def __getitem__(self, name):
+        if name == 'contents':
+            return self.contents()
+        return self.meta[name]
+    
+    def __iter__(self):
+        yield from self.meta
+        yield 'contents'
+    
+    def __len__(self):
+        return len(self.meta) + 1
+    
+    def __contains__(self, name):
+        return name == 'contents' or name in self.meta
+    
+    @property
+    def content_ids(self):
+        """content_id 리스트 (최신순)"""
+        return [record.content_id for record in self.records]
+    
+    def keyword_fields(self):
+        """콘텐츠마다 붙는 키워드 필드"""
+        return {
+            'keyword_en': self.meta.get('keyword_en', ''),
+            'keyword_ko': self.meta.get('keyword_ko', ''),
+            'keyword_display': self.meta.get('keyword', ''),
+        }
+    
+    def contents(self):
+        """전체 콘텐츠 딕셔너리 리스트 (최신순)"""
+        keyword_fields = self.keyword_fields()
+        return [record.to_dict(keyword_fields) for record in self.records]
+    
+    def to_dict(self):
+        """수집 결과 딕셔너리 (직렬화용)"""
+        return {**self.meta, 'contents': self.contents()}
@@ -1,43 +1,309 @@
 """
 키워드 매핑 모듈
-영문 키워드를 한국어로 매핑합니다.
+영문/한글 아티스트명과 별칭을 서로 변환합니다.
+
+별칭 데이터는 KEYWORD_ALIASES_PATH(JSON)에서 읽어 한 번만 색인합니다.
+정확히 일치하는 조회는 대소문자를 무시하는 해시 맵으로, 부분 일치는
+모든 별칭을 한 번에 찾는 Aho-Corasick 오토마톤으로 처리하며,
+파일이 바뀌면 새 색인을 만든 뒤 참조를 한 번에 교체합니다.
 """
-KEYWORD_MAP = {
-    'BTS': '방탄소년단',
-    'BLACKPINK': '블랙핑크',
-    'BLACK PINK': '블랙핑크',
-    'NewJeans': '뉴진스',
-    'NEW JEANS': '뉴진스',
-    'IVE': '아이브',
-    'LE SSERAFIM': '르세라핌',
-    'LE SERAFIM': '르세라핌',
-    'LESSERAFIM': '르세라핌',
-    'aespa': '에스파',
-    'AESPA': '에스파',
-    'ITZY': '있지',
-    'TWICE': '트와이스',
-    'Red Velvet': '레드벨벳',
-    'RED VELVET': '레드벨벳',
-    'Girls Generation': '소녀시대',
-    'SNSD': '소녀시대',
-    'EXO': '엑소',
-    'NCT': '엔시티',
-    'Stray Kids': '스트레이 키즈',
-    'STRAY KIDS': '스트레이 키즈',
-    'SEVENTEEN': '세븐틴',
-    'GOT7': '갓세븐',
-    'MAMAMOO': '마마무',
-    'IU': '아이유',
-    'TAEYEON': '태연',
-    'Jennie': '제니',
-    'JENNIE': '제니',
-    'Jisoo': '지수',
-    'JISOO': '지수',
-    'Rose': '로제',
-    'ROSE': '로제',
-    'Lisa': '리사',
-    'LISA': '리사',
-}
+import json
+import threading
+import time
+from pathlib import Path
+try:
+    from .config import Config
+    from .log import get_logger
+except ImportError:
+    from config import Config
+    from log import get_logger
+
+log = get_logger('keywords')
+
+# 핫 패스에서 별칭 파일 mtime을 확인하는 최소 간격 (초)
+MTIME_CHECK_INTERVAL = 1.0
+
+_lock = threading.Lock()
+_index = None
+
+def fold(text):
+    """조회용 키 (앞뒤 공백 제거, 연속 공백 하나로, 대소문자 무시)"""
+    return ' '.join(text.split()).casefold()
+
+def has_korean(text):
+    """한글 음절이 포함되어 있는지 확인"""
+    return any('가' <= char <= '힣' for char in text)
+
+def _is_word_char(char):
+    return char.isascii() and char.isalnum()
+
+def _is_hangul(char):
+    return '가' <= char <= '힣'
+
+# 한글 이름 바로 뒤에 붙어도 같은 단어로 보는 조사/어미 ('블랙핑크가', '트와이스에서도')
+KOREAN_PARTICLES = frozenset((
+    '가', '이', '은', '는', '을', '를', '의', '와', '과', '도', '만', '에', '로', '으로',
+    '에게', '에서', '께', '께서', '랑', '이랑', '하고', '까지', '부터', '처럼', '보다', '마저', '조차',
+    '다', '이다', '였다', '이었다', '라', '이라', '라고', '이라고', '며', '이며', '고', '이고', '씨', '측',
+))
+MAX_PARTICLE_RUN = 6
+
+def _is_particle_run(text):
+    """text가 조사/어미를 이어 붙인 것인지 확인 ('에서도' = '에서' + '도')"""
+    if len(text) > MAX_PARTICLE_RUN:
+        return False
+    reachable = [True] + [False] * len(text)
+    for end in range(1, len(text) + 1):
+        reachable[end] = any(
+            reachable[start] and text[start:end] in KOREAN_PARTICLES
+            for start in range(max(0, end - 3), end)
+        )
+    return reachable[-1]
+
+class KeywordEntry:
+    """아티스트 하나의 대표 영문명/한글명과 별칭"""
+    
+    __slots__ = ('en', 'ko', 'aliases', 'ambiguous')
+    
+    def __init__(self, en, ko, aliases=(), ambiguous=()):
+        self.en = en
+        self.ko = ko
+        self.aliases = tuple(aliases)
+        # 일반 단어로도 쓰여 본문 태깅에는 쓰지 않는 이름 ('지수', '있지')
+        self.ambiguous = frozenset(fold(name) for name in ambiguous)
+    
+    def names(self):
+        """조회에 쓰이는 모든 이름 (대표 영문명, 한글명, 별칭)"""
+        return (self.en, self.ko) + self.aliases
+    
+    def as_dict(self):
+        return {'en': self.en, 'ko': self.ko}
+
+class AhoCorasick:
+    """
+    다중 패턴 부분 문자열 검색 오토마톤
+    패턴 수와 관계없이 입력 문자열을 한 번만 훑어 모든 일치 위치를 찾습니다.
+    """
+    
+    def __init__(self, patterns):
+        """
+        Args:
+            patterns: (패턴 문자열, 값) 튜플 반복자
+        """
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        for pattern, value in patterns:
+            if not pattern:
+                continue
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                node = next_node
+            self._out[node] += ((len(pattern), value),)
+        self._build_fail_links()
+    
+    def _build_fail_links(self):
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[child] = fail if fail != child else 0
+                self._out[child] += self._out[self._fail[child]]
+                queue.append(child)
+    
+    def iter_matches(self, text):
+        """
+        text 안의 모든 패턴 일치 위치
+        
+        Yields:
+            tuple: (시작 위치, 끝 위치, 값)
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length, value in out[node]:
+                yield position + 1 - length, position + 1, value
+
+class KeywordMatcher:
+    """
+    이름 목록을 텍스트에서 찾는 매처 (Aho-Corasick + 단어 경계 검사)
+    영문/숫자로 시작하거나 끝나는 이름은 단어 경계에서만 인정합니다 ('IVE'가 'LIVE'에 일치하지 않도록).
+    한글로 시작하는 이름은 앞 글자가 한글이 아니어야 하고('물가지수'의 '지수' 제외),
+    한글로 끝나는 이름 뒤에 이어지는 한글은 조사/어미일 때만 인정합니다('트와이스라이트' 제외, '트와이스가' 인정).
+    """
+    
+    __slots__ = ('_automaton',)
+    
+    def __init__(self, names):
+        """
+        Args:
+            names: (이름, 값) 튜플 반복자 (이름은 fold로 정규화하여 등록)
+        """
+        self._automaton = AhoCorasick((fold(name), value) for name, value in names)
+    
+    def iter_matches(self, folded_text):
+        """
+        fold로 정규화한 텍스트 안의 일치 위치
+        
+        Yields:
+            tuple: (시작 위치, 끝 위치, 값)
+        """
+        text = folded_text
+        for start, end, value in self._automaton.iter_matches(text):
+            if start > 0 and _is_word_char(text[start]) and _is_word_char(text[start - 1]):
+                continue
+            if end < len(text) and _is_word_char(text[end - 1]) and _is_word_char(text[end]):
+                continue
+            if start > 0 and _is_hangul(text[start]) and _is_hangul(text[start - 1]):
+                continue
+            if end < len(text) and _is_hangul(text[end - 1]) and _is_hangul(text[end]):
+                run_end = end
+                while run_end < len(text) and _is_hangul(text[run_end]):
+                    run_end += 1
+                if not _is_particle_run(text[end:run_end]):
+                    continue
+            yield start, end, value
+
+class AliasIndex:
+    """
+    별칭 색인 (한 번 만든 뒤에는 읽기 전용이므로 잠금 없이 여러 스레드에서 조회)
+    """
+    
+    def __init__(self, entries, path=None, mtime=None):
+        self.path = path
+        self.mtime = mtime
+        self.checked_at = time.monotonic()
+        self.entries = tuple(entries)
+        self._by_name = {}
+        for entry in self.entries:
+            for name in entry.names():
+                # 같은 이름이 여러 항목에 있으면 먼저 나온 항목 우선
+                self._by_name.setdefault(fold(name), entry)
+        self._matcher = KeywordMatcher(self._by_name.items())
+    
+    def lookup(self, keyword):
+        """
+        정확히 일치하는 항목 조회 (대소문자/공백 무시)
+        
+        Returns:
+            KeywordEntry: 일치하는 항목 (없으면 None)
+        """
+        return self._by_name.get(fold(keyword))
+    
+    def find(self, text):
+        """
+        text에 포함된 별칭 중 가장 긴 것의 항목 (길이가 같으면 앞쪽)
+        
+        Returns:
+            KeywordEntry: 일치하는 항목 (없으면 None)
+        """
+        best = None
+        for start, end, entry in self._matcher.iter_matches(fold(text)):
+            if best is None or end - start > best[0] or (end - start == best[0] and start < best[1]):
+                best = (end - start, start, entry)
+        return best[2] if best else None
+    
+    def find_all(self, text):
+        """
+        text에 포함된 모든 별칭의 항목 (처음 나온 순서, 중복 없음)
+        
+        Returns:
+            list: KeywordEntry 리스트
+        """
+        found = {}
+        for _, _, entry in self._matcher.iter_matches(fold(text)):
+            found.setdefault(id(entry), entry)
+        return list(found.values())
+
+def load_aliases(path):
+    """
+    별칭 파일 읽기
+    
+    Args:
+        path: JSON 파일 경로 ({"artists": [{"en": ..., "ko": ..., "aliases": [...], "ambiguous": [...]}, ...]})
+    
+    Returns:
+        list: KeywordEntry 리스트
+    
+    Raises:
+        OSError: 파일을 읽을 수 없는 경우
+        ValueError: 형식이 잘못된 경우
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    entries = []
+    for artist in data.get('artists', []):
+        en = str(artist.get('en', '')).strip()
+        ko = str(artist.get('ko', '')).strip() or en
+        if not en:
+            raise ValueError(f"en이 없는 항목: {artist}")
+        aliases = [str(alias).strip() for alias in artist.get('aliases', []) if str(alias).strip()]
+        ambiguous = [str(name).strip() for name in artist.get('ambiguous', []) if str(name).strip()]
+        entries.append(KeywordEntry(en, ko, aliases, ambiguous))
+    return entries
+
+def _file_mtime(path):
+    try:
+        return Path(path).stat().st_mtime_ns
+    except OSError:
+        return None
+
+def _reload_index():
+    global _index
+    path = Config.KEYWORD_ALIASES_PATH
+    mtime = _file_mtime(path)
+    try:
+        entries = load_aliases(path)
+    except (OSError, ValueError) as e:
+        log.warning("키워드 별칭 파일 로드 실패, 기존 색인 유지", path=path, error=e)
+        entries = _index.entries if _index is not None else ()
+    # 새 색인을 모두 만든 뒤 참조만 교체하므로 조회 중인 스레드는 이전 색인을 그대로 사용
+    _index = AliasIndex(entries, path, mtime)
+    return _index
+
+def reload_aliases():
+    """
+    별칭 파일을 다시 읽어 새 색인으로 교체
+    파일이 없거나 잘못되었으면 기존 색인의 항목을 유지합니다.
+    
+    Returns:
+        AliasIndex: 현재 색인
+    """
+    with _lock:
+        return _reload_index()
+
+def get_alias_index():
+    """
+    현재 별칭 색인 (파일이 바뀌었으면 다시 색인)
+    
+    Returns:
+        AliasIndex: 별칭 색인
+    """
+    index = _index
+    if index is not None and index.path == Config.KEYWORD_ALIASES_PATH:
+        if time.monotonic() - index.checked_at < MTIME_CHECK_INTERVAL:
+            return index
+        if _file_mtime(index.path) == index.mtime:
+            index.checked_at = time.monotonic()
+            return index
+    with _lock:
+        index = _index
+        if index is None or index.path != Config.KEYWORD_ALIASES_PATH or _file_mtime(index.path) != index.mtime:
+            index = _reload_index()
+        return index
 
 def get_korean_keyword(keyword):
     """
@@ -49,20 +315,24 @@ def get_korean_keyword(keyword):
     Returns:
         str: 한국어 키워드 (매핑이 없으면 원본 반환)
     """
-    # 대소문자 무시하고 매핑
-    keyword_upper = keyword.upper().strip()
-    
-    # 정확한 매칭
-    if keyword_upper in KEYWORD_MAP:
-        return KEYWORD_MAP[keyword_upper]
+    index = get_alias_index()
+    # 정확한 매칭 후 키워드에 포함된 별칭으로 부분 매칭
+    entry = index.lookup(keyword) or index.find(keyword)
+    return entry.ko if entry else keyword
+
+def canonical_keyword(keyword):
+    """
+    같은 키워드의 다른 표기를 하나로 묶는 키
+    ('bts', 'BTS', '방탄소년단'은 모두 같은 키, 별칭 항목이 없으면 대소문자/공백만 무시)
     
-    # 부분 매칭 시도
-    for en_key, ko_key in KEYWORD_MAP.items():
-        if en_key.upper() in keyword_upper or keyword_upper in en_key.upper():
-            return ko_key
+    Args:
+        keyword: 입력 키워드
     
-    # 매핑이 없으면 원본 반환
-    return keyword
+    Returns:
+        str: 정규 키
+    """
+    entry = get_alias_index().lookup(keyword)
+    return fold(entry.en if entry else keyword)
 
 def normalize_keyword(keyword):
     """
@@ -76,26 +346,10 @@ def normalize_keyword(keyword):
     """
     keyword = keyword.strip()
     
-    # 한글이 포함되어 있는지 확인
-    has_korean = any('\uAC00' <= char <= '\uD7A3' for char in keyword)
-    
-    if has_korean:
-        # 한글 키워드인 경우, 역매핑 시도
-        ko_keyword = keyword
-        # 역매핑 (한글 -> 영문)
-        en_keyword = None
-        for en_key, ko_value in KEYWORD_MAP.items():
-            if ko_value == keyword:
-                en_keyword = en_key
-                break
-        
-        if not en_keyword:
-            # 역매핑이 없으면 영문도 한글과 동일하게 설정
-            en_keyword = keyword
-        
-        return {'en': en_keyword, 'ko': ko_keyword}
+    if has_korean(keyword):
+        # 한글 키워드인 경우 역매핑 (없으면 영문도 한글과 동일하게 설정)
+        entry = get_alias_index().lookup(keyword)
+        return {'en': entry.en if entry else keyword, 'ko': keyword}
     else:
         # 영문 키워드인 경우
-        en_keyword = keyword
-        ko_keyword = get_korean_keyword(keyword)
-        return {'en': en_keyword, 'ko': ko_keyword}
+        return {'en': keyword, 'ko': get_korean_keyword(keyword)}
@@ -0,0 +1,213 @@
+"""
+로그 모듈
+로그 레코드를 큐에 넣기만 하고 별도 스레드가 콘솔에 출력하여, 요청/수집 스레드가 콘솔 출력을 기다리지 않게 합니다.
+레벨 조절, 구조화 필드(keyword, source, duration_ms 등), 요청별 로그 샘플링을 지원합니다.
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import threading
+try:
+    from .config import Config
+    from .metrics import LOG_RECORDS_DROPPED
+except ImportError:
+    from config import Config
+    from metrics import LOG_RECORDS_DROPPED
+
+# 이 서비스의 로거 이름 접두사 (다른 라이브러리 로거와 구분)
+ROOT_LOGGER = 'kpop'
+
+# 큐로 전달할 외부 로거 (werkzeug 요청 로그는 LOG_REQUEST_SAMPLE_RATE로 샘플링)
+SAMPLED_ACCESS_LOGGER = 'werkzeug'
+
+_setup_lock = threading.Lock()
+_listener = None
+
+def _component(record):
+    name = record.name
+    return name[len(ROOT_LOGGER) + 1:] if name.startswith(ROOT_LOGGER + '.') else name
+
+class TextFormatter(logging.Formatter):
+    """'시각 [레벨] 구성요소: 메시지 key=value ...' 형식"""
+    
+    def __init__(self):
+        super().__init__('%(asctime)s [%(levelname)s] %(component)s: %(message)s', '%Y-%m-%d %H:%M:%S')
+    
+    def formatMessage(self, record):
+        record.component = _component(record)
+        line = super().formatMessage(record)
+        fields = getattr(record, 'fields', None)
+        if fields:
+            line += ' ' + ' '.join(f"{name}={value}" for name, value in fields.items())
+        return line
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 JSON 객체 하나 (로그 수집기용)"""
+    
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'logger': _component(record),
+            'message': record.getMessage(),
+        }
+        entry.update(getattr(record, 'fields', None) or {})
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 기다리지 않고 레코드를 버리는 QueueHandler"""
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc()
+    
+    def prepare(self, record):
+        # 메시지 조합과 예외 문자열만 호출 스레드에서 처리하고, 줄 포맷은 출력 스레드에 맡김
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+class _StdoutHandler(logging.StreamHandler):
+    """출력 시점의 sys.stdout에 기록 (stdout 교체/리다이렉트를 따라감)"""
+    
+    def __init__(self):
+        super().__init__()
+    
+    @property
+    def stream(self):
+        return sys.stdout
+    
+    @stream.setter
+    def stream(self, value):
+        pass
+
+class _SampleFilter(logging.Filter):
+    """WARNING 미만 레코드를 rate 비율로만 통과시키는 필터"""
+    
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = rate
+    
+    def filter(self, record):
+        return record.levelno >= logging.WARNING or self.rate >= 1 or random.random() < self.rate
+
+def _parse_level(level):
+    value = logging.getLevelName(str(level).upper())
+    if not isinstance(value, int):
+        raise ValueError(f"알 수 없는 로그 레벨: {level}")
+    return value
+
+def setup_logging():
+    """
+    큐 기반 로그 출력 구성 (여러 번 호출해도 한 번만 구성)
+    
+    Returns:
+        logging.handlers.QueueListener: 출력 스레드
+    """
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            return _listener
+        
+        output = _StdoutHandler()
+        output.setFormatter(JsonFormatter() if Config.LOG_FORMAT == 'json' else TextFormatter())
+        log_queue = queue.Queue(maxsize=max(0, Config.LOG_QUEUE_SIZE))
+        handler = _NonBlockingQueueHandler(log_queue)
+        
+        root = logging.getLogger(ROOT_LOGGER)
+        try:
+            root.setLevel(_parse_level(Config.LOG_LEVEL))
+        except ValueError:
+            root.setLevel(logging.INFO)
+        root.addHandler(handler)
+        root.propagate = False
+        
+        access = logging.getLogger(SAMPLED_ACCESS_LOGGER)
+        access.setLevel(logging.INFO)
+        access.addHandler(handler)
+        access.addFilter(_SampleFilter(Config.LOG_REQUEST_SAMPLE_RATE))
+        access.propagate = False
+        
+        _listener = logging.handlers.QueueListener(log_queue, output)
+        _listener.start()
+        atexit.register(_listener.stop)
+        return _listener
+
+def get_level():
+    """현재 로그 레벨 이름"""
+    return logging.getLevelName(logging.getLogger(ROOT_LOGGER).level)
+
+def set_level(level):
+    """
+    실행 중 로그 레벨 변경
+    
+    Args:
+        level: 'DEBUG', 'INFO', 'WARNING', 'ERROR' 등
+    
+    Raises:
+        ValueError: 알 수 없는 레벨 이름
+    """
+    logging.getLogger(ROOT_LOGGER).setLevel(_parse_level(level))
+
+class StructuredLogger:
+    """
+    구조화 필드를 키워드 인자로 받는 로거
+    
+    log.info("검색 완료", keyword='BTS', source='naver', duration_ms=120)
+    비활성 레벨이면 레코드를 만들지 않고, sample(0~1)을 주면 그 비율만 기록합니다.
+    """
+    
+    __slots__ = ('_logger',)
+    
+    def __init__(self, logger):
+        self._logger = logger
+    
+    def enabled(self, level):
+        return self._logger.isEnabledFor(level)
+    
+    def _log(self, level, message, fields, sample=None, exc_info=False):
+        if not self._logger.isEnabledFor(level):
+            return
+        if sample is not None and sample < 1:
+            if random.random() >= sample:
+                return
+            fields['sample_rate'] = sample
+        self._logger.log(level, message, exc_info=exc_info, extra={'fields': fields})
+    
+    def debug(self, message, sample=None, **fields):
+        self._log(logging.DEBUG, message, fields, sample)
+    
+    def info(self, message, sample=None, **fields):
+        self._log(logging.INFO, message, fields, sample)
+    
+    def warning(self, message, sample=None, **fields):
+        self._log(logging.WARNING, message, fields, sample)
+    
+    def error(self, message, exc_info=False, **fields):
+        self._log(logging.ERROR, message, fields, exc_info=exc_info)
+
+def get_logger(name):
+    """
+    구성요소별 로거 (처음 호출 시 큐 기반 출력 구성)
+    
+    Args:
+        name: 구성요소 이름 (예: 'api', 'naver', 'youtube')
+    
+    Returns:
+        StructuredLogger: 로거
+    """
+    setup_logging()
+    return StructuredLogger(logging.getLogger(f"{ROOT_LOGGER}.{name}"))
@@ -0,0 +1,183 @@
+"""
+수집 파이프라인 지표 모듈
+단계별 소요 시간 히스토그램, 소스별 요청/오류/재시도 횟수, 단계별 입출력 항목 수를
+프로세스 메모리에 모아 두고 Prometheus 텍스트 형식으로 내보냅니다.
+"""
+import bisect
+import threading
+import time
+try:
+    from .config import Config
+except ImportError:
+    from config import Config
+
+# 소요 시간 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(labelnames, values, extra=()):
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Counter:
+    """단조 증가 카운터 (레이블 조합별)"""
+    
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+    
+    def inc(self, amount=1, **labels):
+        if not Config.METRICS_ENABLED:
+            return
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def value(self, **labels):
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        with self._lock:
+            return self._values.get(key, 0)
+    
+    def render(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for key, value in values:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+class Histogram:
+    """누적 버킷 히스토그램 (레이블 조합별 버킷 카운트, 합계, 개수)"""
+    
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        self._values = {}  # 레이블 → [버킷별 개수..., 합계, 개수]
+        self._lock = threading.Lock()
+    
+    def observe(self, value, **labels):
+        if not Config.METRICS_ENABLED:
+            return
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            entry[bisect.bisect_left(self.buckets, value)] += 1
+            entry[-2] += value
+            entry[-1] += 1
+    
+    def count(self, **labels):
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        with self._lock:
+            entry = self._values.get(key)
+            return entry[-1] if entry else 0
+    
+    def render(self):
+        with self._lock:
+            values = sorted((key, list(entry)) for key, entry in self._values.items())
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for key, entry in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets, entry):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, [('le', _format_value(bound))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(entry[-2])}")
+            lines.append(f"{self.name}_count{labels} {entry[-1]}")
+        return lines
+
+class MetricsRegistry:
+    """지표 등록소 (등록 순서대로 내보냄)"""
+    
+    def __init__(self):
+        self._metrics = []
+    
+    def counter(self, name, documentation, labelnames=()):
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+    
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+    
+    def render(self):
+        """
+        Prometheus 텍스트 형식(0.0.4)으로 모든 지표 출력
+        
+        Returns:
+            str: 지표 텍스트
+        """
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+registry = MetricsRegistry()
+
+STAGE_SECONDS = registry.histogram(
+    'collector_stage_seconds', 'Time spent in each collection pipeline stage', ('stage',))
+STAGE_ITEMS = registry.counter(
+    'collector_stage_items_total', 'Items entering and leaving each collection pipeline stage', ('stage', 'direction'))
+UPSTREAM_SECONDS = registry.histogram(
+    'upstream_request_seconds', 'Latency of upstream API requests', ('source', 'endpoint'))
+UPSTREAM_REQUESTS = registry.counter(
+    'upstream_requests_total', 'Upstream API requests by outcome', ('source', 'endpoint', 'outcome'))
+UPSTREAM_RETRIES = registry.counter(
+    'upstream_retries_total', 'Upstream API retries by reason', ('source', 'reason'))
+UPSTREAM_ERRORS = registry.counter(
+    'upstream_errors_total', 'Upstream API failures returned to the collector', ('source', 'kind'))
+HTTP_REQUEST_SECONDS = registry.histogram(
+    'http_request_seconds', 'Flask request latency', ('route', 'method', 'status'))
+LOG_RECORDS_DROPPED = registry.counter(
+    'log_records_dropped_total', 'Log records dropped because the log queue was full')
+
+def record_stage(stage, started, items_in=None, items_out=None):
+    """
+    수집 단계 하나의 소요 시간과 입출력 항목 수 기록
+    
+    Args:
+        stage: 단계 이름 (예: 'dedup')
+        started: 단계 시작 시각 (time.perf_counter 값)
+        items_in: 단계에 들어간 항목 수 (선택사항)
+        items_out: 단계에서 나온 항목 수 (선택사항)
+    """
+    if not Config.METRICS_ENABLED:
+        return
+    STAGE_SECONDS.observe(time.perf_counter() - started, stage=stage)
+    if items_in is not None:
+        STAGE_ITEMS.inc(items_in, stage=stage, direction='in')
+    if items_out is not None:
+        STAGE_ITEMS.inc(items_out, stage=stage, direction='out')
+
+def record_upstream(source, endpoint, started, outcome):
+    """
+    업스트림 API 요청 1회의 소요 시간과 결과 기록
+    
+    Args:
+        source: 'youtube' 또는 'naver'
+        endpoint: API 이름 (예: 'search.list')
+        started: 요청 시작 시각 (time.perf_counter 값)
+        outcome: 'ok' 또는 오류 종류 (예: 'http_429', 'connection')
+    """
+    if not Config.METRICS_ENABLED:
+        return
+    UPSTREAM_SECONDS.observe(time.perf_counter() - started, source=source, endpoint=endpoint)
+    UPSTREAM_REQUESTS.inc(source=source, endpoint=endpoint, outcome=outcome)
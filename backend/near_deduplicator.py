@@ -0,0 +1,178 @@
+"""
+유사 중복 제거 모듈
+SimHash로 제목/설명이 조금씩 다른 동일 기사(통신사 기사 전재 등)를 묶습니다.
+"""
+import hashlib
+import html
+import re
+from functools import lru_cache
+
+FINGERPRINT_BITS = 64
+SHINGLE_SIZE = 3
+DESCRIPTION_CHARS = 200
+
+# 제목 앞뒤의 [단독], (종합) 같은 꼬리표와 문장 부호
+_TAG_PATTERN = re.compile(r'[\[\(【<][^\]\)】>]{0,10}[\]\)】>]')
+_PUNCT_PATTERN = re.compile(r'[^\w\s]')
+_SPACE_PATTERN = re.compile(r'\s+')
+
+def normalize_text(text):
+    """
+    비교용 텍스트 정규화 (HTML 엔티티 해제, 꼬리표/문장 부호 제거, 소문자화)
+    
+    Args:
+        text: 원본 텍스트
+    
+    Returns:
+        str: 정규화된 텍스트
+    """
+    text = html.unescape(text or '')
+    text = _TAG_PATTERN.sub(' ', text)
+    text = _PUNCT_PATTERN.sub(' ', text.lower())
+    return _SPACE_PATTERN.sub(' ', text).strip()
+
+def shingles(text, size=SHINGLE_SIZE):
+    """
+    문자 n-gram 셋 생성 (띄어쓰기 단위가 다른 한국어/영어 모두 처리)
+    
+    Args:
+        text: 정규화된 텍스트
+        size: n-gram 길이
+    
+    Returns:
+        set: n-gram 셋
+    """
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+@lru_cache(maxsize=65536)
+def _hash64(token):
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+
+def simhash(tokens):
+    """
+    토큰 셋의 64비트 SimHash 계산
+    
+    Args:
+        tokens: 토큰 셋
+    
+    Returns:
+        int: 64비트 지문
+    """
+    if not tokens:
+        return 0
+    threshold = len(tokens) / 2
+    bit_strings = [format(_hash64(token), '064b') for token in tokens]
+    fingerprint = 0
+    # 비트 위치별로 1의 개수를 세어 과반이면 1
+    for column in zip(*bit_strings):
+        fingerprint = (fingerprint << 1) | (column.count('1') > threshold)
+    return fingerprint
+
+def content_fingerprint(content):
+    """
+    콘텐츠의 제목 + 설명으로 SimHash 지문 계산
+    
+    Args:
+        content: 콘텐츠 딕셔너리
+    
+    Returns:
+        int: 64비트 지문
+    """
+    text = normalize_text(content.get('title', '')) + ' ' + \
+        normalize_text(content.get('description', '')[:DESCRIPTION_CHARS])
+    return simhash(shingles(text.strip()))
+
+def cluster_ids(content):
+    """
+    콘텐츠가 대표하는 content_id 목록 (자신 포함)
+    
+    Args:
+        content: 콘텐츠 딕셔너리
+    
+    Returns:
+        list: content_id 리스트 (cluster_ids가 없으면 자신의 content_id만, content_id도 없으면 빈 리스트)
+    """
+    ids = content.get('cluster_ids')
+    if ids is not None:
+        return ids
+    content_id = content.get('content_id')
+    return [content_id] if content_id else []
+
+class NearDuplicateDetector:
+    """
+    SimHash 기반 유사 중복 클러스터링 클래스
+    
+    지문을 (max_distance + 1)개 밴드로 나누어 밴드 값이 같은 항목만 비교합니다.
+    해밍 거리가 max_distance 이하인 두 지문은 비둘기집 원리에 의해 최소 한 밴드가
+    같으므로 놓치지 않으며, 각 밴드 버킷에는 클러스터 대표만 저장하여
+    전체 비교 횟수를 항목 수에 비례하도록 유지합니다.
+    """
+    
+    def __init__(self, max_distance=5):
+        self.max_distance = max_distance
+        self.band_count = max_distance + 1
+        self.band_bits = FINGERPRINT_BITS // self.band_count
+        self.band_mask = (1 << self.band_bits) - 1
+    
+    def _bands(self, fingerprint):
+        return [
+            (band, (fingerprint >> (band * self.band_bits)) & self.band_mask)
+            for band in range(self.band_count)
+        ]
+    
+    def cluster(self, contents, fingerprint=content_fingerprint):
+        """
+        유사 중복 항목을 묶어 클러스터별 대표 항목만 반환
+        먼저 나온 항목이 대표가 되며, 대표에는 묶인 항목의 content_id 목록(cluster_ids)과
+        그 개수(cluster_size)가 기록됩니다. 이전 수집의 대표를 다시 넣어도 이미 묶인 항목은
+        중복으로 세지 않으므로 증분 수집 겹침 구간에서 같은 전재 기사가 다시 와도 값이 늘지 않습니다.
+        
+        Args:
+            contents: 콘텐츠 리스트
+            fingerprint: 콘텐츠 → 지문 함수 (기본값 content_fingerprint, 이미 계산한 지문을 재사용할 때 지정)
+        
+        Returns:
+            list: 대표 콘텐츠 리스트 (입력 순서 유지)
+        """
+        buckets = {}  # (밴드 번호, 밴드 값) -> 대표 인덱스 리스트
+        fingerprints = []
+        representatives = []
+        members = []  # 대표별 묶인 content_id (순서 유지 딕셔너리)
+        untracked = []  # 대표별 content_id 없이 묶인 항목 수
+        legacy_sizes = []  # cluster_ids 없이 저장된 이전 결과의 cluster_size
+        
+        for content in contents:
+            content_print = fingerprint(content)
+            bands = self._bands(content_print)
+            
+            match = None
+            for key in bands:
+                for rep_index in buckets.get(key, ()):
+                    if bin(content_print ^ fingerprints[rep_index]).count('1') <= self.max_distance:
+                        match = rep_index
+                        break
+                if match is not None:
+                    break
+            
+            ids = cluster_ids(content)
+            count = 0 if ids else content.get('cluster_size', 1)
+            if match is not None:
+                members[match].update(dict.fromkeys(ids))
+                untracked[match] += count
+                continue
+            
+            rep_index = len(representatives)
+            fingerprints.append(content_print)
+            representatives.append(content)
+            members.append(dict.fromkeys(ids))
+            untracked.append(count)
+            legacy_sizes.append(content.get('cluster_size', 1) if ids and 'cluster_ids' not in content else 0)
+            for key in bands:
+                buckets.setdefault(key, []).append(rep_index)
+        
+        for representative, member_ids, count, legacy_size in zip(representatives, members, untracked, legacy_sizes):
+            representative['cluster_ids'] = list(member_ids)
+            representative['cluster_size'] = max(len(member_ids) + count, legacy_size)
+        return representatives
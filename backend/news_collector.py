@@ -2,14 +2,38 @@
 뉴스 콘텐츠 수집 모듈
 네이버 뉴스 API를 사용하여 연예 뉴스를 수집합니다.
 """
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 try:
-    from .utils import is_within_24_hours, format_datetime
+    from .utils import cutoff_timestamp, parse_timestamp, rfc2822_to_iso
     from .config import Config
+    from .quota import quota_manager, SEARCH_COST, QuotaExceeded
+    from .metrics import record_upstream, UPSTREAM_RETRIES, UPSTREAM_ERRORS
+    from .log import get_logger
 except ImportError:
-    from utils import is_within_24_hours, format_datetime
+    from utils import cutoff_timestamp, parse_timestamp, rfc2822_to_iso
     from config import Config
+    from quota import quota_manager, SEARCH_COST, QuotaExceeded
+    from metrics import record_upstream, UPSTREAM_RETRIES, UPSTREAM_ERRORS
+    from log import get_logger
+
+log = get_logger('naver')
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 일일 호출 한도 초과 오류 코드 (재시도해도 소용없음)
+QUOTA_ERROR_CODE = '010'
+
+# 네이버 검색 API 페이지 제한 (display 최대 100, start 최대 1000)
+MAX_DISPLAY = 100
+MAX_START = 1000
 
 class NewsCollector:
     """뉴스 콘텐츠 수집 클래스"""
@@ -18,93 +42,298 @@ class NewsCollector:
         self.client_id = Config.NAVER_CLIENT_ID
         self.client_secret = Config.NAVER_CLIENT_SECRET
         self.base_url = 'https://openapi.naver.com/v1/search/news.json'
+        self.max_retries = Config.NAVER_MAX_RETRIES
+        self.backoff_base = Config.NAVER_BACKOFF_BASE
+        self.backoff_max = Config.NAVER_BACKOFF_MAX
+        self.session = self._create_session()
+        # 2페이지 이후를 동시에 요청하는 스레드 풀 (첫 검색 시 생성)
+        self._page_executor = None
+        self._page_executor_lock = threading.Lock()
         
         if not self.client_id or not self.client_secret:
-            print("[ERROR] 네이버 API 인증 정보가 설정되지 않았습니다. .env 파일에 NAVER_CLIENT_ID와 NAVER_CLIENT_SECRET을 설정하세요.")
+            log.error("네이버 API 인증 정보가 설정되지 않았습니다. .env 파일에 NAVER_CLIENT_ID와 NAVER_CLIENT_SECRET을 설정하세요.")
         else:
-            print(f"[OK] 네이버 API 초기화 성공 (Client ID 길이: {len(self.client_id)} 문자)")
+            log.info("네이버 API 초기화 성공", client_id_length=len(self.client_id))
     
-    def search(self, keyword, max_results=50):
+    def _create_session(self):
         """
-        키워드로 네이버 뉴스 검색
+        keep-alive 커넥션 풀을 사용하는 HTTP 세션 생성
+        
+        Returns:
+            requests.Session: 인증 헤더가 설정된 세션
+        """
+        session = requests.Session()
+        # 재시도는 _get에서 직접 처리 (Retry-After, 지터 적용)
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=Config.NAVER_POOL_SIZE,
+            max_retries=0
+        )
+        session.mount('https://', adapter)
+        session.headers.update({
+            'X-Naver-Client-Id': self.client_id,
+            'X-Naver-Client-Secret': self.client_secret,
+            'Connection': 'keep-alive'
+        })
+        return session
+    
+    def _retry_delay(self, attempt, response=None):
+        """
+        재시도 대기 시간 계산
+        Retry-After 헤더가 있으면 따르고, 없으면 지수 백오프 + 지터를 적용합니다.
         
         Args:
-            keyword: 검색 키워드
-            max_results: 최대 결과 수
+            attempt: 재시도 횟수 (0부터 시작)
+            response: 마지막 응답 (없으면 None)
         
         Returns:
-            list: 검색 결과 리스트
+            float: 대기 시간 (초)
         """
-        if not self.client_id or not self.client_secret:
-            print("네이버 API 인증 정보가 설정되지 않았습니다.")
-            return []
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), self.backoff_max)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                    return min(max(delay, 0.0), self.backoff_max)
+                except (TypeError, ValueError):
+                    pass
         
-        headers = {
-            'X-Naver-Client-Id': self.client_id,
-            'X-Naver-Client-Secret': self.client_secret
-        }
+        # Full jitter: 0 ~ base * 2^attempt
+        backoff = min(self.backoff_base * (2 ** attempt), self.backoff_max)
+        return random.uniform(0, backoff)
+    
+    def _is_quota_error(self, response):
+        """응답이 일일 호출 한도 초과 오류인지 확인"""
+        try:
+            return response.json().get('errorCode') == QUOTA_ERROR_CODE
+        except ValueError:
+            return False
+    
+    def _get(self, params):
+        """
+        재시도를 포함한 GET 요청
+        429/5xx 응답과 연결 오류는 최대 max_retries번 재시도합니다.
+        호출마다 쿼터를 차감하되(초당 호출 수 제한 포함), 과금되지 않는 429/5xx 응답과
+        연결 실패는 차감한 비용을 되돌립니다.
+        
+        Args:
+            params: 쿼리 파라미터
+        
+        Returns:
+            requests.Response: 성공 응답
+        
+        Raises:
+            requests.exceptions.RequestException: 재시도 후에도 실패한 경우
+            QuotaExceeded: 일일 호출 한도가 부족한 경우
+        """
+        cost = SEARCH_COST['naver']
+        for attempt in range(self.max_retries + 1):
+            quota_manager.acquire('naver', cost)
+            started = time.perf_counter()
+            try:
+                response = self.session.get(self.base_url, params=params, timeout=10)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                reason = 'timeout' if isinstance(e, requests.exceptions.Timeout) else 'connection'
+                record_upstream('naver', 'news', started, reason)
+                # 연결하지 못한 요청은 과금되지 않음 (타임아웃은 서버가 처리했을 수 있으므로 차감 유지)
+                if reason == 'connection':
+                    quota_manager.refund('naver', cost)
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._retry_delay(attempt)
+                log.warning("네이버 API 연결 오류, 재시도", reason=reason, delay_s=round(delay, 1),
+                            attempt=f"{attempt + 1}/{self.max_retries}", error=e)
+                UPSTREAM_RETRIES.inc(source='naver', reason=reason)
+                time.sleep(delay)
+                continue
+            
+            record_upstream('naver', 'news', started,
+                            'ok' if response.ok else f"http_{response.status_code}")
+            
+            if response.status_code == 429 and self._is_quota_error(response):
+                quota_manager.mark_exhausted('naver')
+                response.raise_for_status()
+            
+            if response.status_code in RETRY_STATUS_CODES:
+                quota_manager.refund('naver', cost)
+            
+            if response.status_code in RETRY_STATUS_CODES and attempt < self.max_retries:
+                delay = self._retry_delay(attempt, response)
+                log.warning("네이버 API 오류 응답, 재시도", status=response.status_code, delay_s=round(delay, 1),
+                            attempt=f"{attempt + 1}/{self.max_retries}")
+                UPSTREAM_RETRIES.inc(source='naver', reason=f"http_{response.status_code}")
+                time.sleep(delay)
+                continue
+            
+            response.raise_for_status()
+            return response
+    
+    def _get_page_executor(self):
+        """페이지 요청용 스레드 풀 반환 (모든 검색이 공유하므로 동시 페이지 요청 수가 제한됨)"""
+        with self._page_executor_lock:
+            if self._page_executor is None:
+                self._page_executor = ThreadPoolExecutor(
+                    max_workers=max(1, Config.NAVER_PAGE_CONCURRENCY),
+                    thread_name_prefix='naver-page'
+                )
+            return self._page_executor
+    
+    def _fetch_page(self, keyword, start, display):
+        """
+        검색 결과 한 페이지 요청
+        
+        Args:
+            keyword: 검색 키워드
+            start: 시작 위치 (1부터)
+            display: 페이지 크기
         
+        Returns:
+            tuple: (항목 리스트, 전체 결과 수)
+        """
         params = {
             'query': keyword,
-            'display': min(max_results, 100),  # 네이버 API 최대값은 100
+            'display': display,
             'sort': 'date',
-            'start': 1
+            'start': start
         }
+        data = self._get(params).json()
+        return data.get('items', []), data.get('total', 0)
+    
+    def _parse_items(self, items, keyword, cutoff, since=None):
+        """
+        페이지 항목을 뉴스 데이터로 변환
+        날짜순 정렬이므로 24시간 또는 이미 수집한 구간(since) 밖의 기사에 도달하면 중단합니다.
         
-        try:
-            print(f"[SEARCH] 네이버 뉴스 검색 시작: '{keyword}'")
-            response = requests.get(self.base_url, headers=headers, params=params, timeout=10)
-            response.raise_for_status()
+        Args:
+            items: API 응답 항목 리스트
+            keyword: 검색 키워드 (로그용)
+            cutoff: 24시간 기준 시각 (epoch 초, 검색 시작 시 한 번 계산)
+            since: 증분 수집 기준 시각 (epoch 초, 선택사항)
+        
+        Returns:
+            tuple: (뉴스 데이터 리스트, 경계에 도달했으면 True)
+        """
+        results = []
+        for item in items:
+            pub_date = item.get('pubDate', '')
             
-            data = response.json()
-            items = data.get('items', [])
-            total = data.get('total', 0)
-            print(f"[INFO] 네이버 API 응답: {len(items)}개 항목 (전체: {total}개)")
+            # pubDate 파싱 (예: "Mon, 01 Jan 2024 12:00:00 +0900" → ISO 형식과 epoch 초)
+            published_at = rfc2822_to_iso(pub_date)
+            published_ts = parse_timestamp(published_at) if published_at else None
+            if published_ts is None:
+                # 파싱 실패 시 해당 기사만 제외 (경계 판단에는 사용하지 않음)
+                log.warning("날짜 파싱 실패", pub_date=pub_date)
+                continue
             
-            results = []
-            for item in items:
-                pub_date = item.get('pubDate', '')
-                
-                # pubDate 파싱 (예: "Mon, 01 Jan 2024 12:00:00 +0900")
-                try:
-                    # 네이버 API의 날짜 형식 파싱
-                    published_at = datetime.strptime(pub_date, '%a, %d %b %Y %H:%M:%S %z')
-                except Exception as parse_error:
-                    # 파싱 실패 시 현재 시간으로 설정 (필터링됨)
-                    print(f"[WARNING] 날짜 파싱 실패: {pub_date} - {parse_error}")
-                    published_at = datetime.now() - timedelta(hours=25)
-                
-                # 24시간 이내 확인
-                if is_within_24_hours(published_at):
-                    news_data = {
-                        'title': item.get('title', '').replace('<b>', '').replace('</b>', ''),
-                        'description': item.get('description', '').replace('<b>', '').replace('</b>', ''),
-                        'url': item.get('link', ''),
-                        'thumbnail': '',  # 네이버 뉴스 API는 썸네일을 제공하지 않음
-                        'source': item.get('originallink', ''),
-                        'published_at': published_at.isoformat(),
-                        'published_at_formatted': format_datetime(published_at),
-                        'source_type': 'naver',
-                        'type': 'news'
-                    }
-                    results.append(news_data)
+            # 증분 수집: 날짜순 정렬이므로 이미 수집한 구간에 도달하면 중단
+            if since is not None and published_ts < since:
+                log.debug("이미 수집된 기사 구간 도달, 수집 중단", keyword=keyword)
+                return results, True
             
-            print(f"[OK] 네이버 뉴스 검색 완료: '{keyword}' - {len(results)}개 결과 (24시간 이내)")
-            return results
+            # 24시간 이전 기사에 도달하면 이후 페이지도 모두 범위 밖
+            if published_ts < cutoff:
+                return results, True
             
+            results.append({
+                'title': item.get('title', '').replace('<b>', '').replace('</b>', ''),
+                'description': item.get('description', '').replace('<b>', '').replace('</b>', ''),
+                'url': item.get('link', ''),
+                'thumbnail': '',  # 네이버 뉴스 API는 썸네일을 제공하지 않음
+                'source': item.get('originallink', ''),
+                'published_at': published_at,
+                'published_ts': published_ts,
+                'source_type': 'naver',
+                'type': 'news'
+            })
+        return results, False
+    
+    def search(self, keyword, max_results=100, since=None):
+        """
+        키워드로 네이버 뉴스 검색
+        첫 페이지가 모두 수집 구간 안이면 다음 페이지들을 NAVER_PAGE_CONCURRENCY개씩 동시에 요청하며,
+        24시간(또는 since) 경계를 넘는 페이지에 도달하면 더 요청하지 않습니다.
+        
+        Args:
+            keyword: 검색 키워드
+            max_results: 페이지당 결과 수 (네이버 API 최대값은 100)
+            since: 이 시각 이전 기사에 도달하면 수집 중단 (datetime, 시간대가 없으면 로컬 시각, 없으면 최근 24시간 전체)
+        
+        Returns:
+            list: 검색 결과 리스트
+        
+        Raises:
+            QuotaExceeded: 첫 페이지 요청에 필요한 일일 호출 한도가 부족한 경우
+        """
+        if not self.client_id or not self.client_secret:
+            log.error("네이버 API 인증 정보가 설정되지 않았습니다.")
+            return []
+        
+        display = max(1, min(max_results, MAX_DISPLAY))
+        since = since.astimezone().timestamp() if since else None
+        cutoff = cutoff_timestamp()
+        
+        started = time.perf_counter()
+        try:
+            log.debug("네이버 뉴스 검색 시작", keyword=keyword)
+            items, total = self._fetch_page(keyword, 1, display)
+            log.debug("네이버 API 응답", keyword=keyword, items=len(items), total=total)
+            results, crossed = self._parse_items(items, keyword, cutoff, since)
         except requests.exceptions.HTTPError as e:
-            print(f"[ERROR] 네이버 뉴스 API HTTP 오류: {e.response.status_code} - {e.response.text}")
-            try:
-                error_data = e.response.json()
-                print(f"   오류 상세: {error_data}")
-            except:
-                pass
+            log.error("네이버 뉴스 API HTTP 오류", keyword=keyword, status=e.response.status_code,
+                      body=e.response.text)
+            UPSTREAM_ERRORS.inc(source='naver', kind=f"http_{e.response.status_code}")
             return []
         except requests.exceptions.RequestException as e:
-            print(f"[ERROR] 네이버 뉴스 API 요청 오류: {e}")
+            log.error("네이버 뉴스 API 요청 오류", keyword=keyword, error=e)
+            UPSTREAM_ERRORS.inc(source='naver', kind='request')
             return []
+        except QuotaExceeded:
+            raise
         except Exception as e:
-            print(f"[ERROR] 뉴스 검색 중 오류 발생: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("뉴스 검색 중 오류 발생", keyword=keyword, error=e, exc_info=True)
+            UPSTREAM_ERRORS.inc(source='naver', kind='exception')
             return []
+        
+        # 다음 페이지 시작 위치 (전체 결과 수와 API 제한 안에서)
+        last_start = min(total, MAX_START)
+        starts = list(range(1 + display, last_start + 1, display))[:max(0, Config.NAVER_MAX_PAGES - 1)]
+        if crossed or len(items) < display:
+            starts = []
+        
+        pages = 1
+        seen_urls = {result['url'] for result in results}
+        while starts:
+            wave, starts = starts[:Config.NAVER_PAGE_CONCURRENCY], starts[Config.NAVER_PAGE_CONCURRENCY:]
+            executor = self._get_page_executor()
+            futures = [executor.submit(self._fetch_page, keyword, start, display) for start in wave]
+            for start, future in zip(wave, futures):
+                if crossed:
+                    # 경계를 넘은 뒤 도착한 페이지는 버림 (이미 요청된 경우에만 비용 발생)
+                    future.cancel()
+                    continue
+                try:
+                    page_items, _ = future.result()
+                except Exception as e:
+                    # 이후 페이지가 실패해도 이미 받은 결과는 유지
+                    log.warning("페이지 요청 실패, 페이지 수집 중단", keyword=keyword, start=start, error=e)
+                    UPSTREAM_ERRORS.inc(source='naver', kind='page')
+                    crossed = True
+                    continue
+                pages += 1
+                page_results, crossed = self._parse_items(page_items, keyword, cutoff, since)
+                # 페이지 사이에 새 기사가 올라오면 결과가 밀려 겹칠 수 있음
+                for result in page_results:
+                    if result['url'] not in seen_urls:
+                        seen_urls.add(result['url'])
+                        results.append(result)
+                if len(page_items) < display:
+                    crossed = True
+            if crossed:
+                starts = []
+        
+        log.info("네이버 뉴스 검색 완료", keyword=keyword, source='naver', results=len(results), pages=pages,
+                 duration_ms=round((time.perf_counter() - started) * 1000))
+        return results
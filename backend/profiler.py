@@ -0,0 +1,146 @@
+"""
+샘플링 프로파일러 모듈
+실행 중에 켜고 끌 수 있으며, 켜져 있는 동안 일정 간격으로 모든 스레드의 호출 스택을 수집하여
+스택별 샘플 수를 집계합니다 (flamegraph용 collapsed 형식으로 내보낼 수 있음).
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+try:
+    from .config import Config
+    from .log import get_logger
+except ImportError:
+    from config import Config
+    from log import get_logger
+
+log = get_logger('profiler')
+
+# 스택 하나에 기록할 최대 프레임 수
+MAX_STACK_DEPTH = 64
+# 서로 다른 스택의 최대 개수 (넘으면 새 스택은 '(other)'로 집계)
+MAX_DISTINCT_STACKS = 10000
+
+class SamplingProfiler:
+    """
+    스레드 스택 샘플링 프로파일러
+    
+    sys._current_frames()로 다른 스레드의 현재 프레임을 읽기만 하므로
+    꺼져 있을 때는 비용이 없고, 켜져 있을 때도 대상 코드를 바꾸지 않습니다.
+    """
+    
+    def __init__(self, interval_ms=10):
+        self.interval_ms = interval_ms
+        self._lock = threading.Lock()
+        self._stacks = Counter()
+        self._samples = 0
+        self._started_at = None
+        self._thread = None
+        self._stop = threading.Event()
+    
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self, interval_ms=None):
+        """
+        샘플링 시작 (이미 실행 중이면 간격만 변경)
+        
+        Args:
+            interval_ms: 샘플링 간격 (밀리초, 선택사항)
+        """
+        with self._lock:
+            if interval_ms:
+                self.interval_ms = max(1, int(interval_ms))
+            if self.running:
+                return
+            self._stop.clear()
+            self._started_at = time.time()
+            self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+            self._thread.start()
+        log.info("샘플링 시작", interval_ms=self.interval_ms)
+    
+    def stop(self):
+        """샘플링 중지 (수집한 샘플은 유지)"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+            log.info("샘플링 중지", samples=self._samples)
+    
+    def reset(self):
+        """수집한 샘플 삭제"""
+        with self._lock:
+            self._stacks.clear()
+            self._samples = 0
+            self._started_at = time.time() if self.running else None
+    
+    @staticmethod
+    def _format_frame(frame):
+        code = frame.f_code
+        return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+    
+    def _sample(self, own_ident):
+        stacks = []
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            names = []
+            while frame is not None and len(names) < MAX_STACK_DEPTH:
+                names.append(self._format_frame(frame))
+                frame = frame.f_back
+            stacks.append(';'.join(reversed(names)))
+        with self._lock:
+            for stack in stacks:
+                if stack in self._stacks or len(self._stacks) < MAX_DISTINCT_STACKS:
+                    self._stacks[stack] += 1
+                else:
+                    self._stacks['(other)'] += 1
+            self._samples += 1
+    
+    def _run(self):
+        own_ident = threading.get_ident()
+        while not self._stop.wait(self.interval_ms / 1000):
+            self._sample(own_ident)
+    
+    def collapsed(self):
+        """
+        collapsed 스택 형식 출력 (flamegraph.pl, speedscope 등에서 사용)
+        
+        Returns:
+            str: 한 줄에 '프레임;프레임;... 샘플 수'
+        """
+        with self._lock:
+            lines = [f"{stack} {count}" for stack, count in self._stacks.most_common()]
+        return '\n'.join(lines) + '\n'
+    
+    def report(self, limit=20):
+        """
+        프로파일러 상태와 샘플이 많은 스택/함수 목록
+        
+        Args:
+            limit: 반환할 최대 항목 수
+        
+        Returns:
+            dict: 실행 여부, 간격, 샘플 수, 상위 스택, 상위 함수(스택 맨 위 프레임 기준)
+        """
+        with self._lock:
+            stacks = self._stacks.most_common(limit)
+            leaves = Counter()
+            for stack, count in self._stacks.items():
+                leaves[stack.rsplit(';', 1)[-1]] += count
+            return {
+                'running': self.running,
+                'interval_ms': self.interval_ms,
+                'samples': self._samples,
+                'started_at': self._started_at,
+                'top_stacks': [{'stack': stack, 'samples': count} for stack, count in stacks],
+                'top_functions': [{'function': name, 'samples': count} for name, count in leaves.most_common(limit)],
+            }
+
+# 프로세스 전역 프로파일러 (PROFILER_ENABLED이면 시작 시 바로 샘플링)
+profiler = SamplingProfiler(interval_ms=Config.PROFILER_INTERVAL_MS)
+if Config.PROFILER_ENABLED:
+    profiler.start()
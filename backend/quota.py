@@ -0,0 +1,235 @@
+"""
+API 쿼터 관리 모듈
+소스별 일일 사용량(영구 저장)과 초당 호출 수(토큰 버킷)를 관리합니다.
+수집기는 API를 호출하기 직전에 acquire로 비용을 차감하며,
+일일 한도를 넘는 호출은 QuotaExceeded로 거부됩니다.
+"""
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+try:
+    from .config import Config
+    from .log import get_logger
+except ImportError:
+    from config import Config
+    from log import get_logger
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    ZoneInfo = None
+
+log = get_logger('quota')
+
+# 검색 1회당 비용 (YouTube search.list는 100 유닛, 네이버는 호출 1회)
+SEARCH_COST = {'youtube': 100, 'naver': 1}
+
+# 사용량 저장 최소 간격 (초)
+SAVE_INTERVAL = 5.0
+
+class QuotaExceeded(Exception):
+    """일일 쿼터가 부족하여 API 호출이 거부됨"""
+
+def _reset_timezone(name, fallback_hours):
+    """쿼터 초기화 기준 시간대 (zoneinfo를 쓸 수 없으면 고정 오프셋)"""
+    if ZoneInfo is not None:
+        try:
+            return ZoneInfo(name)
+        except Exception:
+            pass
+    return timezone(timedelta(hours=fallback_hours))
+
+class _SourceQuota:
+    __slots__ = ('daily_limit', 'reset_tz', 'rate', 'tokens', 'tokens_at', 'day', 'used')
+    
+    def __init__(self, daily_limit, reset_tz, rate):
+        self.daily_limit = daily_limit
+        self.reset_tz = reset_tz
+        self.rate = rate
+        self.tokens = max(1.0, rate)
+        self.tokens_at = time.monotonic()
+        self.day = None
+        self.used = 0
+    
+    def today(self):
+        return datetime.now(self.reset_tz).date().isoformat()
+    
+    def resets_at(self):
+        """다음 초기화 시각 (epoch 초)"""
+        now = datetime.now(self.reset_tz)
+        tomorrow = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        return tomorrow.timestamp()
+    
+    @property
+    def remaining(self):
+        return max(0, self.daily_limit - self.used)
+
+class QuotaManager:
+    """
+    소스별 쿼터 관리자
+    
+    일일 사용량은 소스별 초기화 시각(YouTube는 태평양 시간, 네이버는 한국 시간 자정)을 기준으로
+    날짜가 바뀌면 0으로 돌아가며, 재시작해도 유지되도록 파일에 기록합니다.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+        self._saved_at = 0.0
+        self._sources = {
+            'youtube': _SourceQuota(Config.YOUTUBE_DAILY_QUOTA,
+                                    _reset_timezone('America/Los_Angeles', -8),
+                                    Config.YOUTUBE_CALLS_PER_SECOND),
+            'naver': _SourceQuota(Config.NAVER_DAILY_LIMIT,
+                                  _reset_timezone('Asia/Seoul', 9),
+                                  Config.NAVER_CALLS_PER_SECOND),
+        }
+    
+    def _load(self):
+        """저장된 사용량 로드 (lock을 잡은 상태에서 호출)"""
+        self._loaded = True
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        for source, quota in self._sources.items():
+            saved = data.get(source) or {}
+            if saved.get('day') == quota.today():
+                quota.day = saved['day']
+                quota.used = int(saved.get('used', 0))
+    
+    def _save(self):
+        """사용량 기록 (임시 파일에 쓴 뒤 교체, lock을 잡은 상태에서 호출)"""
+        data = {source: {'day': quota.day, 'used': quota.used} for source, quota in self._sources.items()}
+        tmp_path = None
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.quota.', suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+            self._saved_at = time.monotonic()
+        except OSError as e:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            log.warning("쿼터 사용량 저장 실패", error=e)
+    
+    def _quota(self, source):
+        """소스 쿼터 반환 (날짜가 바뀌었으면 사용량 초기화, lock을 잡은 상태에서 호출)"""
+        if not self._loaded:
+            self._load()
+        quota = self._sources[source]
+        today = quota.today()
+        if quota.day != today:
+            quota.day = today
+            quota.used = 0
+        return quota
+    
+    def acquire(self, source, cost=1):
+        """
+        API 호출 1회의 비용을 차감 (초당 호출 수 제한을 넘으면 토큰이 생길 때까지 대기)
+        
+        Args:
+            source: 'youtube' 또는 'naver'
+            cost: 이번 호출의 쿼터 비용
+        
+        Raises:
+            QuotaExceeded: 일일 쿼터가 부족한 경우
+        """
+        with self._lock:
+            quota = self._quota(source)
+            if quota.used + cost > quota.daily_limit:
+                raise QuotaExceeded(f"{source} 일일 쿼터 부족 (사용 {quota.used}/{quota.daily_limit}, 필요 {cost})")
+            quota.used += cost
+            self._dirty = True
+            
+            now = time.monotonic()
+            if quota.rate > 0:
+                quota.tokens = min(max(1.0, quota.rate), quota.tokens + (now - quota.tokens_at) * quota.rate)
+                quota.tokens_at = now
+                quota.tokens -= 1
+                wait = -quota.tokens / quota.rate if quota.tokens < 0 else 0.0
+            else:
+                wait = 0.0
+            
+            if now - self._saved_at >= SAVE_INTERVAL:
+                self._save()
+        if wait > 0:
+            time.sleep(wait)
+    
+    def refund(self, source, cost=1):
+        """
+        과금되지 않은 호출의 비용을 되돌림 (429/5xx 응답, 연결 실패 등)
+        
+        Args:
+            source: 'youtube' 또는 'naver'
+            cost: 되돌릴 쿼터 비용
+        """
+        with self._lock:
+            quota = self._quota(source)
+            quota.used = max(0, quota.used - cost)
+            self._dirty = True
+    
+    def can_spend(self, source, cost, keep_reserve=False):
+        """
+        비용을 쓸 수 있는지 확인 (차감하지 않음)
+        
+        Args:
+            source: 'youtube' 또는 'naver'
+            cost: 예상 비용
+            keep_reserve: True이면 쓴 뒤에도 예비분(QUOTA_RESERVE_RATIO)이 남아야 함
+        
+        Returns:
+            bool: 사용 가능하면 True
+        """
+        with self._lock:
+            quota = self._quota(source)
+            reserve = quota.daily_limit * Config.QUOTA_RESERVE_RATIO if keep_reserve else 0
+            return quota.remaining - cost >= reserve
+    
+    def mark_exhausted(self, source):
+        """API가 쿼터 초과로 응답한 경우 오늘 남은 쿼터를 0으로 기록"""
+        with self._lock:
+            quota = self._quota(source)
+            quota.used = max(quota.used, quota.daily_limit)
+            self._save()
+        log.warning("API 쿼터 소진, 초기화 시각까지 호출 중단", source=source)
+    
+    def flush(self):
+        """기록되지 않은 사용량을 즉시 기록"""
+        with self._lock:
+            if self._dirty:
+                self._save()
+    
+    def status(self):
+        """
+        소스별 쿼터 사용 현황
+        
+        Returns:
+            dict: 소스별 사용량, 한도, 남은 양, 부족 여부, 다음 초기화 시각
+        """
+        with self._lock:
+            result = {}
+            for source in self._sources:
+                quota = self._quota(source)
+                result[source] = {
+                    'used': quota.used,
+                    'limit': quota.daily_limit,
+                    'remaining': quota.remaining,
+                    'low': quota.remaining < quota.daily_limit * Config.QUOTA_RESERVE_RATIO,
+                    'resets_at': quota.resets_at(),
+                }
+            return result
+
+# 프로세스 전역 쿼터 관리자 (종료 시 마지막 사용량 기록)
+quota_manager = QuotaManager(Config.QUOTA_STATE_PATH)
+atexit.register(quota_manager.flush)
@@ -0,0 +1,260 @@
+"""
+적응형 갱신 스케줄러 모듈
+키워드마다 다음 수집 시각을 따로 두고, 힙 기반 타이머 큐에서 가장 먼저 도래하는 키워드부터 수집합니다.
+갱신 주기는 최근 새 항목 수와 조회 빈도로 정하며,
+시간당 수집 예산 안에서 우선순위가 높은 키워드에 먼저 배분합니다.
+"""
+import heapq
+import math
+import threading
+import time
+try:
+    from .config import Config
+    from .log import get_logger
+except ImportError:
+    from config import Config
+    from log import get_logger
+
+log = get_logger('scheduler')
+
+# 조회 수 감쇠 반감기 (초)
+DEMAND_HALF_LIFE_SECONDS = 3600
+# 새 항목 비율 지수이동평균 가중치
+NEW_RATE_SMOOTHING = 0.5
+
+class KeywordSchedule:
+    """키워드 하나의 갱신 일정과 최근 활동 지표"""
+    
+    __slots__ = ('keyword', 'next_due', 'interval', 'new_rate', 'demand', 'demand_at', 'last_collected')
+    
+    def __init__(self, keyword, now, last_collected=None):
+        self.keyword = keyword
+        self.next_due = None
+        self.interval = Config.UPDATE_INTERVAL * 60
+        self.new_rate = 0.0  # 시간당 새 항목 수 (지수이동평균)
+        self.demand = 0.0  # 감쇠된 조회 수
+        self.demand_at = now
+        self.last_collected = last_collected
+    
+    def demand_per_hour(self, now):
+        """감쇠된 조회 수를 시간당 조회 수로 환산"""
+        decayed = self.demand * 0.5 ** ((now - self.demand_at) / DEMAND_HALF_LIFE_SECONDS)
+        return decayed * math.log(2) * 3600 / DEMAND_HALF_LIFE_SECONDS
+    
+    def heat(self, now):
+        """
+        키워드 활성도 (0이면 새 항목도 조회도 없음, 1이면 기준치 수준)
+        """
+        return (self.new_rate / Config.REFRESH_HOT_NEW_PER_HOUR
+                + self.demand_per_hour(now) / Config.REFRESH_HOT_REQUESTS_PER_HOUR)
+
+class RefreshScheduler:
+    """
+    키워드별 갱신 스케줄러
+    
+    (다음 수집 시각, 키) 힙에서 도래한 키워드를 꺼내 수집 작업으로 제출하고,
+    수집이 끝나면 record_collection으로 다음 시각을 다시 넣습니다.
+    일정이 바뀐 키워드의 이전 힙 항목은 꺼낼 때 버립니다.
+    """
+    
+    def __init__(self, submit, key):
+        """
+        Args:
+            submit: 도래한 키워드 리스트를 수집 작업으로 제출하는 함수
+            key: 키워드 객체를 캐시 키로 바꾸는 함수
+        """
+        self._submit = submit
+        self._key = key
+        self._condition = threading.Condition()
+        self._schedules = {}
+        self._heap = []
+        # 일정이 바뀔 때마다 증가 (시간에 따라 감쇠하는 값과 달리 상태가 바뀐 경우만 구분, /api/status의 ETag에 사용)
+        self.version = 0
+        # 시간당 수집 예산 (토큰 버킷, 최대 15분치까지 누적)
+        self._capacity = max(1.0, Config.REFRESH_BUDGET_PER_HOUR / 4)
+        self._tokens = self._capacity
+        self._tokens_at = time.time()
+        self._thread = None
+    
+    def start(self):
+        """스케줄러 스레드 시작"""
+        with self._condition:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='refresh-scheduler', daemon=True)
+                self._thread.start()
+    
+    def set_keywords(self, keywords, collected_at=None):
+        """
+        추적 키워드 목록 갱신 (새 키워드는 일정 추가, 빠진 키워드는 일정 제거)
+        
+        Args:
+            keywords: 추적 키워드 리스트
+            collected_at: 키별 마지막 수집 시각 (선택사항, 새 키워드의 첫 일정 계산용)
+        """
+        collected_at = collected_at or {}
+        with self._condition:
+            now = time.time()
+            by_key = {self._key(keyword): keyword for keyword in keywords}
+            for key in list(self._schedules):
+                if key not in by_key:
+                    del self._schedules[key]
+                    self.version += 1
+            for key, keyword in by_key.items():
+                schedule = self._schedules.get(key)
+                if schedule is not None:
+                    schedule.keyword = keyword
+                    continue
+                last = collected_at.get(key)
+                schedule = KeywordSchedule(keyword, now, last_collected=last)
+                self._schedules[key] = schedule
+                self._push(key, max(now, (last or now) + schedule.interval))
+            self._condition.notify_all()
+    
+    def record_collection(self, key, new_count, collected_at=None):
+        """
+        키워드 수집 결과를 반영하여 다음 수집 시각 계산
+        
+        Args:
+            key: 캐시 키
+            new_count: 이번 수집에서 처음 본 항목 수
+            collected_at: 수집 시각 (선택사항)
+        """
+        with self._condition:
+            schedule = self._schedules.get(key)
+            if schedule is None:
+                return
+            now = collected_at or time.time()
+            if schedule.last_collected:
+                hours = max((now - schedule.last_collected) / 3600, 1 / 60)
+                schedule.new_rate += NEW_RATE_SMOOTHING * (new_count / hours - schedule.new_rate)
+            schedule.last_collected = now
+            schedule.interval = self._interval(schedule, now)
+            self._push(key, now + schedule.interval)
+            self._condition.notify_all()
+    
+    def record_request(self, key):
+        """
+        키워드 조회 기록 (자주 조회되면 다음 수집을 앞당김)
+        
+        Args:
+            key: 캐시 키
+        """
+        with self._condition:
+            schedule = self._schedules.get(key)
+            if schedule is None:
+                return
+            now = time.time()
+            schedule.demand = schedule.demand * 0.5 ** ((now - schedule.demand_at) / DEMAND_HALF_LIFE_SECONDS) + 1
+            schedule.demand_at = now
+            schedule.interval = self._interval(schedule, now)
+            self.version += 1
+            due = max(now, (schedule.last_collected or now) + schedule.interval)
+            if schedule.next_due is not None and due < schedule.next_due:
+                self._push(key, due)
+                self._condition.notify_all()
+    
+    def status(self):
+        """
+        키워드별 갱신 일정
+        
+        Returns:
+            dict: 키별 갱신 주기(분), 다음 수집 시각, 시간당 새 항목 수/조회 수
+        """
+        with self._condition:
+            now = time.time()
+            return {
+                key: {
+                    'interval_minutes': round(schedule.interval / 60, 1),
+                    'next_due': schedule.next_due,
+                    'new_per_hour': round(schedule.new_rate, 2),
+                    'requests_per_hour': round(schedule.demand_per_hour(now), 2),
+                }
+                for key, schedule in self._schedules.items()
+            }
+    
+    def _interval(self, schedule, now):
+        """
+        갱신 주기 계산 (초)
+        활성도 기준 주기와 시간당 예산 중 이 키워드 몫으로 가능한 주기 중 긴 쪽을 사용합니다.
+        """
+        base = Config.UPDATE_INTERVAL * 60
+        if not Config.ADAPTIVE_REFRESH:
+            return base
+        heat = schedule.heat(now)
+        desired = base * 2 / (1 + heat)
+        
+        # 예산을 (1 + 활성도) 비율로 나눈 이 키워드의 시간당 수집 횟수
+        total_weight = sum(1 + other.heat(now) for other in self._schedules.values())
+        share = Config.REFRESH_BUDGET_PER_HOUR * (1 + heat) / total_weight
+        budget_interval = 3600 / share if share > 0 else float('inf')
+        
+        interval = max(desired, budget_interval)
+        return min(max(interval, Config.REFRESH_MIN_INTERVAL * 60), Config.REFRESH_MAX_INTERVAL * 60)
+    
+    def _push(self, key, due):
+        self._schedules[key].next_due = due
+        self.version += 1
+        heapq.heappush(self._heap, (due, key))
+        # 버려진 항목이 쌓이면 힙을 다시 만듦
+        if len(self._heap) > 4 * len(self._schedules) + 16:
+            self._heap = [(s.next_due, k) for k, s in self._schedules.items() if s.next_due is not None]
+            heapq.heapify(self._heap)
+    
+    def _is_current(self, entry):
+        due, key = entry
+        schedule = self._schedules.get(key)
+        return schedule is not None and schedule.next_due == due
+    
+    def _pop_due(self):
+        """다음 수집 시각이 도래한 키 목록을 꺼냄 (도래할 때까지 대기, condition을 잡은 상태에서 호출)"""
+        while True:
+            while self._heap and not self._is_current(self._heap[0]):
+                heapq.heappop(self._heap)
+            now = time.time()
+            if self._heap and self._heap[0][0] <= now:
+                break
+            self._condition.wait(self._heap[0][0] - now if self._heap else None)
+        
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if self._is_current(entry):
+                due.append(entry[1])
+        return due, now
+    
+    def _spend_budget(self, due, now):
+        """
+        예산 안에서 활성도가 높은 키부터 선택하고 나머지는 다음 토큰이 생길 때로 미룸
+        
+        Returns:
+            list: 이번에 수집할 키 리스트
+        """
+        rate = Config.REFRESH_BUDGET_PER_HOUR / 3600
+        self._tokens = min(self._capacity, self._tokens + (now - self._tokens_at) * rate)
+        self._tokens_at = now
+        
+        due.sort(key=lambda key: self._schedules[key].heat(now), reverse=True)
+        count = min(len(due), int(self._tokens))
+        selected, deferred = due[:count], due[count:]
+        self._tokens -= count
+        
+        retry_at = now + (1 - self._tokens) / rate if rate > 0 else now + Config.REFRESH_MAX_INTERVAL * 60
+        for key in deferred:
+            self._push(key, retry_at)
+        # 수집이 실패해도 일정이 사라지지 않도록 임시 다음 시각을 넣어 둠 (수집이 끝나면 다시 계산)
+        for key in selected:
+            self._push(key, now + self._schedules[key].interval)
+        return selected
+    
+    def _run(self):
+        while True:
+            with self._condition:
+                due, now = self._pop_due()
+                selected = self._spend_budget(due, now)
+                keywords = [self._schedules[key].keyword for key in selected]
+            if keywords:
+                log.info("갱신 시각 도래", keywords=selected)
+                try:
+                    self._submit(keywords)
+                except Exception as e:
+                    log.error("갱신 작업 제출 실패", error=e)
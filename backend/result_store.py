@@ -0,0 +1,137 @@
+"""
+수집 결과 영구 저장 모듈
+키워드별 수집 결과를 수집 시각과 함께 SQLite에 저장하여,
+서버를 재시작해도 유효 기간 안의 결과를 다시 수집하지 않고 바로 제공할 수 있게 합니다.
+"""
+import json
+import sqlite3
+import threading
+import time
+try:
+    from .config import Config
+except ImportError:
+    from config import Config
+
+RESULT_STORE_PATH = Config.RESULT_STORE_PATH
+
+# 저장할 때 이보다 오래된 결과는 삭제 (수집 결과의 유효 기간과 동일)
+RESULT_MAX_AGE_SECONDS = Config.DATA_VALID_HOURS * 3600
+
+_lock = threading.Lock()
+_initialized = False
+
+def _connect():
+    global _initialized
+    RESULT_STORE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(RESULT_STORE_PATH), timeout=10)
+    if not _initialized:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " keyword TEXT PRIMARY KEY,"
+            " collected_at REAL NOT NULL,"
+            " payload TEXT NOT NULL)"
+        )
+        conn.commit()
+        _initialized = True
+    return conn
+
+def _query(query, params=()):
+    """조회 쿼리 실행 (모든 행 반환)"""
+    with _lock:
+        conn = _connect()
+        try:
+            return conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+
+def save_result(keyword, result, collected_at=None):
+    """
+    키워드 수집 결과 저장 (같은 키워드의 이전 결과는 교체)
+    유효 기간이 지난 다른 키워드의 결과도 함께 삭제합니다.
+    
+    Args:
+        keyword: 키워드 (캐시 키)
+        result: 수집 결과 딕셔너리
+        collected_at: 수집 시각 (epoch 초, 없으면 결과의 collected_at 또는 현재 시각)
+    """
+    if collected_at is None:
+        collected_at = result.get("collected_at") or time.time()
+    payload = json.dumps(result, ensure_ascii=False)
+    with _lock:
+        conn = _connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO results (keyword, collected_at, payload) VALUES (?, ?, ?)",
+                (keyword, collected_at, payload),
+            )
+            conn.execute(
+                "DELETE FROM results WHERE collected_at < ?",
+                (time.time() - RESULT_MAX_AGE_SECONDS,),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+def load_result(keyword, max_age_seconds=None):
+    """
+    키워드 하나의 저장된 수집 결과 조회
+    
+    Args:
+        keyword: 키워드 (캐시 키)
+        max_age_seconds: 이보다 오래된 결과는 무시 (선택사항)
+    
+    Returns:
+        dict: 수집 결과 (없거나 오래되었으면 None)
+    """
+    rows = _query("SELECT collected_at, payload FROM results WHERE keyword = ?", (keyword,))
+    if not rows:
+        return None
+    collected_at, payload = rows[0]
+    if max_age_seconds is not None and time.time() - collected_at > max_age_seconds:
+        return None
+    return json.loads(payload)
+
+def stored_keywords(max_age_seconds=None):
+    """
+    저장된 키워드와 수집 시각 조회 (결과 본문은 읽지 않음)
+    
+    Args:
+        max_age_seconds: 이보다 오래된 결과는 제외 (선택사항)
+    
+    Returns:
+        dict: {키워드: 수집 시각}
+    """
+    query = "SELECT keyword, collected_at FROM results"
+    params = ()
+    if max_age_seconds is not None:
+        query += " WHERE collected_at >= ?"
+        params = (time.time() - max_age_seconds,)
+    return dict(_query(query, params))
+
+def load_results(max_age_seconds=None, keywords=None):
+    """
+    저장된 수집 결과 여러 개 조회
+    
+    Args:
+        max_age_seconds: 이보다 오래된 결과는 제외 (선택사항)
+        keywords: 조회할 키워드 목록 (없으면 전체)
+    
+    Returns:
+        dict: 키워드별 수집 결과
+    """
+    conditions = []
+    params = []
+    if max_age_seconds is not None:
+        conditions.append("collected_at >= ?")
+        params.append(time.time() - max_age_seconds)
+    if keywords is not None:
+        keywords = list(keywords)
+        if not keywords:
+            return {}
+        conditions.append(f"keyword IN ({','.join('?' * len(keywords))})")
+        params.extend(keywords)
+    query = "SELECT keyword, payload FROM results"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    return {keyword: json.loads(payload) for keyword, payload in _query(query, params)}
@@ -0,0 +1,78 @@
+"""
+단일 실행(single-flight) 모듈
+같은 키에 대한 작업이 동시에 여러 번 요청되면 하나만 실행하고
+나머지 요청은 그 결과를 함께 기다리도록 묶습니다.
+"""
+import threading
+from concurrent.futures import Future
+
+class SingleFlight:
+    """
+    키별 진행 중 작업 묶음
+    
+    작업이 끝나면 키를 비우므로 이후 요청은 새로 실행됩니다
+    (결과 캐싱은 호출하는 쪽에서 담당).
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+    
+    def _join(self, key):
+        """
+        진행 중인 작업의 Future를 반환하고, 없으면 새로 등록
+        
+        Returns:
+            tuple: (Future, 새로 등록되어 이 호출자가 실행해야 하면 True)
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._calls[key] = future
+            return future, True
+    
+    def _run(self, key, future, fn, args):
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+    
+    def do(self, key, fn, *args):
+        """
+        작업을 실행하고 결과 반환 (같은 키의 작업이 진행 중이면 그 결과를 기다림)
+        
+        Args:
+            key: 작업 키
+            fn: 실행할 함수
+            *args: fn 인자
+        
+        Returns:
+            fn의 반환값 (fn이 예외를 던지면 기다리던 모든 호출자에게 같은 예외 발생)
+        """
+        future, leader = self._join(key)
+        if leader:
+            self._run(key, future, fn, args)
+        return future.result()
+    
+    def start(self, key, fn, *args):
+        """
+        작업을 백그라운드 스레드에서 시작하고 바로 Future 반환
+        (같은 키의 작업이 진행 중이면 그 Future 반환)
+        
+        Args:
+            key: 작업 키
+            fn: 실행할 함수
+            *args: fn 인자
+        
+        Returns:
+            Future: 작업 결과
+        """
+        future, leader = self._join(key)
+        if leader:
+            threading.Thread(target=self._run, args=(key, future, fn, args), daemon=True).start()
+        return future
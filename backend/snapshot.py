@@ -0,0 +1,184 @@
+"""
+응답 스냅샷 모듈
+수집이 끝날 때 /api/content 응답 본문을 미리 직렬화(및 압축)해 두고,
+요청마다 다시 인코딩하지 않고 그대로 제공합니다.
+"""
+import gzip
+import json
+import time
+from array import array
+try:
+    from .config import Config
+    from .http_cache import combine_versions
+    from .content_index import KeywordIndex
+    from .metrics import record_stage
+except ImportError:
+    from config import Config
+    from http_cache import combine_versions
+    from content_index import KeywordIndex
+    from metrics import record_stage
+
+# 빠른 JSON 인코더는 선택 의존성 (설치되어 있으면 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# brotli는 선택 의존성 (설치되어 있으면 사용)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+def encode_json(payload):
+    """
+    JSON 바이트로 인코딩 (키 정렬, orjson이 있으면 사용)
+    
+    Args:
+        payload: 인코딩할 데이터
+    
+    Returns:
+        bytes: JSON 본문
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+# 메타데이터만 인코딩한 본문에서 콘텐츠 배열이 들어갈 자리 (키가 정렬되므로 최상위에 한 번만 나옴)
+_EMPTY_CONTENTS = b'"contents":[]'
+
+class ContentLayout:
+    """키워드 본문 안에서 각 콘텐츠가 인코딩된 위치 (다음 스냅샷에서 바뀌지 않은 항목의 바이트를 재사용)"""
+    
+    __slots__ = ('records', 'keyword_fields', 'starts')
+    
+    def __init__(self, records, keyword_fields, starts):
+        self.records = records
+        self.keyword_fields = keyword_fields
+        # 항목 i는 body[starts[i]:starts[i + 1] - 1] (뒤따르는 쉼표 또는 ']' 한 바이트 제외)
+        self.starts = starts
+
+def encode_result(result, previous=None):
+    """
+    키워드 결과 본문 인코딩 (encode_json(result.to_dict())와 같은 바이트)
+    이전 스냅샷에 같은 레코드가 있으면 그 항목의 인코딩된 바이트를 그대로 잘라 쓰고 새 레코드만 인코딩합니다.
+    
+    Args:
+        result: 키워드 수집 결과 (StoredResult)
+        previous: 같은 키워드의 이전 ResponseSnapshot (선택사항)
+    
+    Returns:
+        tuple: (본문, ContentLayout, 새로 인코딩한 항목 수)
+    """
+    keyword_fields = result.keyword_fields()
+    layout = previous.layout if previous is not None else None
+    old_positions = {}
+    if layout is not None and layout.keyword_fields == keyword_fields:
+        old_positions = {record: index for index, record in enumerate(layout.records)}
+        old_body = memoryview(previous.body)
+        old_starts = layout.starts
+    
+    head, tail = encode_json({**result.meta, 'contents': []}).split(_EMPTY_CONTENTS, 1)
+    parts = [head, b'"contents":[']
+    offset = len(head) + len(parts[1])
+    starts = array('q')
+    encoded = 0
+    for record in result.records:
+        index = old_positions.get(record)
+        if index is not None:
+            item = old_body[old_starts[index]:old_starts[index + 1] - 1]
+        else:
+            item = encode_json(record.to_dict(keyword_fields))
+            encoded += 1
+        starts.append(offset)
+        parts.append(item)
+        parts.append(b',')
+        offset += len(item) + 1
+    if result.records:
+        parts.pop()
+    starts.append(offset)
+    parts.append(b']')
+    parts.append(tail)
+    return b''.join(parts), ContentLayout(result.records, keyword_fields, starts), encoded
+
+class ResponseSnapshot:
+    """미리 직렬화된 불변 응답 (본문 + 압축 본문 + ETag)"""
+    
+    __slots__ = ('body', 'gzip_body', 'br_body', 'etag', 'last_modified', 'layout')
+    
+    def __init__(self, body, etag, last_modified=None, layout=None):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.layout = layout
+        self.gzip_body = None
+        self.br_body = None
+        if len(body) >= Config.COMPRESS_MIN_BYTES:
+            self.gzip_body = gzip.compress(body, compresslevel=6)
+            if brotli is not None:
+                self.br_body = brotli.compress(body, quality=5)
+    
+    def encoded_body(self, encoding):
+        """
+        요청한 압축 방식의 본문 반환
+        
+        Args:
+            encoding: 'br', 'gzip' 또는 None
+        
+        Returns:
+            tuple: (본문, 실제 적용된 압축 방식)
+        """
+        if encoding == 'br' and self.br_body is not None:
+            return self.br_body, 'br'
+        if encoding in ('br', 'gzip') and self.gzip_body is not None:
+            return self.gzip_body, 'gzip'
+        return self.body, None
+
+class SnapshotSet:
+    """전체 키워드 스냅샷, 키워드별 스냅샷, 키워드별 조회 인덱스 묶음"""
+    
+    __slots__ = ('all', 'keywords', 'indexes')
+    
+    def __init__(self, all_snapshot, keyword_snapshots, indexes):
+        self.all = all_snapshot
+        self.keywords = keyword_snapshots
+        self.indexes = indexes
+
+def build_snapshots(data, previous=None):
+    """
+    수집 결과 전체에 대한 스냅샷과 조회 인덱스 생성
+    버전이 바뀌지 않은 키워드는 이전 스냅샷을 재사용하고, 바뀐 키워드도 이전 스냅샷에 있던
+    레코드는 다시 인코딩하지 않으며, 전체 응답은 키워드별 본문을 이어 붙여 만듭니다.
+    
+    Args:
+        data: 키워드별 수집 결과 딕셔너리 (StoredResult)
+        previous: 이전 SnapshotSet (선택사항)
+    
+    Returns:
+        SnapshotSet: 새 스냅샷 묶음
+    """
+    started = time.perf_counter()
+    encoded = 0
+    keyword_snapshots = {}
+    indexes = {}
+    for key in sorted(data):
+        result = data[key]
+        version = result['version']
+        old = previous.keywords.get(key) if previous else None
+        if old is not None and old.etag == version and old.last_modified == result.get('collected_at'):
+            keyword_snapshots[key] = old
+            indexes[key] = previous.indexes[key]
+        else:
+            body, layout, _ = encode_result(result, old)
+            keyword_snapshots[key] = ResponseSnapshot(body, version, result.get('collected_at'), layout)
+            indexes[key] = KeywordIndex(result)
+            encoded += 1
+    
+    parts = [encode_json(key) + b':' + snapshot.body for key, snapshot in keyword_snapshots.items()]
+    all_body = b'{' + b','.join(parts) + b'}'
+    all_etag = combine_versions((key, snapshot.etag) for key, snapshot in keyword_snapshots.items())
+    last_modified = max((s.last_modified or 0 for s in keyword_snapshots.values()), default=0) or None
+    # 키워드 수 대비 다시 인코딩한 키워드 수
+    record_stage('snapshot', started, items_in=len(data), items_out=encoded)
+    
+    return SnapshotSet(ResponseSnapshot(all_body, all_etag, last_modified), keyword_snapshots, indexes)
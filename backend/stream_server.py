@@ -0,0 +1,299 @@
+"""
+업데이트 스트림 서버 모듈
+/api/stream(SSE)과 /api/updates(롱폴링) 연결을 asyncio 이벤트 루프 스레드 하나에서 처리합니다.
+연결마다 서버 스레드를 점유하지 않으므로 클라이언트가 늘어도 스레드 수는 그대로이며,
+UpdateBroker에 이벤트가 발행되면 루프의 공유 이벤트 하나로 기다리던 모든 연결을 깨웁니다.
+"""
+import asyncio
+import threading
+from urllib.parse import parse_qs, urlsplit
+try:
+    from .log import get_logger
+    from .snapshot import encode_json
+except ImportError:
+    from log import get_logger
+    from snapshot import encode_json
+
+log = get_logger('stream')
+
+# 요청 줄과 헤더의 최대 크기 / 읽기 제한 시간 (초)
+MAX_REQUEST_BYTES = 16 * 1024
+REQUEST_TIMEOUT_SECONDS = 10
+
+# 여러 연결에 같은 이벤트를 쓸 때 한 번만 직렬화하도록 보관할 이벤트 수
+ENCODED_CACHE_SIZE = 512
+
+CORS_HEADERS = (
+    ('Access-Control-Allow-Origin', '*'),
+    ('Access-Control-Allow-Headers', 'Last-Event-ID, Cache-Control'),
+    ('Access-Control-Allow-Methods', 'GET, OPTIONS'),
+)
+
+def parse_seq(value, latest_seq):
+    """
+    클라이언트가 마지막으로 받은 이벤트 순번 파싱
+    
+    Args:
+        value: since 파라미터 또는 Last-Event-ID 헤더 값
+        latest_seq: 값이 없을 때 사용할 현재 최신 순번
+    
+    Returns:
+        int: 이벤트 순번
+    
+    Raises:
+        ValueError: 순번 형식이 잘못된 경우
+    """
+    if value in (None, ''):
+        return latest_seq
+    try:
+        seq = int(value)
+    except ValueError:
+        raise ValueError('since는 이벤트 순번(정수)이어야 합니다')
+    if seq < 0:
+        raise ValueError('since는 이벤트 순번(정수)이어야 합니다')
+    return seq
+
+def parse_timeout(value, max_seconds):
+    """
+    롱폴링 대기 시간 파싱 (0 ~ max_seconds)
+    
+    Raises:
+        ValueError: 숫자가 아닌 경우
+    """
+    try:
+        timeout = float(max_seconds if value in (None, '') else value)
+    except ValueError:
+        raise ValueError('timeout은 숫자(초)여야 합니다')
+    return min(max(timeout, 0), max_seconds)
+
+def format_sse(event):
+    """업데이트 이벤트를 SSE 메시지 형식으로 변환"""
+    data = encode_json(event['data']).decode('utf-8')
+    return f"id: {event['seq']}\nevent: {event['type']}\ndata: {data}\n\n"
+
+class StreamServer:
+    """
+    업데이트 이벤트 전달 서버 (asyncio 이벤트 루프 스레드 하나)
+    
+    연결마다 코루틴 하나만 두고, 브로커에 이벤트가 발행되면 공유 asyncio.Event를 깨워
+    기다리던 연결이 각자의 순번 이후 이벤트를 씁니다. 직렬화는 이벤트마다 한 번만 합니다.
+    """
+    
+    def __init__(self, broker, max_clients, heartbeat_seconds, long_poll_max_seconds):
+        """
+        Args:
+            broker: 이벤트를 가져올 UpdateBroker
+            max_clients: 동시 SSE 연결 수 상한 (넘으면 503으로 롱폴링 안내)
+            heartbeat_seconds: 이벤트가 없을 때 연결 유지 주석을 보내는 간격 (초)
+            long_poll_max_seconds: 롱폴링 최대 대기 시간 (초)
+        """
+        self.broker = broker
+        self.max_clients = max(1, max_clients)
+        self.heartbeat_seconds = heartbeat_seconds
+        self.long_poll_max_seconds = long_poll_max_seconds
+        self.port = None
+        self.clients = 0
+        self._loop = None
+        self._changed = None
+        self._encoded = {}
+        broker.add_listener(self._on_publish)
+    
+    @property
+    def running(self):
+        return self._loop is not None
+    
+    def status(self):
+        """스트림 서버 상태 (사용 여부, 포트, 연결된 SSE 클라이언트 수)"""
+        return {'evented': self.running, 'port': self.port, 'clients': self.clients}
+    
+    def start(self, host, port, timeout=5):
+        """
+        이벤트 루프 스레드에서 서버 시작
+        
+        Args:
+            host: 수신 주소
+            port: 수신 포트 (0이면 임의 포트)
+            timeout: 시작을 기다릴 최대 시간 (초)
+        
+        Returns:
+            bool: 수신을 시작했으면 True (포트를 열 수 없으면 False)
+        """
+        ready = threading.Event()
+        
+        def run():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                server = loop.run_until_complete(
+                    asyncio.start_server(self._handle, host, port, limit=MAX_REQUEST_BYTES)
+                )
+            except OSError as e:
+                log.warning("스트림 서버 시작 실패, 롱폴링만 사용", host=host, port=port, error=e)
+                loop.close()
+                ready.set()
+                return
+            self._changed = asyncio.Event()
+            self.port = server.sockets[0].getsockname()[1]
+            self._loop = loop
+            ready.set()
+            log.info("스트림 서버 시작", host=host, port=self.port)
+            loop.run_forever()
+        
+        threading.Thread(target=run, name='stream-server', daemon=True).start()
+        ready.wait(timeout)
+        return self.running
+    
+    def _on_publish(self, seq):
+        """브로커 발행 리스너 (발행한 스레드에서 호출, 루프에 깨우기만 예약)"""
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._wake)
+    
+    def _wake(self):
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+    
+    async def _next_events(self, seq, timeout, closed=None):
+        """
+        seq 이후의 이벤트 (없으면 발행될 때까지 최대 timeout초 대기)
+        
+        Args:
+            seq: 클라이언트가 마지막으로 받은 이벤트 순번
+            timeout: 최대 대기 시간 (초)
+            closed: 클라이언트 연결이 끊기면 끝나는 태스크 (선택사항, 끝나면 기다리지 않고 반환)
+        
+        Returns:
+            list: 새 이벤트 리스트 (시간 초과 시 빈 리스트)
+        """
+        # 이벤트를 확인하기 전에 현재 Event를 잡아 두어 확인 직후의 발행도 놓치지 않음
+        changed = self._changed
+        events = self.broker.events_after(seq)
+        if events:
+            return events
+        waiter = asyncio.ensure_future(changed.wait())
+        try:
+            await asyncio.wait([waiter] if closed is None else [waiter, closed],
+                               timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+        if closed is not None and closed.done():
+            raise ConnectionResetError('client closed')
+        return self.broker.events_after(seq) if changed.is_set() else []
+    
+    def _encode(self, event):
+        """SSE 메시지 바이트 (이벤트마다 한 번만 직렬화)"""
+        key = (event['seq'], event['type'])
+        message = self._encoded.get(key)
+        if message is None:
+            message = format_sse(event).encode('utf-8')
+            self._encoded[key] = message
+            if len(self._encoded) > ENCODED_CACHE_SIZE:
+                del self._encoded[next(iter(self._encoded))]
+        return message
+    
+    @staticmethod
+    def _head(status, headers):
+        lines = [f"HTTP/1.1 {status}"]
+        lines.extend(f"{name}: {value}" for name, value in CORS_HEADERS + tuple(headers))
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+    
+    async def _send_json(self, writer, status, payload, headers=()):
+        body = encode_json(payload)
+        writer.write(self._head(status, (
+            ('Content-Type', 'application/json'),
+            ('Content-Length', len(body)),
+            ('Cache-Control', 'no-cache'),
+            ('Connection', 'close'),
+        ) + tuple(headers)) + body)
+        await writer.drain()
+    
+    async def _handle(self, reader, writer):
+        """연결 하나 처리 (요청 하나를 처리한 뒤 연결을 닫음)"""
+        try:
+            try:
+                head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), REQUEST_TIMEOUT_SECONDS)
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+                return
+            lines = head.decode('latin-1').split('\r\n')
+            parts = lines[0].split()
+            if len(parts) != 3:
+                await self._send_json(writer, '400 Bad Request', {'error': '잘못된 요청입니다'})
+                return
+            method, target, _ = parts
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(':')
+                if name:
+                    headers[name.strip().lower()] = value.strip()
+            url = urlsplit(target)
+            params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+            
+            if method == 'OPTIONS':
+                writer.write(self._head('204 No Content', (('Content-Length', 0), ('Connection', 'close'))))
+                await writer.drain()
+            elif method != 'GET':
+                await self._send_json(writer, '405 Method Not Allowed', {'error': 'GET만 지원합니다'})
+            elif url.path == '/api/stream':
+                await self._stream(reader, writer, headers.get('last-event-id') or params.get('since'))
+            elif url.path == '/api/updates':
+                await self._poll(writer, params.get('since'), params.get('timeout'))
+            else:
+                await self._send_json(writer, '404 Not Found', {'error': '찾을 수 없습니다'})
+        except (ConnectionError, asyncio.TimeoutError):
+            pass
+        except Exception as e:
+            log.error("스트림 요청 처리 오류", error=e)
+        finally:
+            writer.close()
+    
+    async def _stream(self, reader, writer, since):
+        """SSE 스트림 (클라이언트가 끊거나 쓰기가 밀릴 때까지 유지)"""
+        try:
+            seq = parse_seq(since, self.broker.latest_seq)
+        except ValueError as e:
+            await self._send_json(writer, '400 Bad Request', {'error': str(e)})
+            return
+        if self.clients >= self.max_clients:
+            log.info("SSE 연결 수 초과, 롱폴링 안내", limit=self.max_clients)
+            await self._send_json(writer, '503 Service Unavailable', {
+                'error': '동시 스트림 연결 수를 초과했습니다',
+                'fallback': '/api/updates',
+                'latest_seq': self.broker.latest_seq,
+            }, headers=(('Retry-After', self.long_poll_max_seconds),))
+            return
+        
+        self.clients += 1
+        # 클라이언트는 요청 뒤에 보내는 것이 없으므로 읽기가 끝나면 연결이 끊긴 것 (하트비트를 기다리지 않고 자리 반환)
+        closed = asyncio.ensure_future(reader.read(1))
+        try:
+            writer.write(self._head('200 OK', (
+                ('Content-Type', 'text/event-stream; charset=utf-8'),
+                ('Cache-Control', 'no-cache'),
+                ('X-Accel-Buffering', 'no'),
+                ('Connection', 'close'),
+            )) + b"retry: 3000\n\n")
+            await writer.drain()
+            while True:
+                events = await self._next_events(seq, self.heartbeat_seconds, closed)
+                if events:
+                    writer.write(b''.join(self._encode(event) for event in events))
+                    seq = events[-1]['seq']
+                else:
+                    # 연결 유지 및 끊긴 클라이언트 감지용 주석
+                    writer.write(b": keep-alive\n\n")
+                # 받지 못하고 밀리는 클라이언트는 끊어 버퍼가 쌓이지 않게 함 (EventSource가 Last-Event-ID로 재연결)
+                await asyncio.wait_for(writer.drain(), self.heartbeat_seconds)
+        finally:
+            closed.cancel()
+            self.clients -= 1
+    
+    async def _poll(self, writer, since, timeout):
+        """롱폴링 (이벤트가 생기거나 timeout초가 지나면 응답)"""
+        try:
+            seq = parse_seq(since, self.broker.latest_seq)
+            timeout = parse_timeout(timeout, self.long_poll_max_seconds)
+        except ValueError as e:
+            await self._send_json(writer, '400 Bad Request', {'error': str(e)})
+            return
+        events = await self._next_events(seq, timeout)
+        await self._send_json(writer, '200 OK', {'events': events, 'latest_seq': self.broker.latest_seq})
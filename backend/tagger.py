@@ -0,0 +1,93 @@
+"""
+콘텐츠 키워드 태깅 모듈
+수집이 끝난 뒤 모든 콘텐츠의 제목/설명을 추적 중인 모든 키워드의 별칭과 한 번에 대조하여
+언급된 키워드를 모두 붙이고, 키워드 → 콘텐츠 ID 역색인을 만듭니다.
+"""
+import itertools
+try:
+    from .keyword_mapper import KeywordMatcher, fold, get_alias_index
+except ImportError:
+    from keyword_mapper import KeywordMatcher, fold, get_alias_index
+
+_generations = itertools.count(1)
+
+class ContentTagger:
+    """
+    추적 키워드 집합에 대한 태거 (생성 후 읽기 전용)
+    
+    키워드마다 영문/한글명과 keyword_mapper의 별칭을 모두 패턴으로 등록하므로
+    'BLACKPINK'를 추적하면 '블랙핑크', 'BLACK PINK'로 쓴 기사도 태그됩니다.
+    별칭 파일에서 ambiguous로 지정한 이름('지수', '있지'처럼 일반 단어로도 쓰이는 이름)은 등록하지 않습니다.
+    """
+    
+    __slots__ = ('keys', 'generation', '_matcher')
+    
+    def __init__(self, keywords, alias_index=None):
+        """
+        Args:
+            keywords: (키, 영문 키워드, 한글 키워드) 튜플 리스트
+            alias_index: 별칭 색인 (없으면 keyword_mapper의 현재 색인)
+        """
+        alias_index = alias_index or get_alias_index()
+        self.keys = tuple(key for key, _, _ in keywords)
+        # 처리 결과에 기록한 태그가 이 태거로 대조한 것인지 구분
+        self.generation = next(_generations)
+        keys_by_name = {}
+        for key, keyword_en, keyword_ko in keywords:
+            names = {key, keyword_en, keyword_ko}
+            ambiguous = set()
+            for name in (keyword_en, keyword_ko):
+                entry = alias_index.lookup(name) if name else None
+                if entry is not None:
+                    names.update(entry.names())
+                    ambiguous.update(entry.ambiguous)
+            for name in names:
+                if name and fold(name) not in ambiguous:
+                    keys_by_name.setdefault(fold(name), set()).add(key)
+        self._matcher = KeywordMatcher(
+            (name, tuple(sorted(keys))) for name, keys in keys_by_name.items()
+        )
+    
+    def match(self, text):
+        """
+        텍스트에 언급된 키워드 집합
+        
+        Args:
+            text: 검색할 텍스트
+        
+        Returns:
+            set: 키워드 키 집합
+        """
+        found = set()
+        for _, _, keys in self._matcher.iter_matches(fold(text)):
+            found.update(keys)
+        return found
+    
+    def tag(self, contents, own_key=None, seen=None):
+        """
+        콘텐츠마다 언급된 키워드를 keywords 필드에 기록
+        
+        Args:
+            contents: 콘텐츠 리스트
+            own_key: 이 콘텐츠를 수집한 키워드 (본문에 없어도 항상 포함)
+            seen: content_id → 처리 결과 딕셔너리 조회 함수 (선택사항, 이 태거로 이미 대조한 콘텐츠는 다시 대조하지 않음)
+        
+        Returns:
+            dict: 키워드 → 콘텐츠 ID 리스트 (역색인)
+        """
+        reverse = {}
+        for content in contents:
+            entry = seen(content.get('content_id')) if seen else None
+            cached = entry.get('tags') if entry is not None else None
+            if cached is not None and cached[0] == self.generation:
+                keys = set(cached[1])
+            else:
+                keys = self.match(f"{content.get('title', '')}\n{content.get('description', '')}")
+                if entry is not None:
+                    entry['tags'] = (self.generation, frozenset(keys))
+            if own_key is not None:
+                keys.add(own_key)
+            content['keywords'] = sorted(keys)
+            for key in content['keywords']:
+                reverse.setdefault(key, []).append(content.get('content_id'))
+        return reverse
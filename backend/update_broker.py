@@ -0,0 +1,101 @@
+"""
+수집 업데이트 브로커 모듈
+키워드 수집이 끝날 때마다 발행되는 이벤트를 공유 버퍼에 쌓아 두고,
+SSE/롱폴링 클라이언트가 마지막으로 받은 이벤트 번호 이후의 이벤트를 가져가게 합니다.
+클라이언트별 큐 없이 하나의 버퍼로 모든 클라이언트에 전달하며, 스레드에서 기다리는 쪽은 Condition으로,
+이벤트 루프(stream_server)는 발행 리스너로 깨웁니다.
+"""
+import threading
+import time
+from collections import deque
+
+class UpdateBroker:
+    """
+    순번이 매겨진 업데이트 이벤트의 공유 링 버퍼
+    
+    각 클라이언트는 마지막으로 받은 순번(커서)만 가지고 있으며,
+    버퍼에서 밀려난 이벤트를 요청하면 전체 데이터를 다시 받도록 'resync' 이벤트를 받습니다.
+    """
+    
+    def __init__(self, max_events=256):
+        self.events = deque(maxlen=max_events)
+        self.latest_seq = 0
+        self.condition = threading.Condition()
+        self._listeners = []
+    
+    def add_listener(self, listener):
+        """
+        발행 리스너 등록 (발행한 스레드에서 잠금을 놓은 뒤 호출되므로 오래 걸리는 작업은 하지 않아야 함)
+        
+        Args:
+            listener: 발행된 순번을 받는 함수
+        """
+        self._listeners.append(listener)
+    
+    def publish(self, event_type, data):
+        """
+        이벤트 발행 후 대기 중인 모든 클라이언트를 깨움
+        
+        Args:
+            event_type: 이벤트 종류 (예: 'keyword', 'collection_done')
+            data: 이벤트 데이터 (JSON 직렬화 가능)
+        
+        Returns:
+            int: 발행된 이벤트 순번
+        """
+        with self.condition:
+            self.latest_seq += 1
+            seq = self.latest_seq
+            self.events.append({'seq': seq, 'type': event_type,
+                                'time': time.time(), 'data': data})
+            self.condition.notify_all()
+        for listener in self._listeners:
+            listener(seq)
+        return seq
+    
+    def _resync_event(self):
+        """전체 데이터를 다시 받으라는 이벤트 (순번은 현재 최신 순번)"""
+        return {'seq': self.latest_seq, 'type': 'resync', 'time': time.time(), 'data': {}}
+    
+    def _events_after(self, seq):
+        """seq 이후의 이벤트 리스트 (condition을 잡은 상태에서 호출)"""
+        if seq >= self.latest_seq:
+            return []
+        oldest = self.events[0]['seq'] if self.events else self.latest_seq + 1
+        if seq < oldest - 1:
+            # 버퍼에서 밀려난 이벤트가 있으면 클라이언트가 전체를 다시 받아야 함
+            return [self._resync_event()]
+        return [event for event in self.events if event['seq'] > seq]
+    
+    def events_after(self, seq):
+        """
+        seq 이후의 이벤트를 기다리지 않고 조회
+        
+        Args:
+            seq: 클라이언트가 마지막으로 받은 이벤트 순번
+        
+        Returns:
+            list: 새 이벤트 리스트 (없으면 빈 리스트)
+        """
+        with self.condition:
+            if seq > self.latest_seq:
+                return [self._resync_event()]
+            return self._events_after(seq)
+    
+    def wait(self, seq, timeout):
+        """
+        seq 이후의 이벤트가 생길 때까지 최대 timeout초 대기
+        
+        Args:
+            seq: 클라이언트가 마지막으로 받은 이벤트 순번
+            timeout: 최대 대기 시간 (초)
+        
+        Returns:
+            list: 새 이벤트 리스트 (시간 초과 시 빈 리스트)
+        """
+        with self.condition:
+            # 서버 재시작 등으로 클라이언트 순번이 더 크면 전체를 다시 받도록 함
+            if seq > self.latest_seq:
+                return [self._resync_event()]
+            self.condition.wait_for(lambda: self.latest_seq > seq, timeout=timeout)
+            return self._events_after(seq)
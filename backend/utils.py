@@ -2,34 +2,139 @@
 유틸리티 함수 모듈
 공통으로 사용되는 유틸리티 함수들을 정의합니다.
 """
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 import hashlib
+import time
 
-def is_within_24_hours(published_time):
+# 같은 게시 시각 문자열(영문/한글 검색 결과 중복, 페이지 겹침)을 다시 파싱하지 않도록 보관하는 개수
+TIMESTAMP_CACHE_SIZE = 8192
+
+_MONTHS = {
+    'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04', 'May': '05', 'Jun': '06',
+    'Jul': '07', 'Aug': '08', 'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12',
+}
+
+def rfc2822_to_iso(value):
+    """
+    네이버 pubDate 형식을 ISO 형식 문자열로 변환 (문자열 조작만 하므로 strptime보다 빠름)
+    
+    Args:
+        value: 'Mon, 01 Jan 2024 12:00:00 +0900' 형식 문자열
+    
+    Returns:
+        str: '2024-01-01T12:00:00+09:00' (형식이 다르면 None)
+    """
+    parts = value.split()
+    if len(parts) != 6 or not parts[1].isdigit() or len(parts[5]) != 5:
+        return None
+    _, day, month, year, clock, offset = parts
+    month = _MONTHS.get(month)
+    if month is None:
+        return None
+    return f"{year}-{month}-{day.zfill(2)}T{clock}{offset[:3]}:{offset[3:]}"
+
+def _parse_iso(value):
+    # fromisoformat은 C 구현이라 strptime보다 수십 배 빠름 (Z는 3.11 미만 호환을 위해 변환)
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+
+def _parse_rfc2822(value):
+    iso = rfc2822_to_iso(value)
+    if iso is None:
+        raise ValueError(f"알 수 없는 날짜 형식: {value}")
+    return _parse_iso(iso)
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def _parse_timestamp_text(value):
+    # 요일로 시작하는 형식('Mon, ...')은 네이버 pubDate, 그 외는 ISO 형식 (YouTube, 저장된 결과)
+    parser = _parse_rfc2822 if value[3:4] == ',' else _parse_iso
+    try:
+        return parser(value)
+    except ValueError:
+        return None
+
+def parse_timestamp(value):
+    """
+    게시 시각을 UTC epoch 초로 변환
+    시간대가 없는 문자열은 서버 현지 시각으로 해석합니다.
+    
+    Args:
+        value: ISO 형식 또는 네이버 pubDate 형식 문자열, datetime, epoch 초
+    
+    Returns:
+        float: epoch 초 (파싱 실패 시 None)
+    """
+    if isinstance(value, str):
+        return _parse_timestamp_text(value) if value else None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+def content_timestamp(content):
+    """
+    콘텐츠의 게시 시각 (epoch 초, 파싱 실패 시 0)
+    수집 시 기록한 published_ts를 사용하고, 없는 이전 결과만 published_at을 파싱합니다.
+    
+    Args:
+        content: 콘텐츠 딕셔너리 또는 ItemRecord
+    
+    Returns:
+        float: epoch 초
+    """
+    published_ts = content.get('published_ts')
+    if published_ts is None:
+        published_ts = parse_timestamp(content.get('published_at', ''))
+    return published_ts or 0.0
+
+def cutoff_timestamp(hours=24, now=None):
+    """
+    수집 기준 시각 (이 시각 이후 게시된 항목만 유효, 수집 한 번에 한 번만 계산)
+    
+    Args:
+        hours: 기준 시간 (기본값 24시간)
+        now: 현재 시각 epoch 초 (없으면 time.time())
+    
+    Returns:
+        float: epoch 초
+    """
+    return (time.time() if now is None else now) - hours * 3600
+
+def is_within_24_hours(published_time, hours=24, cutoff=None):
     """
     게시 시간이 최근 24시간 이내인지 확인
     
     Args:
-        published_time: 게시 시간 (datetime 객체 또는 ISO 형식 문자열)
+        published_time: 게시 시간 (datetime 객체, 문자열 또는 epoch 초)
+        hours: 기준 시간 (기본값 24시간)
+        cutoff: 미리 계산한 기준 시각 (cutoff_timestamp 결과, 주면 hours는 무시)
+    
+    Returns:
+        bool: 24시간 이내면 True, 아니면 False (파싱할 수 없으면 False)
+    """
+    timestamp = parse_timestamp(published_time)
+    if timestamp is None:
+        return False
+    return timestamp >= (cutoff_timestamp(hours) if cutoff is None else cutoff)
+
+def parse_published_at(published_time):
+    """
+    게시 시간 문자열을 timezone 정보가 있는 datetime으로 변환
+    
+    Args:
+        published_time: ISO 형식 문자열
     
     Returns:
-        bool: 24시간 이내면 True, 아니면 False
-    """
-    if isinstance(published_time, str):
-        try:
-            # ISO 형식 문자열 파싱
-            published_time = datetime.fromisoformat(published_time.replace('Z', '+00:00'))
-        except:
-            # 다른 형식 시도
-            try:
-                published_time = datetime.strptime(published_time, '%Y-%m-%dT%H:%M:%S')
-            except:
-                return False
-    
-    now = datetime.now(published_time.tzinfo) if published_time.tzinfo else datetime.now()
-    time_diff = now - published_time
-    
-    return time_diff <= timedelta(hours=24)
+        datetime: 파싱된 시간 (실패 시 None)
+    """
+    try:
+        parsed = datetime.fromisoformat(published_time.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.astimezone()
+    return parsed
 
 def generate_content_hash(title, url):
     """
@@ -45,32 +150,20 @@ def generate_content_hash(title, url):
     content_string = f"{title}|{url}"
     return hashlib.md5(content_string.encode('utf-8')).hexdigest()
 
-def format_datetime(dt):
+def compute_version(contents):
     """
-    datetime 객체를 사용자 친화적인 형식으로 변환
+    콘텐츠 목록의 버전 해시 생성 (내용이 바뀌면 값이 바뀜, HTTP ETag 용)
     
     Args:
-        dt: datetime 객체
+        contents: 콘텐츠 리스트 (각 항목은 content_id 키를 가짐)
     
     Returns:
-        str: 포맷된 날짜 문자열
-    """
-    if isinstance(dt, str):
-        try:
-            dt = datetime.fromisoformat(dt.replace('Z', '+00:00'))
-        except:
-            return dt
-    
-    now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
-    diff = now - dt
-    
-    if diff.days > 0:
-        return f"{diff.days}일 전"
-    elif diff.seconds >= 3600:
-        hours = diff.seconds // 3600
-        return f"{hours}시간 전"
-    elif diff.seconds >= 60:
-        minutes = diff.seconds // 60
-        return f"{minutes}분 전"
-    else:
-        return "방금 전"
+        str: 해시값 (영상 조회수나 키워드 태그가 바뀌어도 값이 바뀜)
+    """
+    digest = hashlib.md5()
+    for content in contents:
+        digest.update(
+            f"{content.get('content_id', '')}:{content.get('cluster_size', 1)}:{content.get('view_count', '')}:"
+            f"{','.join(content.get('keywords', ()))}|".encode('utf-8')
+        )
+    return digest.hexdigest()
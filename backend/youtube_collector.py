@@ -4,13 +4,54 @@ YouTube Data API를 사용하여 관련 콘텐츠를 수집합니다.
 """
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from datetime import datetime, timedelta
+from datetime import timezone
+import re
+import threading
+import time
 try:
-    from .utils import is_within_24_hours, format_datetime
+    from .utils import cutoff_timestamp, parse_timestamp
     from .config import Config
+    from .quota import quota_manager, SEARCH_COST, QuotaExceeded
+    from .metrics import record_upstream, UPSTREAM_ERRORS
+    from .log import get_logger
 except ImportError:
-    from utils import is_within_24_hours, format_datetime
+    from utils import cutoff_timestamp, parse_timestamp
     from config import Config
+    from quota import quota_manager, SEARCH_COST, QuotaExceeded
+    from metrics import record_upstream, UPSTREAM_ERRORS
+    from log import get_logger
+
+log = get_logger('youtube')
+
+# videos.list 1회당 최대 영상 수와 쿼터 비용
+VIDEOS_BATCH_SIZE = 50
+VIDEOS_LIST_COST = 1
+
+# ISO 8601 영상 길이 (예: PT1H2M3S, P1DT2H)
+DURATION_PATTERN = re.compile(r'P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$')
+
+def parse_duration(duration):
+    """
+    ISO 8601 영상 길이를 초 단위로 변환
+    
+    Args:
+        duration: ISO 8601 기간 문자열 (예: PT4M13S)
+    
+    Returns:
+        int: 길이 (초, 형식이 맞지 않으면 None)
+    """
+    match = DURATION_PATTERN.match(duration or '')
+    if not match:
+        return None
+    days, hours, minutes, seconds = (int(value or 0) for value in match.groups())
+    return ((days * 24 + hours) * 60 + minutes) * 60 + seconds
+
+def _to_int(value):
+    """통계 값을 정수로 변환 (비공개 등으로 값이 없으면 None)"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
 
 class YouTubeCollector:
     """유튜브 콘텐츠 수집 클래스"""
@@ -18,41 +59,71 @@ class YouTubeCollector:
     def __init__(self):
         self.api_key = Config.YOUTUBE_API_KEY
         self.youtube = None
+        # httplib2 기반 클라이언트는 스레드 안전하지 않으므로 스레드별로 생성
+        self._local = threading.local()
+        # 영상별 통계 캐시 {video_id: (만료 시각, 통계)}
+        self._stats_cache = {}
+        self._stats_lock = threading.Lock()
         
         if not self.api_key:
-            print("[ERROR] YouTube API 키가 설정되지 않았습니다. .env 파일에 YOUTUBE_API_KEY를 설정하세요.")
+            log.error("YouTube API 키가 설정되지 않았습니다. .env 파일에 YOUTUBE_API_KEY를 설정하세요.")
             return
         
         try:
             self.youtube = build('youtube', 'v3', developerKey=self.api_key)
-            print(f"[OK] YouTube API 초기화 성공 (키 길이: {len(self.api_key)} 문자)")
+            self._local.youtube = self.youtube
+            log.info("YouTube API 초기화 성공", key_length=len(self.api_key))
         except Exception as e:
-            print(f"[ERROR] YouTube API 초기화 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("YouTube API 초기화 실패", error=e, exc_info=True)
     
-    def search(self, keyword, max_results=50):
+    def _get_client(self):
+        """
+        현재 스레드 전용 YouTube API 클라이언트 반환
+        
+        Returns:
+            Resource: YouTube API 클라이언트
+        """
+        client = getattr(self._local, 'youtube', None)
+        if client is None:
+            client = build('youtube', 'v3', developerKey=self.api_key)
+            self._local.youtube = client
+        return client
+    
+    def search(self, keyword, max_results=50, published_after=None):
         """
         키워드로 유튜브 검색
         
         Args:
             keyword: 검색 키워드
             max_results: 최대 결과 수
+            published_after: 이 시각 이후 게시된 영상만 검색 (datetime, 없으면 최근 24시간)
         
         Returns:
             list: 검색 결과 리스트
+        
+        Raises:
+            QuotaExceeded: 일일 쿼터가 부족한 경우
         """
         if not self.youtube:
-            print(f"[ERROR] YouTube API가 초기화되지 않았습니다. 키워드: {keyword}")
+            log.error("YouTube API가 초기화되지 않았습니다.", keyword=keyword)
             return []
         
+        # search.list 1회 = 100 유닛
+        quota_manager.acquire('youtube', SEARCH_COST['youtube'])
+        
+        started = time.perf_counter()
+        # 24시간 기준 시각 (검색 한 번에 한 번만 계산하여 모든 항목에 사용)
+        cutoff = cutoff_timestamp()
         try:
-            print(f"[SEARCH] YouTube 검색 시작: '{keyword}'")
-            # 24시간 전 시간 계산
-            published_after = (datetime.now() - timedelta(hours=24)).isoformat() + 'Z'
+            log.debug("YouTube 검색 시작", keyword=keyword)
+            if published_after:
+                # 증분 수집: 마지막으로 수집한 영상 이후만 검색
+                published_after = published_after.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+            else:
+                published_after = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(cutoff))
             
             # 검색 요청
-            request = self.youtube.search().list(
+            request = self._get_client().search().list(
                 part='snippet',
                 q=keyword,
                 type='video',
@@ -62,10 +133,9 @@ class YouTubeCollector:
                 regionCode='KR'
             )
             
-            response = request.execute()
+            response = self._execute(request, 'search.list')
             
-            total_items = len(response.get('items', []))
-            print(f"[INFO] YouTube API 응답: {total_items}개 항목 수신")
+            log.debug("YouTube API 응답", keyword=keyword, items=len(response.get('items', [])))
             
             results = []
             for item in response.get('items', []):
@@ -73,33 +143,145 @@ class YouTubeCollector:
                 video_id = item.get('id', {}).get('videoId', '')
                 
                 published_at = snippet.get('publishedAt', '')
+                published_ts = parse_timestamp(published_at)
                 
                 # 24시간 이내 확인
-                if published_at and is_within_24_hours(published_at):
+                if published_ts is not None and published_ts >= cutoff:
                     video_data = {
+                        'video_id': video_id,
                         'title': snippet.get('title', ''),
                         'description': snippet.get('description', ''),
                         'url': f"https://www.youtube.com/watch?v={video_id}",
                         'thumbnail': snippet.get('thumbnails', {}).get('medium', {}).get('url', ''),
                         'channel': snippet.get('channelTitle', ''),
                         'published_at': published_at,
-                        'published_at_formatted': format_datetime(published_at),
+                        'published_ts': published_ts,
                         'source': 'youtube',
                         'type': 'video'
                     }
                     results.append(video_data)
             
-            print(f"[OK] YouTube 검색 완료: '{keyword}' - {len(results)}개 결과 (24시간 이내)")
+            log.info("YouTube 검색 완료", keyword=keyword, source='youtube', results=len(results),
+                     duration_ms=round((time.perf_counter() - started) * 1000))
             return results
-            
+        
         except HttpError as e:
-            error_details = e.error_details if hasattr(e, 'error_details') else []
-            print(f"[ERROR] YouTube API HttpError: {e.resp.status} - {e.content}")
-            if error_details:
-                print(f"   상세: {error_details}")
+            log.error("YouTube API HttpError", keyword=keyword, status=e.resp.status, body=e.content,
+                      details=getattr(e, 'error_details', None) or None)
+            UPSTREAM_ERRORS.inc(source='youtube', kind=f"http_{e.resp.status}")
+            self._check_quota_error(e)
             return []
         except Exception as e:
-            print(f"[ERROR] 유튜브 검색 중 오류 발생: {e}")
-            import traceback
-            traceback.print_exc()
+            log.error("유튜브 검색 중 오류 발생", keyword=keyword, error=e, exc_info=True)
+            UPSTREAM_ERRORS.inc(source='youtube', kind='exception')
             return []
+    
+    def _execute(self, request, endpoint):
+        """API 요청 실행 (소요 시간과 결과를 지표로 기록)"""
+        started = time.perf_counter()
+        try:
+            response = request.execute()
+        except HttpError as e:
+            record_upstream('youtube', endpoint, started, f"http_{e.resp.status}")
+            raise
+        except Exception:
+            record_upstream('youtube', endpoint, started, 'error')
+            raise
+        record_upstream('youtube', endpoint, started, 'ok')
+        return response
+    
+    def _check_quota_error(self, error):
+        """쿼터 초과 응답(403 quotaExceeded/dailyLimitExceeded)이면 오늘 쿼터를 소진으로 기록"""
+        if error.resp.status == 403 and any(
+            reason in (error.content or b'') for reason in (b'quotaExceeded', b'dailyLimitExceeded')
+        ):
+            quota_manager.mark_exhausted('youtube')
+    
+    def cached_video_statistics(self, video_ids):
+        """
+        캐시에 있는 영상 통계만 조회 (API를 호출하지 않으며 만료된 값도 포함)
+        
+        Args:
+            video_ids: 영상 ID 목록
+        
+        Returns:
+            dict: {video_id: 통계 딕셔너리}
+        """
+        with self._stats_lock:
+            return {
+                video_id: cached[1] for video_id in video_ids
+                for cached in (self._stats_cache.get(video_id),) if cached is not None
+            }
+    
+    def get_video_statistics(self, video_ids):
+        """
+        영상별 조회수/좋아요/댓글 수와 길이 조회
+        캐시에 없거나 만료된 영상만 videos.list로 50개씩 묶어 요청합니다.
+        
+        Args:
+            video_ids: 영상 ID 목록
+        
+        Returns:
+            dict: {video_id: {'view_count', 'like_count', 'comment_count', 'duration_seconds'}}
+                  (조회하지 못한 영상은 만료된 캐시 값이 있으면 그 값을 사용)
+        """
+        now = time.monotonic()
+        stats = {}
+        missing = []
+        with self._stats_lock:
+            for video_id in dict.fromkeys(video_ids):
+                cached = self._stats_cache.get(video_id)
+                if cached is not None:
+                    stats[video_id] = cached[1]
+                    if cached[0] > now:
+                        continue
+                missing.append(video_id)
+        
+        if not missing or not self.youtube:
+            return stats
+        
+        fetched = {}
+        for start in range(0, len(missing), VIDEOS_BATCH_SIZE):
+            batch = missing[start:start + VIDEOS_BATCH_SIZE]
+            try:
+                quota_manager.acquire('youtube', VIDEOS_LIST_COST)
+                request = self._get_client().videos().list(
+                    part='statistics,contentDetails',
+                    id=','.join(batch),
+                    maxResults=len(batch)
+                )
+                response = self._execute(request, 'videos.list')
+            except HttpError as e:
+                log.error("YouTube 영상 통계 조회 실패", status=e.resp.status, body=e.content)
+                UPSTREAM_ERRORS.inc(source='youtube', kind=f"http_{e.resp.status}")
+                self._check_quota_error(e)
+                break
+            except Exception as e:
+                # 쿼터 부족(QuotaExceeded) 포함, 남은 배치는 캐시 값으로 대체
+                log.error("YouTube 영상 통계 조회 중 오류 발생", error=e)
+                UPSTREAM_ERRORS.inc(source='youtube', kind='quota' if isinstance(e, QuotaExceeded) else 'exception')
+                break
+            
+            for item in response.get('items', []):
+                statistics = item.get('statistics', {})
+                fetched[item.get('id', '')] = {
+                    'view_count': _to_int(statistics.get('viewCount')),
+                    'like_count': _to_int(statistics.get('likeCount')),
+                    'comment_count': _to_int(statistics.get('commentCount')),
+                    'duration_seconds': parse_duration(item.get('contentDetails', {}).get('duration')),
+                }
+        
+        if fetched:
+            expires_at = time.monotonic() + Config.VIDEO_STATS_TTL_SECONDS
+            with self._stats_lock:
+                # 만료된 항목 정리 (캐시가 커졌을 때만)
+                if len(self._stats_cache) > Config.VIDEO_STATS_CACHE_SIZE:
+                    self._stats_cache = {
+                        video_id: entry for video_id, entry in self._stats_cache.items() if entry[0] > now
+                    }
+                for video_id, video_stats in fetched.items():
+                    self._stats_cache[video_id] = (expires_at, video_stats)
+            stats.update(fetched)
+            log.info("YouTube 영상 통계 조회", requested=len(missing), received=len(fetched),
+                     calls=(len(missing) + VIDEOS_BATCH_SIZE - 1) // VIDEOS_BATCH_SIZE)
+        return stats
@@ -0,0 +1,82 @@
+"""
+블랙리스트 조회 마이크로벤치마크
+차단 ID 100,000개 기준으로 기존 방식(항목마다 JSON 재로드 + 리스트 선형 탐색)과
+해시 셋 인덱스(is_blocked / filter_blocked)를 비교합니다.
+
+실행: python benchmarks/bench_blacklist.py
+"""
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from backend import blacklist_store
+from backend.utils import generate_content_hash
+
+BLOCKED_COUNT = 100_000
+ITEM_COUNT = 100_000
+LEGACY_ITEM_COUNT = 100  # 기존 방식은 너무 느려 일부만 측정
+
+def legacy_is_blocked(content_id=None, url=None):
+    """기존 구현: 호출마다 파일을 다시 읽고 리스트를 선형 탐색"""
+    data = blacklist_store._load_blacklist()
+    if content_id and content_id in data.get("blocked_ids", []):
+        return True
+    if url and url in data.get("blocked_urls", []):
+        return True
+    return False
+
+def make_items(count):
+    items = []
+    for i in range(count):
+        url = f"https://example.com/item/{i}"
+        items.append({'title': f"item {i}", 'url': url,
+                      'content_id': generate_content_hash(f"item {i}", url)})
+    return items
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        blacklist_store.BLACKLIST_PATH = Path(tmp) / "blacklist.json"
+        # 절반은 차단 대상과 겹치도록 구성
+        blocked_ids = [generate_content_hash(f"item {i}", f"https://example.com/item/{i}")
+                       for i in range(0, BLOCKED_COUNT * 2, 2)]
+        blacklist_store.BLACKLIST_PATH.write_text(
+            json.dumps({"blocked_ids": blocked_ids, "blocked_urls": []}), encoding="utf-8"
+        )
+        items = make_items(ITEM_COUNT)
+        
+        start = time.perf_counter()
+        legacy = [item for item in items[:LEGACY_ITEM_COUNT]
+                  if not legacy_is_blocked(item['content_id'], item['url'])]
+        legacy_per_item = (time.perf_counter() - start) / LEGACY_ITEM_COUNT
+        
+        start = time.perf_counter()
+        blacklist_store.get_blacklist()
+        load_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        indexed = [item for item in items
+                   if not blacklist_store.is_blocked(item['content_id'], item['url'])]
+        indexed_per_item = (time.perf_counter() - start) / ITEM_COUNT
+        
+        start = time.perf_counter()
+        bulk = blacklist_store.filter_blocked(items)
+        bulk_per_item = (time.perf_counter() - start) / ITEM_COUNT
+        
+        assert legacy == indexed[:len(legacy)] and indexed == bulk
+        
+        print(f"\n차단 ID {BLOCKED_COUNT:,}개, 조회 항목 {ITEM_COUNT:,}개 (통과 {len(bulk):,}개)")
+        print(f"인덱스 최초 로드:            {load_time * 1000:10.1f} ms")
+        print(f"기존 is_blocked (항목당):     {legacy_per_item * 1e6:10.1f} us")
+        print(f"인덱스 is_blocked (항목당):   {indexed_per_item * 1e6:10.3f} us")
+        print(f"filter_blocked (항목당):      {bulk_per_item * 1e6:10.3f} us")
+        print(f"기존 대비 filter_blocked:     {legacy_per_item / bulk_per_item:10.0f}x")
+
+if __name__ == '__main__':
+    main()
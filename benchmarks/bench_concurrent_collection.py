@@ -0,0 +1,81 @@
+"""
+동시 수집 벤치마크
+스텁 수집기(고정 지연)를 사용하여 키워드 수에 따른 순차/동시 수집 소요 시간을 비교합니다.
+
+실행: python benchmarks/bench_concurrent_collection.py
+"""
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from backend.data_collector import DataCollector
+
+SEARCH_LATENCY = 0.05  # 검색 1회당 지연 (초)
+ITEMS_PER_SEARCH = 20
+KEYWORD_COUNTS = [1, 5, 10, 30, 60]
+
+class StubCollector:
+    """고정 지연 후 가짜 결과를 반환하는 수집기"""
+    
+    def __init__(self, source, content_type):
+        self.source = source
+        self.content_type = content_type
+    
+    def search(self, keyword, max_results=50):
+        time.sleep(SEARCH_LATENCY)
+        return [
+            {
+                'title': f"{keyword} {self.source} #{i}",
+                'description': '',
+                'url': f"https://example.com/{self.source}/{keyword}/{i}",
+                'published_at': f"2024-01-01T00:{i:02d}:00+00:00",
+                'source': self.source,
+                'type': self.content_type,
+            }
+            for i in range(ITEMS_PER_SEARCH)
+        ]
+    
+    def get_video_statistics(self, video_ids):
+        return {}
+
+def make_collector():
+    collector = DataCollector()
+    collector.youtube_collector = StubCollector('youtube', 'video')
+    collector.news_collector = StubCollector('naver', 'news')
+    return collector
+
+def run(collector, keywords, concurrent):
+    start = time.perf_counter()
+    # 수집 로그 출력은 측정에서 제외
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = collector.collect_multiple_keywords(keywords, concurrent=concurrent)
+    return time.perf_counter() - start, results
+
+def main():
+    collector = make_collector()
+    print(f"\n검색 지연 {SEARCH_LATENCY * 1000:.0f}ms, "
+          f"동시 요청 제한 {collector.source_concurrency}")
+    print(f"{'keywords':>9} {'sequential(s)':>14} {'concurrent(s)':>14} {'speedup':>8}")
+    
+    for count in KEYWORD_COUNTS:
+        # 영문/한글이 다른 키워드 → 키워드당 4회 검색
+        keywords = [{'en': f"artist{i}", 'ko': f"아티스트{i}"} for i in range(count)]
+        seq_time, seq_results = run(collector, keywords, concurrent=False)
+        con_time, con_results = run(collector, keywords, concurrent=True)
+        
+        # 동시 수집 결과가 순차 수집과 동일한지 확인
+        assert list(seq_results) == list(con_results)
+        for key in seq_results:
+            assert seq_results[key]['contents'] == con_results[key]['contents']
+        
+        print(f"{count:>9} {seq_time:>14.2f} {con_time:>14.2f} {seq_time / con_time:>7.1f}x")
+
+if __name__ == '__main__':
+    main()
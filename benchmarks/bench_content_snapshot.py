@@ -0,0 +1,113 @@
+"""
+/api/content 부하 테스트
+요청마다 jsonify(cached_data)로 다시 인코딩하던 방식과
+수집 시 미리 만들어 둔 스냅샷을 그대로 보내는 방식의 초당 처리량을 비교합니다.
+
+실행: python benchmarks/bench_content_snapshot.py
+"""
+import contextlib
+import io
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# 벤치마크 데이터가 실제 저장소에 기록되지 않도록 비활성화
+os.environ['RESULT_STORE_ENABLED'] = 'False'
+
+import requests
+from flask import jsonify
+from werkzeug.serving import make_server
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from backend import app as app_module
+
+KEYWORD_COUNT = 30
+ITEMS_PER_KEYWORD = 200
+CLIENTS = 8
+REQUESTS_PER_CLIENT = 50
+
+def make_data():
+    data = {}
+    for k in range(KEYWORD_COUNT):
+        key = f"artist{k}"
+        contents = [
+            {
+                'title': f"{key} 뉴스 제목 {i}",
+                'description': '설명 ' * 40,
+                'url': f"https://example.com/{key}/{i}",
+                'thumbnail': f"https://img.example.com/{key}/{i}.jpg",
+                'published_at': '2024-01-01T00:00:00+00:00',
+                'published_ts': 1704067200.0,
+                'content_id': f"{k:04d}{i:08d}",
+                'type': 'news',
+                'keyword_en': key,
+                'keyword_ko': key,
+                'keyword_display': key,
+            }
+            for i in range(ITEMS_PER_KEYWORD)
+        ]
+        data[key] = {'keyword': key, 'total_count': len(contents),
+                     'collected_at': time.time(), 'contents': contents}
+    return data
+
+# 기존 구현이 캐시에 그대로 들고 있던 수집 결과
+legacy_data = {}
+
+@app_module.app.route('/bench/legacy-content')
+def legacy_content():
+    """기존 구현: 요청마다 전체 캐시(키워드별 수집 결과 딕셔너리)를 다시 인코딩"""
+    return jsonify(legacy_data)
+
+def load_test(url, headers):
+    def client():
+        session = requests.Session()
+        for _ in range(REQUESTS_PER_CLIENT):
+            response = session.get(url, headers=headers)
+            response.content
+        session.close()
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=CLIENTS) as executor:
+        for future in [executor.submit(client) for _ in range(CLIENTS)]:
+            future.result()
+    elapsed = time.perf_counter() - start
+    return CLIENTS * REQUESTS_PER_CLIENT / elapsed
+
+def main():
+    # 초기 수집 스레드가 끝난 뒤 벤치마크 데이터로 교체
+    with contextlib.redirect_stdout(io.StringIO()):
+        app_module.collection_queue.wait_idle()
+        legacy_data.update(make_data())
+        app_module.content_cache.replace(legacy_data)
+    
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    server = make_server('127.0.0.1', 0, app_module.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    
+    size = len(app_module.content_cache.state.snapshots.all.body)
+    print(f"\n키워드 {KEYWORD_COUNT}개 × 항목 {ITEMS_PER_KEYWORD}개, 응답 {size / 1024:.0f}KB, "
+          f"클라이언트 {CLIENTS}개 × {REQUESTS_PER_CLIENT}회")
+    with contextlib.redirect_stdout(io.StringIO()):
+        cases = [
+            ('jsonify (기존)', base + '/bench/legacy-content', {'Accept-Encoding': 'identity'}),
+            ('스냅샷', base + '/api/content', {'Accept-Encoding': 'identity'}),
+            ('스냅샷 + gzip', base + '/api/content', {'Accept-Encoding': 'gzip'}),
+        ]
+        results = [(name, load_test(url, headers)) for name, url, headers in cases]
+    for name, rps in results:
+        print(f"{name:<16} {rps:8.1f} req/s")
+    
+    server.shutdown()
+
+if __name__ == '__main__':
+    main()
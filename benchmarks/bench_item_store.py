@@ -0,0 +1,171 @@
+"""
+공유 콘텐츠 저장소 메모리 벤치마크
+키워드 500개 × 항목 200개(인기 항목은 여러 키워드에 중복)를 캐시에 올렸을 때의 유지 메모리를
+기존 방식(키워드마다 콘텐츠 딕셔너리 사본 + 딕셔너리를 가리키는 조회 인덱스)과
+공유 저장소(content_id별 __slots__ 레코드 한 벌 + 키워드별 레코드 참조 배열)로 비교합니다.
+
+실행: python benchmarks/bench_item_store.py
+"""
+import gc
+import heapq
+import json
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from backend.item_store import ItemStore
+from backend.content_index import CONTENT_TYPES, KeywordIndex, content_timestamp, query_contents
+
+KEYWORD_COUNT = 500
+ITEMS_PER_KEYWORD = 200
+SHARED_PER_KEYWORD = 80       # 키워드마다 인기 항목 풀에서 가져오는 항목 수
+SHARED_POOL = 20_000          # 여러 키워드에 함께 나오는 인기 항목 수
+PAGE_QUERIES = 200
+
+def make_item(content_id, rng):
+    video = rng.random() < 0.5
+    item = {
+        'content_id': content_id,
+        'type': 'video' if video else 'news',
+        'source_type': 'youtube' if video else 'naver',
+        'title': f"제목 {content_id} " + 'K-POP 컴백 무대 ' * 3,
+        'description': f"설명 {content_id} " + '새 앨범 발매 소식과 뮤직비디오 공개 ' * 4,
+        'url': f"https://example.com/{content_id}",
+        'thumbnail': f"https://img.example.com/{content_id}.jpg",
+    }
+    published = datetime(2026, 10, rng.randint(10, 16), rng.randint(0, 23), rng.randint(0, 59), tzinfo=timezone.utc)
+    item['published_at'] = published.isoformat()
+    item['published_ts'] = published.timestamp()
+    if video:
+        item.update({
+            'channel': f"channel {rng.randrange(1000)}",
+            'video_id': content_id,
+            'view_count': rng.randrange(10 ** 7),
+            'like_count': rng.randrange(10 ** 5),
+            'comment_count': rng.randrange(10 ** 4),
+            'duration_seconds': rng.randrange(30, 600),
+        })
+    else:
+        item['source'] = f"언론사 {rng.randrange(200)}"
+    return item
+
+def make_payloads(rng):
+    """키워드별 수집 결과 JSON (저장소에서 읽어 온 것처럼 키워드마다 따로 파싱되도록 문자열로)"""
+    pool = [make_item(f"shared{i}", rng) for i in range(SHARED_POOL)]
+    picks = {}
+    for k in range(KEYWORD_COUNT):
+        key = f"Artist{k}"
+        own = [make_item(f"{key}-{i}", rng) for i in range(ITEMS_PER_KEYWORD - SHARED_PER_KEYWORD)]
+        picks[key] = own + rng.sample(pool, SHARED_PER_KEYWORD)
+    # 태깅 결과: 같은 항목은 어느 키워드에 있든 같은 keywords 목록을 가짐
+    mentioned = {}
+    for key, items in picks.items():
+        for item in items:
+            mentioned.setdefault(item['content_id'], []).append(key)
+    payloads = {}
+    for key, items in picks.items():
+        contents = [
+            dict(item, keywords=sorted(mentioned[item['content_id']]),
+                 keyword_en=key, keyword_ko=f"{key}ko", keyword_display=key)
+            for item in items
+        ]
+        contents.sort(key=lambda content: content['published_at'], reverse=True)
+        result = {'keyword': key, 'keyword_en': key, 'keyword_ko': f"{key}ko",
+                  'total_count': len(contents), 'collected_at': time.time(),
+                  'version': f"v{key}", 'contents': contents}
+        payloads[key] = json.dumps(result, ensure_ascii=False)
+    return payloads, len(mentioned)
+
+def legacy_index(contents):
+    """기존 조회 인덱스: 타입별 (음수 게시 시각 리스트, 콘텐츠 딕셔너리 리스트)"""
+    entries = sorted(((content_timestamp(c), c) for c in contents), key=lambda e: e[0], reverse=True)
+    views = {None: ([-t for t, _ in entries], [c for _, c in entries])}
+    for content_type in CONTENT_TYPES:
+        selected = [e for e in entries if e[1].get('type') == content_type]
+        views[content_type] = ([-t for t, _ in selected], [c for _, c in selected])
+    return views
+
+def legacy_query(indexes, offset, limit):
+    streams = [zip(*views[None]) for views in indexes]
+    merged = heapq.merge(*streams, key=lambda entry: entry[0])
+    return [content for _, content in islice(merged, offset, offset + limit)]
+
+def build_legacy(payloads):
+    data = {key: json.loads(text) for key, text in payloads.items()}
+    indexes = {key: legacy_index(result['contents']) for key, result in data.items()}
+    return data, indexes
+
+def build_shared(payloads):
+    store = ItemStore()
+    data = {key: store.store_result(json.loads(text)) for key, text in payloads.items()}
+    indexes = {key: KeywordIndex(result) for key, result in data.items()}
+    return store, data, indexes
+
+def measure(build, payloads):
+    """유지 메모리(바이트)와 생성 시간(초), 생성 결과 (tracemalloc은 할당마다 비용을 더하므로 시간은 따로 측정)"""
+    gc.collect()
+    start = time.perf_counter()
+    built = build(payloads)
+    elapsed = time.perf_counter() - start
+    del built
+    gc.collect()
+    tracemalloc.start()
+    built = build(payloads)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return retained, elapsed, built
+
+def time_pages(run):
+    start = time.perf_counter()
+    for i in range(PAGE_QUERIES):
+        run(i * 20)
+    return (time.perf_counter() - start) / PAGE_QUERIES
+
+def main():
+    rng = random.Random(0)
+    payloads, unique = make_payloads(rng)
+    
+    legacy_bytes, legacy_time, (legacy_data, legacy_indexes) = measure(build_legacy, payloads)
+    shared_bytes, shared_time, (store, shared_data, shared_indexes) = measure(build_shared, payloads)
+    
+    # 같은 내용을 돌려주는지 확인
+    for key in list(payloads)[:20]:
+        assert shared_data[key].to_dict() == legacy_data[key], key
+    keys = list(payloads)
+    sample = rng.sample(keys, 50)
+    legacy_page = legacy_query([legacy_indexes[key] for key in sample], 100, 20)
+    shared_page, _, _ = query_contents([shared_indexes[key] for key in sample], offset=100, limit=20)
+    assert [c['published_at'] for c in shared_page] == [c['published_at'] for c in legacy_page]
+    assert len(store) == unique, (len(store), unique)
+    
+    # 첫 조회는 페이지 항목의 딕셔너리를 만들고, 재조회는 인덱스에 보관된 딕셔너리를 재사용
+    legacy_page_time = time_pages(lambda offset: legacy_query([legacy_indexes[k] for k in sample], offset, 20))
+    legacy_repeat_time = time_pages(lambda offset: legacy_query([legacy_indexes[k] for k in sample], offset, 20))
+    shared_page_time = time_pages(lambda offset: query_contents(
+        [shared_indexes[k] for k in sample], offset=offset, limit=20))
+    shared_repeat_time = time_pages(lambda offset: query_contents(
+        [shared_indexes[k] for k in sample], offset=offset, limit=20))
+    
+    references = KEYWORD_COUNT * ITEMS_PER_KEYWORD
+    mb = 1024 * 1024
+    print(f"\n키워드 {KEYWORD_COUNT}개 × 항목 {ITEMS_PER_KEYWORD}개 = 참조 {references:,}개, 고유 항목 {unique:,}개")
+    print(f"{'':22}{'유지 메모리':>12}{'항목당':>10}{'생성 시간':>12}{'페이지 조회':>14}{'재조회':>11}")
+    print(f"{'기존 (딕셔너리 사본)':20}{legacy_bytes / mb:10.1f}MB{legacy_bytes / references:9.0f}B"
+          f"{legacy_time:11.2f}s{legacy_page_time * 1000:12.2f}ms{legacy_repeat_time * 1000:12.2f}ms")
+    print(f"{'공유 저장소':22}{shared_bytes / mb:10.1f}MB{shared_bytes / references:9.0f}B"
+          f"{shared_time:11.2f}s{shared_page_time * 1000:12.2f}ms{shared_repeat_time * 1000:12.2f}ms")
+    print(f"메모리 절감: {(1 - shared_bytes / legacy_bytes) * 100:.0f}% ({legacy_bytes / shared_bytes:.1f}x)")
+    print(f"페이지 조회: 키워드 {len(sample)}개 병합, 20개씩 {PAGE_QUERIES}회 (공유 저장소는 처음 조회된 항목만 딕셔너리 생성)")
+
+if __name__ == '__main__':
+    main()
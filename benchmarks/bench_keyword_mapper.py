@@ -0,0 +1,126 @@
+"""
+키워드 정규화 벤치마크
+아티스트 5,000명(대표명·한글명·별칭 20,000개) 별칭 파일로 검색어 100,000개를 정규화하여
+기존 방식(KEYWORD_MAP 선형 탐색)과 미리 색인한 별칭 색인(해시 맵 + Aho-Corasick)을 비교합니다.
+
+실행: python benchmarks/bench_keyword_mapper.py
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from backend.config import Config
+from backend import keyword_mapper
+
+ARTIST_COUNT = 5_000
+QUERY_COUNT = 100_000
+LEGACY_QUERY_COUNT = 500  # 기존 방식은 너무 느려 일부만 측정
+
+def korean_name(i):
+    """i마다 다른 한글 이름 (세 음절)"""
+    syllables = [chr(0xAC00 + (i * 7 + offset * 131) % 11172) for offset in range(3)]
+    return ''.join(syllables) + str(i)
+
+def make_artists(count):
+    return [
+        {'en': f"Artist{i}", 'ko': korean_name(i), 'aliases': [f"ARTIST {i}", f"A{i}X"]}
+        for i in range(count)
+    ]
+
+def make_queries(artists, count, rng):
+    queries = []
+    for _ in range(count):
+        artist = rng.choice(artists)
+        kind = rng.random()
+        if kind < 0.4:
+            # 대소문자가 다른 정확한 이름/별칭
+            name = rng.choice([artist['en']] + artist['aliases'])
+            queries.append(name.upper() if rng.random() < 0.5 else name.lower())
+        elif kind < 0.6:
+            queries.append(artist['ko'])
+        elif kind < 0.8:
+            queries.append(f"{artist['en']} comeback stage")
+        else:
+            queries.append(f"unknown query {rng.randrange(10 ** 6)}")
+    return queries
+
+def legacy_normalize(keyword, keyword_map):
+    """기존 구현: 대문자 정확 매칭 후 KEYWORD_MAP 전체를 부분 문자열로 선형 탐색"""
+    keyword = keyword.strip()
+    if any('가' <= char <= '힣' for char in keyword):
+        for en_key, ko_value in keyword_map.items():
+            if ko_value == keyword:
+                return {'en': en_key, 'ko': keyword}
+        return {'en': keyword, 'ko': keyword}
+    keyword_upper = keyword.upper().strip()
+    if keyword_upper in keyword_map:
+        return {'en': keyword, 'ko': keyword_map[keyword_upper]}
+    for en_key, ko_key in keyword_map.items():
+        if en_key.upper() in keyword_upper or keyword_upper in en_key.upper():
+            return {'en': keyword, 'ko': ko_key}
+    return {'en': keyword, 'ko': keyword}
+
+def main():
+    rng = random.Random(0)
+    artists = make_artists(ARTIST_COUNT)
+    keyword_map = {}
+    for artist in artists:
+        for name in [artist['en']] + artist['aliases']:
+            keyword_map[name] = artist['ko']
+    queries = make_queries(artists, QUERY_COUNT, rng)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'keyword_aliases.json'
+        path.write_text(json.dumps({'artists': artists}, ensure_ascii=False), encoding='utf-8')
+        Config.KEYWORD_ALIASES_PATH = path
+        
+        start = time.perf_counter()
+        index = keyword_mapper.reload_aliases()
+        build_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for query in queries[:LEGACY_QUERY_COUNT]:
+            legacy_normalize(query, keyword_map)
+        legacy_per_query = (time.perf_counter() - start) / LEGACY_QUERY_COUNT
+        
+        start = time.perf_counter()
+        results = [keyword_mapper.normalize_keyword(query) for query in queries]
+        indexed_time = time.perf_counter() - start
+        indexed_per_query = indexed_time / QUERY_COUNT
+        
+        # 정확한 이름/한글명/이름이 포함된 검색어는 모두 해당 아티스트로, 모르는 검색어는 그대로
+        by_en = {artist['en'].casefold(): artist for artist in artists}
+        for query, result in zip(queries, results):
+            if query.startswith('unknown'):
+                assert result == {'en': query, 'ko': query}, (query, result)
+            elif keyword_mapper.has_korean(query):
+                assert by_en[result['en'].casefold()]['ko'] == query, (query, result)
+            else:
+                assert result['ko'] != query, (query, result)
+        
+        # 파일 교체 후 새 색인으로 바뀌는지 확인
+        artists[0]['ko'] = '교체된이름'
+        path.write_text(json.dumps({'artists': artists}, ensure_ascii=False), encoding='utf-8')
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+        keyword_mapper.MTIME_CHECK_INTERVAL = 0
+        assert keyword_mapper.get_korean_keyword('artist0') == '교체된이름'
+    
+    names = sum(1 + len(artist['aliases']) + 1 for artist in artists)
+    print(f"\n아티스트 {ARTIST_COUNT:,}명 (이름/별칭 {names:,}개), 검색어 {QUERY_COUNT:,}개")
+    print(f"색인 생성:                {build_time * 1000:10.1f} ms (오토마톤 노드 {len(index._matcher._automaton._goto):,}개)")
+    print(f"기존 방식 (검색어당):      {legacy_per_query * 1e6:10.1f} us")
+    print(f"별칭 색인 (검색어당):      {indexed_per_query * 1e6:10.2f} us")
+    print(f"별칭 색인 전체:            {indexed_time * 1000:10.1f} ms ({QUERY_COUNT / indexed_time:,.0f} 검색어/초)")
+    print(f"기존 대비:                 {legacy_per_query / indexed_per_query:10.0f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+네이버 뉴스 페이지 수집 벤치마크
+기사가 많은 키워드(24시간 동안 N분마다 기사)에 대해 첫 페이지만 요청할 때와
+페이지를 순차/동시에 요청할 때의 수집 기사 수, 요청 수, 소요 시간을 비교합니다.
+
+실행: python benchmarks/bench_naver_paging.py
+"""
+import contextlib
+import io
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from backend.news_collector import NewsCollector, MAX_START
+    from backend.config import Config
+
+REQUEST_LATENCY = 0.05  # 페이지 요청 1회당 지연 (초)
+TOTAL_RESULTS = 4000  # API가 알려주는 전체 결과 수
+ARTICLE_INTERVALS = [30, 5, 2]  # 기사 간격 (분)
+
+class StubResponse:
+    def __init__(self, data):
+        self._data = data
+    
+    def json(self):
+        return self._data
+
+class StubNewsCollector(NewsCollector):
+    """start/display에 맞는 날짜순 가짜 기사를 반환하는 수집기"""
+    
+    def __init__(self, interval_minutes):
+        with contextlib.redirect_stdout(io.StringIO()):
+            super().__init__()
+        self.client_id = self.client_secret = 'stub'
+        self.interval = timedelta(minutes=interval_minutes)
+        self.now = datetime.now(timezone(timedelta(hours=9)))
+        self.requests = 0
+        self._lock = threading.Lock()
+    
+    def _get(self, params):
+        time.sleep(REQUEST_LATENCY)
+        with self._lock:
+            self.requests += 1
+        start, display = params['start'], params['display']
+        items = [
+            {
+                'title': f"기사 {i}",
+                'description': '',
+                'link': f"https://news.example.com/{i}",
+                'originallink': '',
+                'pubDate': (self.now - self.interval * i).strftime('%a, %d %b %Y %H:%M:%S %z'),
+            }
+            for i in range(start - 1, min(start - 1 + display, TOTAL_RESULTS))
+        ]
+        return StubResponse({'items': items, 'total': TOTAL_RESULTS})
+
+def run(interval, max_pages, concurrency):
+    Config.NAVER_MAX_PAGES = max_pages
+    Config.NAVER_PAGE_CONCURRENCY = concurrency
+    collector = StubNewsCollector(interval)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = collector.search('아티스트', max_results=100)
+    return len(results), collector.requests, time.perf_counter() - start
+
+def main():
+    max_pages = MAX_START // 100
+    print(f"\n페이지당 100개, 최대 {max_pages}페이지, 요청 지연 {REQUEST_LATENCY * 1000:.0f}ms")
+    print(f"{'interval':>9} {'in 24h':>7} {'mode':>16} {'articles':>9} {'requests':>9} {'time(s)':>8}")
+    
+    for interval in ARTICLE_INTERVALS:
+        expected = min((24 * 60 - 1) // interval + 1, MAX_START)
+        for label, pages, concurrency in (('first page', 1, 1),
+                                          ('sequential', max_pages, 1),
+                                          ('concurrent x3', max_pages, 3)):
+            count, requests_made, elapsed = run(interval, pages, concurrency)
+            print(f"{interval:>8}m {expected:>7} {label:>16} {count:>9} {requests_made:>9} {elapsed:>8.2f}")
+            if pages > 1:
+                assert count == expected, (count, expected)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+유사 중복 제거 벤치마크
+같은 기사를 언론사별로 조금씩 바꾼 합성 뉴스 10,000건으로
+SimHash 밴드 클러스터링의 소요 시간과 정확도를 측정하고 전수 비교와 비교합니다.
+
+실행: python benchmarks/bench_near_duplicates.py
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from backend.near_deduplicator import NearDuplicateDetector, content_fingerprint
+
+ITEM_COUNT = 10_000
+VARIANTS_PER_STORY = 10
+PAIRWISE_SAMPLE = 2_000
+
+KO_WORDS = ['방탄소년단', '블랙핑크', '뉴진스', '아이브', '르세라핌', '컴백', '신곡', '앨범', '공개',
+            '월드투어', '콘서트', '빌보드', '차트', '1위', '달성', '뮤직비디오', '조회수', '돌파',
+            '팬미팅', '개최', '출연', '확정', '수상', '무대', '화제', '데뷔', '기념', '선공개']
+EN_WORDS = ['BTS', 'BLACKPINK', 'NewJeans', 'IVE', 'LE SSERAFIM', 'comeback', 'new', 'single',
+            'album', 'world', 'tour', 'concert', 'Billboard', 'chart', 'tops', 'music', 'video',
+            'views', 'fan', 'meeting', 'stage', 'award', 'debut', 'anniversary', 'release']
+PREFIXES = ['', '[단독] ', '[포토] ', '(종합) ', '[K-POP] ']
+SUFFIXES = ['', ' (종합)', ' …', '!', ' [영상]']
+
+def make_story(rng, story_id):
+    words = KO_WORDS if story_id % 2 == 0 else EN_WORDS
+    title = ' '.join(rng.choice(words) for _ in range(rng.randint(6, 10)))
+    description = ' '.join(rng.choice(words) for _ in range(rng.randint(15, 25)))
+    return title, description
+
+def make_variant(rng, title, description, outlet):
+    # 앞뒤 꼬리표, 문장 부호, 설명 끝에 언론사 서명 추가
+    variant_title = rng.choice(PREFIXES) + title.replace(' ', rng.choice([' ', ', ', ' '])) + rng.choice(SUFFIXES)
+    variant_description = description + f" 기자 outlet{outlet}"
+    return variant_title, variant_description
+
+def make_items(seed=42):
+    rng = random.Random(seed)
+    items = []
+    for story_id in range(ITEM_COUNT // VARIANTS_PER_STORY):
+        title, description = make_story(rng, story_id)
+        for outlet in range(VARIANTS_PER_STORY):
+            variant_title, variant_description = make_variant(rng, title, description, outlet)
+            items.append({'title': variant_title, 'description': variant_description,
+                          'url': f"https://news.example.com/{story_id}/{outlet}",
+                          'type': 'news', 'story_id': story_id})
+    rng.shuffle(items)
+    return items
+
+def pairwise_cluster(items, max_distance):
+    """비교 기준: 모든 대표와 전수 비교 (O(n^2))"""
+    fingerprints = []
+    representatives = []
+    for item in items:
+        fingerprint = content_fingerprint(item)
+        if any(bin(fingerprint ^ other).count('1') <= max_distance for other in fingerprints):
+            continue
+        fingerprints.append(fingerprint)
+        representatives.append(item)
+    return representatives
+
+def main():
+    detector = NearDuplicateDetector()
+    items = make_items()
+    
+    start = time.perf_counter()
+    representatives = detector.cluster([dict(item) for item in items])
+    elapsed = time.perf_counter() - start
+    
+    stories = {item['story_id'] for item in items}
+    merged_stories = {rep['story_id'] for rep in representatives}
+    clustered = sum(rep['cluster_size'] for rep in representatives)
+    
+    sample = [dict(item) for item in items[:PAIRWISE_SAMPLE]]
+    start = time.perf_counter()
+    pairwise_cluster(sample, detector.max_distance)
+    pairwise_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    detector.cluster([dict(item) for item in sample])
+    banded_sample_elapsed = time.perf_counter() - start
+    
+    print(f"\n항목 {len(items):,}건 (기사 {len(stories):,}개 × 변형 {VARIANTS_PER_STORY}개)")
+    print(f"SimHash 밴드 클러스터링: {elapsed:.2f}s ({elapsed / len(items) * 1e6:.0f} us/항목)")
+    print(f"대표 항목: {len(representatives):,}개 (이상적 값 {len(stories):,}개), "
+          f"누락된 기사 {len(stories - merged_stories)}개, cluster_size 합계 {clustered:,}")
+    print(f"{PAIRWISE_SAMPLE:,}건 비교: 전수 비교 {pairwise_elapsed:.2f}s / 밴드 {banded_sample_elapsed:.2f}s")
+
+if __name__ == '__main__':
+    main()
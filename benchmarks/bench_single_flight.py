@@ -0,0 +1,126 @@
+"""
+실시간 수집 단일 실행(single-flight) 동시성 테스트
+캐시에 없는 키워드를 여러 클라이언트가 동시에 조회할 때
+정규화된 키워드마다 업스트림 수집이 정확히 한 번만 실행되는지 확인합니다.
+
+실행: python benchmarks/bench_single_flight.py
+"""
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# 벤치마크 데이터가 실제 저장소에 기록되지 않도록 비활성화
+os.environ['RESULT_STORE_ENABLED'] = 'False'
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from backend import app as app_module
+
+SEARCH_LATENCY = 0.3  # 검색 1회당 지연 (초)
+CLIENTS_PER_KEYWORD = 10
+# 같은 키워드의 다른 표기(한글명)도 하나의 수집으로 묶여야 함
+KEYWORD_ALIASES = {
+    'BTS': ['BTS', '방탄소년단'],
+    'BLACKPINK': ['BLACKPINK', '블랙핑크'],
+    'NewArtist': ['NewArtist'],
+}
+
+upstream_calls = Counter()
+upstream_lock = threading.Lock()
+
+class StubCollector:
+    """고정 지연 후 가짜 결과를 반환하는 수집기"""
+    
+    def __init__(self, source, content_type):
+        self.source = source
+        self.content_type = content_type
+    
+    def search(self, keyword, max_results=50, published_after=None, since=None):
+        time.sleep(SEARCH_LATENCY)
+        return [{
+            'title': f"{keyword} {self.source}",
+            'description': '',
+            'url': f"https://example.com/{self.source}/{keyword}",
+            'published_at': time.strftime('%Y-%m-%dT%H:%M:%S+00:00', time.gmtime()),
+            'type': self.content_type,
+        }]
+    
+    def get_video_statistics(self, video_ids):
+        return {}
+
+def install_stubs():
+    collector = app_module.collector
+    collector.youtube_collector = StubCollector('youtube', 'video')
+    collector.news_collector = StubCollector('naver', 'news')
+    original_collect_all = collector.collect_all
+    
+    def counting_collect_all(keyword_obj, previous=None):
+        with upstream_lock:
+            upstream_calls[collector.keyword_key(keyword_obj)] += 1
+        return original_collect_all(keyword_obj, previous=previous)
+    
+    collector.collect_all = counting_collect_all
+
+def reset():
+    upstream_calls.clear()
+    app_module.content_cache.replace({})
+
+def burst(wait):
+    """모든 키워드 표기를 CLIENTS_PER_KEYWORD번씩 동시에 조회"""
+    requests_to_send = [
+        aliases[i % len(aliases)]
+        for aliases in KEYWORD_ALIASES.values()
+        for i in range(CLIENTS_PER_KEYWORD)
+    ]
+    barrier = threading.Barrier(len(requests_to_send))
+    
+    def client(keyword):
+        test_client = app_module.app.test_client()
+        barrier.wait()
+        response = test_client.get('/api/content', query_string={'keyword': keyword, 'wait': str(wait).lower()})
+        return response.status_code
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(requests_to_send)) as executor:
+        statuses = list(executor.map(client, requests_to_send))
+    return time.perf_counter() - start, Counter(statuses)
+
+def main():
+    # 초기 수집 스레드가 끝난 뒤 스텁으로 교체
+    with contextlib.redirect_stdout(io.StringIO()):
+        app_module.collection_queue.wait_idle()
+    install_stubs()
+    clients = CLIENTS_PER_KEYWORD * len(KEYWORD_ALIASES)
+    print(f"\n키워드 {len(KEYWORD_ALIASES)}개 × 동시 요청 {CLIENTS_PER_KEYWORD}개, 검색 지연 {SEARCH_LATENCY * 1000:.0f}ms")
+    
+    failed = False
+    for wait in (True, False):
+        reset()
+        with contextlib.redirect_stdout(io.StringIO()):
+            elapsed, statuses = burst(wait)
+            # 202로 응답한 경우 백그라운드 수집이 끝날 때까지 대기
+            deadline = time.monotonic() + 10
+            while (len(app_module.content_cache.state.data) < sum(len(a) for a in KEYWORD_ALIASES.values())
+                   and time.monotonic() < deadline):
+                time.sleep(0.05)
+        calls = dict(upstream_calls)
+        ok = all(calls.get(key) == 1 for key in KEYWORD_ALIASES) and len(calls) == len(KEYWORD_ALIASES)
+        failed |= not ok
+        print(f"wait={str(wait):<5} 요청 {clients}개 {elapsed:.2f}s, 응답 {dict(statuses)}, "
+              f"업스트림 수집 {calls} -> {'OK' if ok else 'FAIL'}")
+    
+    if failed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+"""
+오프라인 성능 벤치마크 모음
+기록/가짜 API 응답(benchmarks/replay.py)을 사용하여 API 키 없이
+키워드 5/50/500개 규모에서 다음 항목의 처리량, p50/p99 지연, 최대 메모리를 측정합니다.
+
+- collect: DataCollector.collect_multiple_keywords (키워드별 완료 시각 기준 지연)
+- dedup: Deduplicator.remove_duplicates (수집 결과 + 중복 항목)
+- blacklist: filter_blocked (수집 항목의 10% 차단)
+- endpoints: Flask /api/content (전체, 키워드, 페이지), /api/status
+
+결과를 --save로 저장해 두고 --compare로 비교하면 처리량이 줄거나 p99가 늘어난 항목이
+허용 비율(--tolerance)을 넘을 때 실패(종료 코드 1)합니다.
+
+실행: python benchmarks/bench_suite.py [--scales 5,50,500] [--latency-ms 20] [--error-rate 0.01]
+                                       [--save baseline.json] [--compare baseline.json]
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# 벤치마크가 실제 저장소/쿼터/블랙리스트에 기록하지 않도록 임시 경로와 넉넉한 한도 사용
+BENCH_DIR = tempfile.mkdtemp(prefix='bench_suite_')
+os.environ['RESULT_STORE_ENABLED'] = 'False'
+os.environ['QUOTA_STATE_PATH'] = os.path.join(BENCH_DIR, 'quota_usage.json')
+os.environ['YOUTUBE_DAILY_QUOTA'] = str(10 ** 9)
+os.environ['NAVER_DAILY_LIMIT'] = str(10 ** 9)
+os.environ['YOUTUBE_CALLS_PER_SECOND'] = '0'
+os.environ['NAVER_CALLS_PER_SECOND'] = '0'
+os.environ.setdefault('NAVER_BACKOFF_BASE', '0.05')
+os.environ.setdefault('LOG_LEVEL', 'WARNING')  # 요청별 로그가 결과 표에 섞이지 않도록
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from backend import blacklist_store
+    from backend.data_collector import DataCollector
+    from backend.deduplicator import Deduplicator
+    from replay import FixtureStore, install_replay
+
+SCENARIOS = ('collect', 'dedup', 'blacklist', 'endpoints')
+DEDUP_REPEAT = 20
+BLACKLIST_REPEAT = 50
+BLOCKED_RATIO = 0.1
+
+def percentile(values, q):
+    """정렬 후 최근접 순위 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+def make_keywords(count):
+    return [{'en': f"artist{i}", 'ko': f"아티스트{i}"} for i in range(count)]
+
+def peak_memory(fn):
+    """fn 실행 중 Python 할당 메모리 최대치 (MB)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+def row(scenario, scale, ops, unit, seconds, latencies, memory_mb):
+    return {
+        'scenario': scenario,
+        'scale': scale,
+        'ops': ops,
+        'unit': unit,
+        'seconds': seconds,
+        'throughput': ops / seconds if seconds else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'peak_mb': memory_mb,
+    }
+
+def run_collect(keywords, store, latency_ms, error_rate):
+    """키워드 수집 1회 (수집 결과, 키워드별 완료 지연, 소요 시간, 요청 통계)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        collector = DataCollector()
+    transport = install_replay(collector, store, latency_ms=latency_ms, error_rate=error_rate)
+    completed = []
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = collector.collect_multiple_keywords(
+            keywords, on_result=lambda key, result: completed.append(time.perf_counter() - start)
+        )
+    return results, completed, time.perf_counter() - start, transport
+
+def bench_collect(scale, store, args):
+    keywords = make_keywords(scale)
+    results, latencies, seconds, transport = run_collect(keywords, store, args.latency_ms, args.error_rate)
+    # 메모리는 지연 없이 한 번 더 실행하여 측정
+    memory = peak_memory(lambda: run_collect(keywords, store, 0, 0.0))
+    info = f"요청 {transport.requests}회 (재생 {transport.replayed}, 실패 주입 {transport.errors})"
+    return row('collect', scale, len(keywords), 'keywords', seconds, latencies, memory), results, info
+
+def flatten(results):
+    return [content for result in results.values() for content in result.get('contents', [])]
+
+def bench_dedup(scale, results):
+    contents = flatten(results)
+    # 다른 키워드/검색어에서 같은 기사가 다시 들어온 상황을 흉내내기 위해 절반을 복제
+    items = contents + random.Random(0).sample(contents, len(contents) // 2)
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(DEDUP_REPEAT):
+        call_start = time.perf_counter()
+        Deduplicator().remove_duplicates(items)
+        latencies.append(time.perf_counter() - call_start)
+    seconds = time.perf_counter() - start
+    memory = peak_memory(lambda: Deduplicator().remove_duplicates(items))
+    return row('dedup', scale, len(items) * DEDUP_REPEAT, 'items', seconds, latencies, memory)
+
+def bench_blacklist(scale, results):
+    contents = flatten(results)
+    blocked_ids = {content['content_id'] for content in random.Random(1).sample(contents, int(len(contents) * BLOCKED_RATIO))}
+    blacklist_store.BLACKLIST_PATH = Path(BENCH_DIR) / f'blacklist_{scale}.json'  # 규모별 파일 (mtime 확인 주기 동안 이전 인덱스를 재사용하지 않도록)
+    blacklist_store.BLACKLIST_PATH.write_text(json.dumps({
+        'blocked_ids': sorted(blocked_ids),
+        'blocked_urls': [],
+    }), encoding='utf-8')
+    blacklist_store.filter_blocked([])  # 인덱스 로드는 측정에서 제외
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(BLACKLIST_REPEAT):
+        call_start = time.perf_counter()
+        kept = blacklist_store.filter_blocked(contents)
+        latencies.append(time.perf_counter() - call_start)
+    seconds = time.perf_counter() - start
+    assert len(kept) == sum(1 for content in contents if content['content_id'] not in blocked_ids)
+    memory = peak_memory(lambda: blacklist_store.filter_blocked(contents))
+    return row('blacklist', scale, len(contents) * BLACKLIST_REPEAT, 'items', seconds, latencies, memory)
+
+_app_module = None
+
+def load_app(store):
+    """Flask 앱 로드 (초기 수집이 끝난 뒤 수집기를 재생용으로 교체)"""
+    global _app_module
+    if _app_module is None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            from backend import app as app_module
+            app_module.collection_queue.wait_idle(timeout=60)
+        install_replay(app_module.collector, store)
+        _app_module = app_module
+    return _app_module
+
+def bench_endpoints(scale, results, store, args):
+    app_module = load_app(store)
+    with contextlib.redirect_stdout(io.StringIO()):
+        app_module.content_cache.replace(results)
+    client = app_module.app.test_client()
+    keys = sorted(results)
+    rng = random.Random(2)
+    requests_to_send = []
+    for i in range(args.requests):
+        kind = i % 4
+        if kind == 0:
+            requests_to_send.append(('/api/content', {}))
+        elif kind == 1:
+            requests_to_send.append(('/api/content', {'keyword': rng.choice(keys)}))
+        elif kind == 2:
+            requests_to_send.append(('/api/content', {'limit': 20, 'type': 'news'}))
+        else:
+            requests_to_send.append(('/api/status', {}))
+    
+    def send_all():
+        latencies = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for path, query in requests_to_send:
+                call_start = time.perf_counter()
+                response = client.get(path, query_string=query)
+                response.get_data()
+                latencies.append(time.perf_counter() - call_start)
+                assert response.status_code == 200, (path, query, response.status_code)
+        return latencies
+    
+    start = time.perf_counter()
+    latencies = send_all()
+    seconds = time.perf_counter() - start
+    memory = peak_memory(send_all)
+    return row('endpoints', scale, len(requests_to_send), 'requests', seconds, latencies, memory)
+
+def compare(rows, baseline_path, tolerance):
+    """기준 결과와 비교하여 회귀 항목 목록 반환"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {(r['scenario'], r['scale']): r for r in json.load(f)['rows']}
+    regressions = []
+    for current in rows:
+        base = baseline.get((current['scenario'], current['scale']))
+        if base is None:
+            continue
+        if current['throughput'] < base['throughput'] * (1 - tolerance):
+            regressions.append(f"{current['scenario']}@{current['scale']} 처리량 "
+                               f"{base['throughput']:.1f} -> {current['throughput']:.1f} {current['unit']}/s")
+        if base['p99_ms'] > 0 and current['p99_ms'] > base['p99_ms'] * (1 + tolerance):
+            regressions.append(f"{current['scenario']}@{current['scale']} p99 "
+                               f"{base['p99_ms']:.2f} -> {current['p99_ms']:.2f} ms")
+    return regressions
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='오프라인 성능 벤치마크 (기록/가짜 API 응답 사용)')
+    parser.add_argument('--scales', default='5,50,500', help='키워드 수 목록 (쉼표 구분)')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help='실행할 항목 (쉼표 구분)')
+    parser.add_argument('--latency-ms', type=float, default=20, help='API 요청당 평균 지연 (밀리초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='API 요청 실패 주입 비율 (0~1)')
+    parser.add_argument('--requests', type=int, default=200, help='endpoints 항목의 요청 수')
+    parser.add_argument('--fixtures', default=None, help='기록 응답 디렉터리 (기본: benchmarks/fixtures)')
+    parser.add_argument('--save', help='결과를 JSON으로 저장할 경로')
+    parser.add_argument('--compare', help='비교할 기준 결과 JSON 경로')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='회귀로 판단할 변화 비율')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    scales = [int(value) for value in args.scales.split(',') if value]
+    scenarios = [value for value in args.scenarios.split(',') if value]
+    store = FixtureStore(args.fixtures) if args.fixtures else FixtureStore()
+    
+    print(f"\nAPI 지연 {args.latency_ms:.0f}ms, 실패 주입 {args.error_rate:.1%}, "
+          f"기록 응답 YouTube {store.count('youtube')}개 / 네이버 {store.count('naver')}개 (그 외는 가짜 응답)")
+    print(f"{'scenario':<10} {'scale':>6} {'ops':>9} {'throughput':>18} {'p50(ms)':>9} {'p99(ms)':>9} {'peak(MB)':>9}")
+    
+    rows = []
+    for scale in scales:
+        collect_row, results, info = bench_collect(scale, store, args)
+        measured = {
+            'collect': lambda: collect_row,
+            'dedup': lambda: bench_dedup(scale, results),
+            'blacklist': lambda: bench_blacklist(scale, results),
+            'endpoints': lambda: bench_endpoints(scale, results, store, args),
+        }
+        for scenario in scenarios:
+            current = measured[scenario]()
+            rows.append(current)
+            print(f"{current['scenario']:<10} {scale:>6} {current['ops']:>9} "
+                  f"{current['throughput']:>10.1f} {current['unit'] + '/s':<7} "
+                  f"{current['p50_ms']:>9.2f} {current['p99_ms']:>9.2f} {current['peak_mb']:>9.1f}")
+            if scenario == 'collect':
+                print(f"{'':<17} {info}")
+    
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({'args': vars(args), 'rows': rows}, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.save}")
+    
+    if args.compare:
+        regressions = compare(rows, args.compare, args.tolerance)
+        if regressions:
+            print(f"\n[FAIL] 기준 대비 {args.tolerance:.0%} 이상 나빠진 항목:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print(f"\n[OK] 기준 결과({args.compare}) 대비 회귀 없음")
+
+if __name__ == '__main__':
+    main()
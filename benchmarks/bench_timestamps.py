@@ -0,0 +1,125 @@
+"""
+게시 시각 파싱 벤치마크
+YouTube(ISO, Z)와 네이버(pubDate, +0900) 형식이 섞인 게시 시각 100,000개를
+기존 방식(strptime 파싱, 항목마다 24시간 판정과 상대 시간 계산에서 다시 파싱, 문자열 정렬)과
+새 방식(형식별 파서로 epoch 초 한 번 변환, 기준 시각 한 번 계산, 숫자 정렬)으로 처리합니다.
+
+실행: python benchmarks/bench_timestamps.py
+"""
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from backend import utils
+
+TIMESTAMP_COUNT = 100_000
+KST = timezone(timedelta(hours=9))
+
+def make_items(rng, now):
+    """(소스, 원본 게시 시각 문자열) 리스트 - 최근 30시간 안에서 무작위"""
+    items = []
+    for _ in range(TIMESTAMP_COUNT):
+        published = now - timedelta(seconds=rng.randrange(30 * 3600))
+        if rng.random() < 0.5:
+            items.append(('youtube', published.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')))
+        else:
+            items.append(('naver', published.astimezone(KST).strftime('%a, %d %b %Y %H:%M:%S %z')))
+    return items
+
+def legacy_within_24_hours(published_time, hours=24):
+    """기존 is_within_24_hours (문자열이면 매번 파싱하고 호출마다 현재 시각 계산)"""
+    if isinstance(published_time, str):
+        try:
+            published_time = datetime.fromisoformat(published_time.replace('Z', '+00:00'))
+        except ValueError:
+            return False
+    now = datetime.now(published_time.tzinfo) if published_time.tzinfo else datetime.now()
+    return now - published_time <= timedelta(hours=hours)
+
+def legacy_format(dt):
+    """기존 format_datetime (수집 시 항목마다 상대 시간 문자열 생성)"""
+    if isinstance(dt, str):
+        dt = datetime.fromisoformat(dt.replace('Z', '+00:00'))
+    diff = datetime.now(dt.tzinfo) - dt
+    if diff.days > 0:
+        return f"{diff.days}일 전"
+    if diff.seconds >= 3600:
+        return f"{diff.seconds // 3600}시간 전"
+    return f"{diff.seconds // 60}분 전"
+
+def run_legacy(items):
+    results = []
+    for source, value in items:
+        if source == 'naver':
+            published = datetime.strptime(value, '%a, %d %b %Y %H:%M:%S %z')
+            if not legacy_within_24_hours(published):
+                continue
+            results.append({'published_at': published.isoformat(), 'published_at_formatted': legacy_format(published)})
+        elif legacy_within_24_hours(value):
+            results.append({'published_at': value, 'published_at_formatted': legacy_format(value)})
+    # 이전 결과의 유효 기간 확인에서 다시 파싱
+    results = [r for r in results if legacy_within_24_hours(r['published_at'])]
+    results.sort(key=lambda r: r['published_at'], reverse=True)
+    return results
+
+def run_new(items):
+    cutoff = utils.cutoff_timestamp()
+    results = []
+    for source, value in items:
+        if source == 'naver':
+            published_at = utils.rfc2822_to_iso(value)
+            published_ts = utils.parse_timestamp(published_at) if published_at else None
+        else:
+            published_at = value
+            published_ts = utils.parse_timestamp(value)
+        if published_ts is not None and published_ts >= cutoff:
+            results.append({'published_at': published_at, 'published_ts': published_ts})
+    results = [r for r in results if utils.content_timestamp(r) >= cutoff]
+    results.sort(key=utils.content_timestamp, reverse=True)
+    return results
+
+def out_of_order(results):
+    """실제 게시 시각 기준으로 최신순이 아닌 인접 쌍 수"""
+    stamps = [datetime.fromisoformat(r['published_at'].replace('Z', '+00:00')).timestamp() for r in results]
+    return sum(1 for a, b in zip(stamps, stamps[1:]) if a < b)
+
+def timed(run, items):
+    start = time.perf_counter()
+    results = run(items)
+    return time.perf_counter() - start, results
+
+def main():
+    rng = random.Random(0)
+    now = datetime.now(timezone.utc)
+    items = make_items(rng, now)
+    # 영문/한글 검색 결과처럼 같은 페이지(100개)의 문자열이 곧바로 다시 나오는 경우
+    repeated = []
+    for start in range(0, TIMESTAMP_COUNT // 2, 100):
+        page = items[start:start + 100]
+        repeated += page + page
+    
+    legacy_time, legacy_results = timed(run_legacy, items)
+    utils._parse_timestamp_text.cache_clear()
+    new_time, new_results = timed(run_new, items)
+    utils._parse_timestamp_text.cache_clear()
+    repeated_time, _ = timed(run_new, repeated)
+    
+    assert len(new_results) == len(legacy_results), (len(new_results), len(legacy_results))
+    assert out_of_order(new_results) == 0
+    
+    print(f"\n게시 시각 {TIMESTAMP_COUNT:,}개 (YouTube Z / 네이버 +0900 반반), 24시간 이내 {len(new_results):,}개")
+    print(f"기존 (strptime, 재파싱, 문자열 정렬):  {legacy_time * 1000:8.1f} ms ({legacy_time / TIMESTAMP_COUNT * 1e6:.2f} us/개)")
+    print(f"새 방식 (epoch 한 번, 숫자 정렬):      {new_time * 1000:8.1f} ms ({new_time / TIMESTAMP_COUNT * 1e6:.2f} us/개)")
+    print(f"새 방식 (같은 문자열 50% 반복):        {repeated_time * 1000:8.1f} ms ({repeated_time / TIMESTAMP_COUNT * 1e6:.2f} us/개)")
+    print(f"기존 대비:                             {legacy_time / new_time:8.1f}x")
+    print(f"정렬 오류 (최신순이 아닌 인접 쌍):     기존 {out_of_order(legacy_results):,}개 / 새 방식 {out_of_order(new_results)}개")
+
+if __name__ == '__main__':
+    main()
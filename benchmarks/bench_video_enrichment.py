@@ -0,0 +1,129 @@
+"""
+유튜브 영상 통계 보강 벤치마크
+여러 키워드의 검색 결과(키워드 간 겹치는 영상 포함)에 대해
+영상별 개별 요청과 videos.list 50개 묶음 요청의 API 호출 수/쿼터 사용량/소요 시간을 비교합니다.
+
+실행: python benchmarks/bench_video_enrichment.py
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# 벤치마크 호출이 실제 쿼터 사용량에 기록되지 않도록 임시 파일 사용
+os.environ['QUOTA_STATE_PATH'] = os.path.join(tempfile.mkdtemp(), 'quota_usage.json')
+os.environ['YOUTUBE_CALLS_PER_SECOND'] = '0'
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from backend.data_collector import DataCollector
+    from backend.youtube_collector import VIDEOS_BATCH_SIZE
+    from backend.quota import quota_manager
+
+REQUEST_LATENCY = 0.01  # videos.list 1회당 지연 (초)
+KEYWORDS = 10
+VIDEOS_PER_KEYWORD = 60
+OVERLAP = 10  # 이웃 키워드와 겹치는 영상 수
+
+class StubVideosApi:
+    """videos().list(...).execute() 호출 수를 세는 가짜 YouTube 클라이언트"""
+    
+    def __init__(self):
+        self.calls = 0
+        self.ids = 0
+    
+    def videos(self):
+        return self
+    
+    def list(self, part, id, maxResults):
+        self._ids = id.split(',')
+        return self
+    
+    def execute(self):
+        time.sleep(REQUEST_LATENCY)
+        self.calls += 1
+        self.ids += len(self._ids)
+        return {'items': [
+            {
+                'id': video_id,
+                'statistics': {'viewCount': '1000', 'likeCount': '10', 'commentCount': '1'},
+                'contentDetails': {'duration': 'PT3M20S'},
+            }
+            for video_id in self._ids
+        ]}
+
+def make_results():
+    """키워드별 영상 검색 결과 (이웃 키워드와 OVERLAP개씩 겹침)"""
+    step = VIDEOS_PER_KEYWORD - OVERLAP
+    return [
+        [
+            {'video_id': f"vid{k * step + i:05d}", 'type': 'video',
+             'url': f"https://www.youtube.com/watch?v=vid{k * step + i:05d}"}
+            for i in range(VIDEOS_PER_KEYWORD)
+        ]
+        for k in range(KEYWORDS)
+    ]
+
+def make_collector():
+    with contextlib.redirect_stdout(io.StringIO()):
+        collector = DataCollector()
+    api = StubVideosApi()
+    collector.youtube_collector.youtube = api
+    collector.youtube_collector._get_client = lambda: api
+    return collector, api
+
+def measure(label, fn):
+    used_before = quota_manager.status()['youtube']['used']
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        stats, api = fn()
+    elapsed = time.perf_counter() - start
+    used = quota_manager.status()['youtube']['used'] - used_before
+    print(f"{label:<28} 호출 {api.calls:>5}회, 쿼터 {used:>5} 유닛, {elapsed:>6.2f}s, 통계 {len(stats)}개")
+    return stats
+
+def main():
+    results = make_results()
+    total = sum(len(contents) for contents in results)
+    unique = len({content['video_id'] for contents in results for content in contents})
+    print(f"\n키워드 {KEYWORDS}개 × 영상 {VIDEOS_PER_KEYWORD}개 (전체 {total}개, 고유 {unique}개), "
+          f"요청 지연 {REQUEST_LATENCY * 1000:.0f}ms")
+    
+    def per_item():
+        collector, api = make_collector()
+        stats = {}
+        for contents in results:
+            for content in contents:
+                stats.update(collector.youtube_collector.get_video_statistics([content['video_id']]))
+                # 개별 조회를 흉내내기 위해 캐시를 비움
+                collector.youtube_collector._stats_cache.clear()
+        return stats, api
+    
+    def batched():
+        collector, api = make_collector()
+        return collector._fetch_video_stats(results), api
+    
+    # 같은 수집기로 한 번 조회해 캐시를 채워 둠
+    collector, cached_api = make_collector()
+    with contextlib.redirect_stdout(io.StringIO()):
+        collector._fetch_video_stats(results)
+    cached_api.calls = 0
+    
+    def batched_cached():
+        return collector._fetch_video_stats(results), cached_api
+    
+    baseline = measure('영상별 요청', per_item)
+    stats = measure(f'{VIDEOS_BATCH_SIZE}개 묶음 요청', batched)
+    measure('묶음 요청 (TTL 캐시 적중)', batched_cached)
+    
+    assert stats == baseline and len(stats) == unique
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""
+API 응답 기록 스크립트
+.env의 실제 API 키로 키워드를 한 번 수집하면서 YouTube/네이버 응답을 benchmarks/fixtures/에 기록합니다.
+기록한 응답은 benchmarks/replay.py와 bench_suite.py가 API 키 없이 재생합니다.
+
+실행: python benchmarks/record_fixtures.py [키워드 ...]
+      (키워드를 생략하면 Config.DEFAULT_KEYWORDS)
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from backend.config import Config
+from backend.data_collector import DataCollector
+from backend.keyword_mapper import normalize_keyword
+from replay import FixtureStore, FIXTURES_DIR, install_recorders
+
+def main():
+    if not Config.YOUTUBE_API_KEY or not Config.NAVER_CLIENT_ID or not Config.NAVER_CLIENT_SECRET:
+        print("[ERROR] 응답을 기록하려면 .env에 YOUTUBE_API_KEY, NAVER_CLIENT_ID, NAVER_CLIENT_SECRET이 필요합니다.")
+        sys.exit(1)
+    
+    keywords = [normalize_keyword(keyword) for keyword in (sys.argv[1:] or Config.DEFAULT_KEYWORDS)]
+    store = FixtureStore(FIXTURES_DIR)
+    collector = DataCollector()
+    install_recorders(collector, store)
+    
+    results = collector.collect_multiple_keywords(keywords)
+    store.save()
+    
+    print(f"\n[OK] 키워드 {len(results)}개 수집, 응답 기록: "
+          f"YouTube {store.count('youtube')}개, 네이버 {store.count('naver')}개 -> {FIXTURES_DIR}")
+
+if __name__ == '__main__':
+    main()
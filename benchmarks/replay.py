@@ -0,0 +1,404 @@
+"""
+API 응답 기록/재생 모듈
+실제 YouTube/네이버 API 응답을 파일로 기록해 두고, API 키 없이 같은 응답을 돌려주는
+대체 클라이언트를 수집기에 연결합니다 (지연 시간과 오류 비율 설정 가능).
+기록에 없는 요청은 검색어별로 일정한 가짜 응답을 만들어 반환하므로 키워드 수를 늘려 측정할 수 있습니다.
+
+수집기 코드는 그대로 두고 HTTP 세션(네이버)과 API 클라이언트(YouTube)만 바꾸므로
+재시도, 쿼터, 페이지 수집, 지표 기록 경로가 실제와 같이 실행됩니다.
+
+사용 예:
+    store = FixtureStore(FIXTURES_DIR)
+    install_replay(collector, store, latency_ms=20, error_rate=0.01)
+"""
+import copy
+import hashlib
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import quote
+
+import httplib2
+import requests
+from googleapiclient.errors import HttpError
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+# 요청 키에서 제외할 파라미터 (실행 시각에 따라 바뀌는 값)
+VOLATILE_PARAMS = {'publishedAfter'}
+
+# 기록에 없는 요청에 대한 가짜 응답 크기
+SYNTHETIC_NEWS_TOTAL = 120  # 검색어당 전체 기사 수 (24시간에 걸쳐 고르게 분포)
+SYNTHETIC_NEWS_SHARED_EVERY = 5  # N번째 기사마다 모든 검색어에 공통으로 나오는 통신사 기사
+SYNTHETIC_VIDEO_INTERVAL_MINUTES = 45
+KST = timezone(timedelta(hours=9))
+
+class FixtureStore:
+    """
+    소스별 기록 응답 저장소 ({디렉터리}/{source}.json)
+    
+    각 파일은 기록 시각과 요청 키별 응답(JSON 본문)을 가지며,
+    재생할 때 게시 시각을 기록 시점과의 차이만큼 옮겨 24시간 필터를 통과하게 합니다.
+    """
+    
+    def __init__(self, directory=FIXTURES_DIR):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._data = {}
+    
+    def _load(self, source):
+        data = self._data.get(source)
+        if data is None:
+            try:
+                with open(self.directory / f"{source}.json", 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {'recorded_at': None, 'responses': {}}
+            self._data[source] = data
+        return data
+    
+    @staticmethod
+    def key(endpoint, params):
+        """요청 키 (엔드포인트 + 실행 시각과 무관한 파라미터)"""
+        stable = {name: value for name, value in params.items() if name not in VOLATILE_PARAMS}
+        return f"{endpoint} {json.dumps(stable, sort_keys=True, ensure_ascii=False)}"
+    
+    def get(self, source, key):
+        """
+        기록된 응답 조회
+        
+        Returns:
+            tuple: (기록 시각, 응답 본문) 또는 None
+        """
+        with self._lock:
+            data = self._load(source)
+            body = data['responses'].get(key)
+            return (data['recorded_at'], body) if body is not None else None
+    
+    def put(self, source, key, body):
+        with self._lock:
+            data = self._load(source)
+            data['recorded_at'] = time.time()
+            data['responses'][key] = body
+    
+    def count(self, source):
+        with self._lock:
+            return len(self._load(source)['responses'])
+    
+    def save(self):
+        """기록한 응답을 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for source, data in self._data.items():
+                fd, tmp_path = tempfile.mkstemp(dir=str(self.directory), prefix=f".{source}.", suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                        json.dump(data, f, ensure_ascii=False)
+                    os.replace(tmp_path, self.directory / f"{source}.json")
+                except Exception:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                    raise
+
+# ---------------------------------------------------------------------------
+# 기록
+# ---------------------------------------------------------------------------
+
+class RecordingSession:
+    """실제 requests 세션으로 요청하고 성공 응답을 기록하는 네이버용 세션"""
+    
+    def __init__(self, session, store):
+        self._session = session
+        self._store = store
+        self.headers = session.headers
+    
+    def get(self, url, params=None, **kwargs):
+        response = self._session.get(url, params=params, **kwargs)
+        if response.ok:
+            self._store.put('naver', FixtureStore.key('news', params or {}), response.json())
+        return response
+
+class _RecordingRequest:
+    def __init__(self, request, store, endpoint, params):
+        self._request = request
+        self._store = store
+        self._endpoint = endpoint
+        self._params = params
+    
+    def execute(self):
+        response = self._request.execute()
+        self._store.put('youtube', FixtureStore.key(self._endpoint, self._params), response)
+        return response
+
+class _RecordingResource:
+    def __init__(self, resource, store, name):
+        self._resource = resource
+        self._store = store
+        self._name = name
+    
+    def list(self, **params):
+        return _RecordingRequest(self._resource.list(**params), self._store, f"{self._name}.list", params)
+
+class RecordingYouTubeClient:
+    """실제 YouTube 클라이언트 호출 결과를 기록하는 래퍼 (search, videos만 사용)"""
+    
+    def __init__(self, client, store):
+        self._client = client
+        self._store = store
+    
+    def search(self):
+        return _RecordingResource(self._client.search(), self._store, 'search')
+    
+    def videos(self):
+        return _RecordingResource(self._client.videos(), self._store, 'videos')
+
+def install_recorders(collector, store):
+    """
+    DataCollector의 실제 API 호출을 기록하도록 설정
+    
+    Args:
+        collector: DataCollector 인스턴스 (API 키가 설정되어 있어야 함)
+        store: FixtureStore
+    """
+    news = collector.news_collector
+    news.session = RecordingSession(news.session, store)
+    youtube = collector.youtube_collector
+    get_client = youtube._get_client
+    youtube._get_client = lambda: RecordingYouTubeClient(get_client(), store)
+
+# ---------------------------------------------------------------------------
+# 재생
+# ---------------------------------------------------------------------------
+
+def _shift_iso(value, offset):
+    try:
+        shifted = datetime.fromisoformat(value.replace('Z', '+00:00')) + offset
+    except (AttributeError, ValueError):
+        return value
+    return shifted.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+def _shift_rfc822(value, offset):
+    try:
+        return format_datetime(parsedate_to_datetime(value) + offset)
+    except (TypeError, ValueError):
+        return value
+
+def _digest(text):
+    return hashlib.md5(text.encode('utf-8')).hexdigest()[:8]
+
+class ReplayTransport:
+    """
+    기록 응답(없으면 가짜 응답)을 지연 시간/오류 비율을 적용해 반환
+    
+    Args:
+        store: FixtureStore
+        latency_ms: 요청당 평균 지연 (±50% 균등 분포)
+        error_rate: 요청이 500 오류로 실패할 확률
+        seed: 지연/오류 난수 시드 (같은 값이면 같은 순서로 재현)
+    """
+    
+    def __init__(self, store, latency_ms=0, error_rate=0.0, seed=0):
+        self.store = store
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.replayed = 0
+    
+    def _roll(self):
+        """이번 요청의 지연 시간(초)과 실패 여부"""
+        with self._lock:
+            self.requests += 1
+            delay = self.latency_ms / 1000 * self._random.uniform(0.5, 1.5) if self.latency_ms else 0.0
+            failed = self._random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+            return delay, failed
+    
+    def respond(self, source, endpoint, params):
+        """
+        요청 하나에 대한 응답 본문 (실패로 정해지면 None)
+        """
+        delay, failed = self._roll()
+        if delay:
+            time.sleep(delay)
+        if failed:
+            return None
+        recorded = self.store.get(source, FixtureStore.key(endpoint, params))
+        if recorded is not None:
+            with self._lock:
+                self.replayed += 1
+            recorded_at, body = recorded
+            offset = timedelta(seconds=time.time() - (recorded_at or time.time()))
+            return self._shift(source, copy.deepcopy(body), offset)
+        if source == 'naver':
+            return self._synthetic_news(params)
+        if endpoint == 'search.list':
+            return self._synthetic_search(params)
+        return self._synthetic_videos(params)
+    
+    @staticmethod
+    def _shift(source, body, offset):
+        for item in body.get('items', []):
+            if source == 'naver':
+                item['pubDate'] = _shift_rfc822(item.get('pubDate', ''), offset)
+            else:
+                snippet = item.get('snippet')
+                if snippet and snippet.get('publishedAt'):
+                    snippet['publishedAt'] = _shift_iso(snippet['publishedAt'], offset)
+        return body
+    
+    @staticmethod
+    def _synthetic_news(params):
+        query = params.get('query', '')
+        start = int(params.get('start', 1))
+        display = int(params.get('display', 10))
+        now = datetime.now(KST)
+        step = timedelta(hours=24) / SYNTHETIC_NEWS_TOTAL
+        items = []
+        for i in range(start - 1, min(start - 1 + display, SYNTHETIC_NEWS_TOTAL)):
+            if i % SYNTHETIC_NEWS_SHARED_EVERY == 0:
+                title, link = f"연예 속보 {i}", f"https://news.example.com/wire/{i}"
+            else:
+                title, link = f"<b>{query}</b> 소식 {i}", f"https://news.example.com/{quote(query)}/{i}"
+            items.append({
+                'title': title,
+                'description': f"{query} 관련 기사 {i}",
+                'link': link,
+                'originallink': link,
+                'pubDate': format_datetime(now - step * (i + 0.5)),
+            })
+        return {'total': SYNTHETIC_NEWS_TOTAL, 'start': start, 'display': len(items), 'items': items}
+    
+    @staticmethod
+    def _synthetic_search(params):
+        query = params.get('q', '')
+        max_results = int(params.get('maxResults', 5))
+        published_after = params.get('publishedAfter')
+        after = None
+        if published_after:
+            try:
+                after = datetime.fromisoformat(published_after.replace('Z', '+00:00'))
+            except ValueError:
+                after = None
+        now = datetime.now(timezone.utc)
+        items = []
+        for i in range(max_results):
+            published = now - timedelta(minutes=SYNTHETIC_VIDEO_INTERVAL_MINUTES * i + 1)
+            if after is not None and after.tzinfo and published <= after:
+                break
+            items.append({
+                'id': {'videoId': f"v{_digest(query)}{i:03d}"},
+                'snippet': {
+                    'title': f"{query} 영상 {i}",
+                    'description': '',
+                    'thumbnails': {'medium': {'url': ''}},
+                    'channelTitle': f"채널 {i % 7}",
+                    'publishedAt': published.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                },
+            })
+        return {'items': items}
+    
+    @staticmethod
+    def _synthetic_videos(params):
+        items = []
+        for video_id in params.get('id', '').split(','):
+            if not video_id:
+                continue
+            seed = int(_digest(video_id), 16)
+            items.append({
+                'id': video_id,
+                'statistics': {
+                    'viewCount': str(seed % 1_000_000),
+                    'likeCount': str(seed % 50_000),
+                    'commentCount': str(seed % 3_000),
+                },
+                'contentDetails': {'duration': f"PT{seed % 20}M{seed % 60}S"},
+            })
+        return {'items': items}
+
+class ReplaySession:
+    """네이버 수집기용 requests 세션 대체 (requests.Response를 만들어 반환)"""
+    
+    def __init__(self, transport):
+        self._transport = transport
+        self.headers = {}
+    
+    def get(self, url, params=None, **kwargs):
+        body = self._transport.respond('naver', 'news', params or {})
+        response = requests.Response()
+        response.url = url
+        response.encoding = 'utf-8'
+        response.headers['Content-Type'] = 'application/json'
+        if body is None:
+            response.status_code, response.reason = 500, 'Internal Server Error'
+            response._content = b'{"errorMessage": "injected failure", "errorCode": "SE99"}'
+        else:
+            response.status_code, response.reason = 200, 'OK'
+            response._content = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        return response
+
+class _ReplayRequest:
+    def __init__(self, transport, endpoint, params):
+        self._transport = transport
+        self._endpoint = endpoint
+        self._params = params
+    
+    def execute(self):
+        body = self._transport.respond('youtube', self._endpoint, self._params)
+        if body is None:
+            raise HttpError(httplib2.Response({'status': 500}), b'{"error": "injected failure"}')
+        return body
+
+class _ReplayResource:
+    def __init__(self, transport, name):
+        self._transport = transport
+        self._name = name
+    
+    def list(self, **params):
+        return _ReplayRequest(self._transport, f"{self._name}.list", params)
+
+class ReplayYouTubeClient:
+    """YouTube API 클라이언트 대체 (search().list(), videos().list()만 지원)"""
+    
+    def __init__(self, transport):
+        self._transport = transport
+    
+    def search(self):
+        return _ReplayResource(self._transport, 'search')
+    
+    def videos(self):
+        return _ReplayResource(self._transport, 'videos')
+
+def install_replay(collector, store=None, latency_ms=0, error_rate=0.0, seed=0):
+    """
+    DataCollector가 실제 API 대신 기록/가짜 응답을 사용하도록 설정
+    
+    Args:
+        collector: DataCollector 인스턴스
+        store: FixtureStore (없으면 기본 디렉터리)
+        latency_ms: 요청당 평균 지연 (밀리초)
+        error_rate: 요청 실패 확률 (0~1)
+        seed: 난수 시드
+    
+    Returns:
+        ReplayTransport: 요청/오류/재생 횟수 확인용
+    """
+    transport = ReplayTransport(store or FixtureStore(), latency_ms, error_rate, seed)
+    news = collector.news_collector
+    news.client_id = news.client_id or 'replay'
+    news.client_secret = news.client_secret or 'replay'
+    news.session = ReplaySession(transport)
+    youtube = collector.youtube_collector
+    client = ReplayYouTubeClient(transport)
+    youtube.youtube = client
+    youtube._get_client = lambda: client
+    return transport
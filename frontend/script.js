@@ -5,6 +5,8 @@ let currentFilter = 'all';
 let autoRefreshInterval = null;
 let trackedKeywords = [];
 let currentPage = 'dashboard'; // 'dashboard' or 'keywords'
+let updateStream = null; // 수집 업데이트 SSE 연결
+let relativeTimeInterval = null; // 카드의 상대 시간 표시 갱신 타이머
 
 // DOM 요소
 const sidebar = document.getElementById('sidebar');
@@ -50,7 +52,14 @@ document.addEventListener('DOMContentLoaded', async () => {
         await loadAllContent(false);
     }
     
-    startAutoRefresh();
+    // 서버가 수집 결과를 푸시하면 주기적으로 새로고침할 필요가 없음 (SSE 미지원 브라우저만 폴링)
+    if (window.EventSource) {
+        startUpdateStream();
+    } else {
+        startAutoRefresh();
+    }
+    startRelativeTimeUpdates();
+    checkStatus();
     console.log('[INIT] 애플리케이션 초기화 완료');
 });
 
@@ -439,9 +448,9 @@ async function syncKeywordsToBackend() {
             const refreshData = await refreshResponse.json();
             console.log('[SYNC] 데이터 수집 응답:', refreshData);
             
-            // 수집이 완료될 때까지 잠시 대기 (백엔드에서 비동기로 처리되므로)
+            // 수집이 완료될 때까지 대기 (백엔드에서 비동기로 처리되므로)
             console.log('[SYNC] 데이터 수집 완료 대기 중...');
-            await new Promise(resolve => setTimeout(resolve, 2000)); // 2초 대기
+            await waitForCollection(refreshData.job_id, refreshData.update_seq);
         }
         
         console.log('[SYNC] 백엔드 동기화 완료');
@@ -451,6 +460,129 @@ async function syncKeywordsToBackend() {
     }
 }
 
+// 수집 완료 대기 (롱폴링으로 job_id의 collection_done 이벤트를 기다림)
+async function waitForCollection(jobId, sinceSeq, timeoutMs = 2 * 60 * 1000) {
+    const deadline = Date.now() + timeoutMs;
+    let since = sinceSeq || 0;
+    
+    while (Date.now() < deadline) {
+        const response = await fetch(`/api/updates?since=${since}&timeout=25`);
+        if (!response.ok) {
+            console.warn('[UPDATES] 수집 완료 대기 실패:', response.status);
+            return false;
+        }
+        
+        const data = await response.json();
+        for (const event of data.events) {
+            since = event.seq;
+            if (event.type === 'collection_done' && event.data.job_id === jobId) {
+                console.log('[UPDATES] 수집 완료:', event.data);
+                return true;
+            }
+        }
+    }
+    
+    console.warn('[UPDATES] 수집 완료 대기 시간 초과');
+    return false;
+}
+
+// 수집 업데이트 스트림 연결 (키워드별 변경분을 받아 화면에 반영)
+function startUpdateStream() {
+    updateStream = new EventSource('/api/stream');
+    
+    ['keyword', 'collection_done', 'resync'].forEach(type => {
+        updateStream.addEventListener(type, (e) => {
+            handleUpdateEvent(type, JSON.parse(e.data || 'null'));
+        });
+    });
+    
+    updateStream.onerror = () => {
+        if (updateStream.readyState === EventSource.CLOSED) {
+            // 서버의 동시 스트림 수 제한(503) 등으로 연결이 거부되면 롱폴링으로 전환
+            console.warn('[STREAM] 업데이트 스트림 연결 거부, 롱폴링으로 전환');
+            updateStream = null;
+            pollUpdates();
+            return;
+        }
+        // EventSource가 Last-Event-ID와 함께 자동으로 재연결
+        console.warn('[STREAM] 업데이트 스트림 연결 끊김, 재연결 대기 중');
+    };
+}
+
+// 롱폴링으로 수집 업데이트 수신 (SSE 연결을 쓸 수 없을 때, 같은 이벤트를 같은 방식으로 처리)
+async function pollUpdates() {
+    let since = null;
+    
+    while (true) {
+        try {
+            const query = since === null ? 'timeout=25' : `since=${since}&timeout=25`;
+            const response = await fetch(`/api/updates?${query}`);
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+            const data = await response.json();
+            data.events.forEach(event => handleUpdateEvent(event.type, event.data));
+            since = data.events.length > 0 ? data.events[data.events.length - 1].seq : data.latest_seq;
+        } catch (error) {
+            console.warn('[UPDATES] 업데이트 조회 실패, 잠시 후 재시도:', error);
+            await new Promise(resolve => setTimeout(resolve, 5000));
+        }
+    }
+}
+
+// 수집 업데이트 이벤트 처리 (SSE와 롱폴링 공통)
+function handleUpdateEvent(type, data) {
+    if (type === 'keyword') {
+        applyKeywordUpdate(data);
+    } else if (type === 'collection_done') {
+        console.log('[STREAM] 수집 완료:', data);
+        if (data.removed_keywords && data.removed_keywords.length > 0) {
+            data.removed_keywords.forEach(key => delete allData[key]);
+            refreshArtistSelect();
+        }
+        checkStatus();
+    } else if (type === 'resync') {
+        // 놓친 변경분이 있으면 전체 데이터를 다시 받음
+        console.log('[STREAM] 전체 데이터 다시 로드');
+        loadAllContent(false);
+    }
+}
+
+// 키워드 변경분을 allData에 병합
+function applyKeywordUpdate(update) {
+    const { key, added, updated = [], removed, ...summary } = update;
+    const existing = allData[key];
+    
+    // 추가/변경된 항목은 기존 목록에서 빼고 다시 넣어 중복 없이 갱신
+    const replacedIds = new Set(removed);
+    added.forEach(content => replacedIds.add(content.content_id));
+    updated.forEach(content => replacedIds.add(content.content_id));
+    const kept = existing && existing.contents
+        ? existing.contents.filter(content => !replacedIds.has(content.content_id))
+        : [];
+    const merged = added.concat(updated, kept);
+    merged.sort((a, b) => publishedTimestamp(b) - publishedTimestamp(a));
+    
+    allData[key] = { ...existing, ...summary, contents: merged };
+    console.log('[STREAM] 키워드 업데이트:', key, `+${added.length} ~${updated.length} -${removed.length}`);
+    
+    if (!existing) {
+        refreshArtistSelect();
+    }
+    if (key === currentKeyword) {
+        displayContent(allData[key]);
+    }
+}
+
+// 선택 상태를 유지하면서 아티스트 선택 옵션 갱신
+function refreshArtistSelect() {
+    const selected = artistSelect.value;
+    updateArtistSelect(Object.keys(allData));
+    if (selected === 'all' || allData[selected]) {
+        artistSelect.value = selected;
+    }
+}
+
 // 새로고침 처리
 function handleRefresh() {
     if (currentKeyword) {
@@ -493,7 +625,7 @@ async function loadAllContent(forceRefresh = false) {
             
             // 수집 완료 대기
             console.log('[LOAD] 데이터 수집 완료 대기 중...');
-            await new Promise(resolve => setTimeout(resolve, 3000)); // 3초 대기
+            await waitForCollection(refreshData.job_id, refreshData.update_seq);
             
             // 수집된 데이터 가져오기
             console.log('[LOAD] 수집된 데이터 가져오기: /api/content 호출');
@@ -561,7 +693,7 @@ async function loadContent(keyword, forceRefresh = false) {
             
             // 수집 완료 대기
             console.log('[LOAD] 데이터 수집 완료 대기 중...');
-            await new Promise(resolve => setTimeout(resolve, 3000)); // 3초 대기
+            await waitForCollection(refreshData.job_id, refreshData.update_seq);
         }
         
         const url = `/api/content?keyword=${encodeURIComponent(keyword)}`;
@@ -622,7 +754,8 @@ function updateArtistSelect(keywords) {
         artistSelect.appendChild(option);
     });
     
-    artistSelect.addEventListener('change', (e) => {
+    // 옵션을 다시 만들 때마다 호출되므로 핸들러를 누적하지 않고 교체
+    artistSelect.onchange = (e) => {
         const selected = e.target.value;
         if (selected === 'all') {
             // 모든 키워드 표시
@@ -635,7 +768,7 @@ function updateArtistSelect(keywords) {
                 loadContent(selected);
             }
         }
-    });
+    };
 }
 
 // 모든 콘텐츠 표시
@@ -674,8 +807,9 @@ function displayContent(data) {
     // 콘텐츠 카드 생성
     console.log('[DISPLAY] 카드 생성 시작, 콘텐츠 수:', data.contents.length);
     contents.innerHTML = '';
+    const now = Date.now() / 1000;
     data.contents.forEach((content, index) => {
-        const card = createContentCard(content, index);
+        const card = createContentCard(content, index, now);
         contents.appendChild(card);
     });
     
@@ -768,7 +902,7 @@ function filterContent() {
 }
 
 // 콘텐츠 카드 생성
-function createContentCard(content, index) {
+function createContentCard(content, index, now = Date.now() / 1000) {
     const card = document.createElement('div');
     card.className = 'content-card';
     card.dataset.type = content.type;
@@ -785,6 +919,8 @@ function createContentCard(content, index) {
     const badgeClass = content.type === 'video' ? 'video' : 'news';
     const badgeText = content.type === 'video' ? 'Video' : 'Article';
     const source = content.channel || content.source || 'Unknown';
+    const videoStats = formatVideoStats(content);
+    const publishedTs = publishedTimestamp(content);
     
     card.innerHTML = `
         <div class="relative">
@@ -805,7 +941,7 @@ function createContentCard(content, index) {
                 </svg>
                 ${escapeHtml(source)}
             </div>
-            <div class="card-time">${content.published_at_formatted || ''}</div>
+            <div class="card-time"><span class="card-relative-time" data-published-ts="${publishedTs}">${formatRelativeTime(publishedTs, now)}</span>${publishedTs && videoStats ? ' · ' : ''}${videoStats}</div>
             <a href="${content.url}" target="_blank" rel="noopener noreferrer" class="card-link" onclick="event.stopPropagation()">
                 Read Source
                 <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
@@ -868,6 +1004,62 @@ function escapeHtml(text) {
     return div.innerHTML;
 }
 
+// 게시 시각 (epoch 초, published_ts가 없는 이전 응답은 published_at을 파싱)
+function publishedTimestamp(content) {
+    if (content.published_ts != null) {
+        return content.published_ts;
+    }
+    const parsed = Date.parse(content.published_at || '');
+    return Number.isNaN(parsed) ? 0 : parsed / 1000;
+}
+
+// 게시 시각을 상대 시간으로 표시 (예: "3시간 전"), 서버는 시각만 보내고 표시는 볼 때마다 계산
+function formatRelativeTime(timestamp, now) {
+    if (!timestamp) {
+        return '';
+    }
+    const seconds = Math.max(0, now - timestamp);
+    if (seconds >= 86400) {
+        return `${Math.floor(seconds / 86400)}일 전`;
+    }
+    if (seconds >= 3600) {
+        return `${Math.floor(seconds / 3600)}시간 전`;
+    }
+    if (seconds >= 60) {
+        return `${Math.floor(seconds / 60)}분 전`;
+    }
+    return '방금 전';
+}
+
+// 표시 중인 모든 카드의 상대 시간을 같은 기준 시각으로 다시 계산
+function refreshRelativeTimes() {
+    const now = Date.now() / 1000;
+    contents.querySelectorAll('.card-relative-time').forEach(element => {
+        element.textContent = formatRelativeTime(Number(element.dataset.publishedTs), now);
+    });
+}
+
+// 새 데이터를 받지 않아도 "N분 전" 표시가 실제 시각을 따라가도록 1분마다 갱신
+function startRelativeTimeUpdates() {
+    relativeTimeInterval = setInterval(refreshRelativeTimes, 60 * 1000);
+}
+
+// 영상 통계 표시 (예: "1.2K views · 3:20")
+function formatVideoStats(content) {
+    const parts = [];
+    if (content.view_count != null) {
+        const views = new Intl.NumberFormat('en', { notation: 'compact', maximumFractionDigits: 1 }).format(content.view_count);
+        parts.push(`${views} views`);
+    }
+    if (content.duration_seconds != null) {
+        const hours = Math.floor(content.duration_seconds / 3600);
+        const minutes = Math.floor(content.duration_seconds % 3600 / 60);
+        const seconds = String(content.duration_seconds % 60).padStart(2, '0');
+        parts.push(hours ? `${hours}:${String(minutes).padStart(2, '0')}:${seconds}` : `${minutes}:${seconds}`);
+    }
+    return parts.join(' · ');
+}
+
 // UI 상태 관리
 function showLoading() {
     loading.classList.remove('hidden');
@@ -925,8 +1117,5 @@ async function checkStatus() {
     }
 }
 
-// 주기적으로 상태 확인
-setInterval(checkStatus, 5 * 60 * 1000); // 5분마다
-
 // 전역 함수 (HTML에서 호출)
 window.handleDeleteKeyword = handleDeleteKeyword;
@@ -0,0 +1,42 @@
+"""
+콘텐츠 키워드 태깅 회귀 테스트
+한글 별칭이 일반 단어 안에서 일치하여 다른 키워드 피드에 섞이지 않는지 확인합니다.
+
+실행: python -m pytest tests
+"""
+import pytest
+
+from backend.config import Config
+from backend.keyword_mapper import AliasIndex, load_aliases
+from backend.tagger import ContentTagger
+
+@pytest.fixture(scope='module')
+def tagger():
+    index = AliasIndex(load_aliases(Config.KEYWORD_ALIASES_PATH))
+    keywords = [(entry.en, entry.en, entry.ko) for entry in index.entries]
+    return ContentTagger(keywords, alias_index=index)
+
+@pytest.mark.parametrize('text', [
+    '정부는 물가지수가 있지만 오를 것이라고 밝혔다',
+    '트와이스라이트 조명 판매',
+    '로제 파스타 맛집',
+    'LIVE 공연 일정',
+])
+def test_ordinary_words_are_not_tagged(tagger, text):
+    assert tagger.match(text) == set()
+
+@pytest.mark.parametrize('text, expected', [
+    ('트와이스가 컴백했다', {'TWICE'}),
+    ('트와이스에서도 ITZY와 함께', {'TWICE', 'ITZY'}),
+    ('방탄소년단의 신곡', {'BTS'}),
+    ('블랙핑크 지수, 솔로 컴백', {'BLACKPINK'}),
+    ('BLACKPINK Jisoo solo', {'BLACKPINK', 'Jisoo'}),
+])
+def test_artist_names_are_tagged(tagger, text, expected):
+    assert tagger.match(text) == expected
+
+def test_tag_keeps_own_keyword_for_ambiguous_name(tagger):
+    contents = [{'content_id': 'a', 'title': '지수 근황', 'description': ''}]
+    reverse = tagger.tag(contents, own_key='Jisoo')
+    assert contents[0]['keywords'] == ['Jisoo']
+    assert reverse == {'Jisoo': ['a']}